@@ -1,6 +1,4 @@
 import networkx as nx
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import random
 
 
@@ -8,7 +6,7 @@ class BellmanFordVisualizer:
     def __init__(self):
         self.G = nx.DiGraph()
         self.pos = None
-        self.fig, self.ax = plt.subplots(figsize=(12, 8))
+        self.fig = self.ax = None  # created by animate()
         self.states = []
         self.negative_cycle_edges = []
 
@@ -79,6 +77,11 @@ class BellmanFordVisualizer:
         return dist, pred
 
     def animate(self, interval=800):
+        import matplotlib.pyplot as plt
+        import matplotlib.animation as animation
+
+        self.fig, self.ax = plt.subplots(figsize=(12, 8))
+
         def update(frame):
             self.fig.clear()
             state = self.states[frame]
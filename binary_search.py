@@ -1,163 +1,179 @@
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import numpy as np
 import time
+from sort_io import read_numbers
+from search_batch import (DEFAULT_QUERIES, DEFAULT_HIT_FRACTION, SORTED_DISTRIBUTIONS, generate_targets, run_batch,
+                          is_sorted_unique, print_batch_report, sorted_unique_numbers, write_sorted_unique)
+from search_engines import (ENGINES, SEARCH_STEPS, engine_table_header, format_engine_table, plot_probe_counts,
+                            run_engines, run_search_benchmark)
 
 class BinarySearchVisualizer:
     def __init__(self):
-        self.fig, self.ax = plt.subplots(figsize=(12, 6))
+        self.fig = self.ax = None  # created by animate()
+        self.array = None
+        self.target = None
+        self.engine = 'binary'
         self.states = []
 
     def binary_search_with_states(self, arr, target):
         """Perform binary search and record states for visualization."""
-        self.states = []
-        left, right = 0, len(arr) - 1
-        
-        # Record initial state
-        self.states.append({
-            'array': arr.copy(),
-            'left': left,
-            'right': right,
-            'mid': None,
-            'target': target,
-            'status': 'Initial array',
-            'found': False
-        })
-        
-        while left <= right:
-            mid = (left + right) // 2
-            
-            # Record comparison state
-            self.states.append({
-                'array': arr.copy(),
-                'left': left,
-                'right': right,
-                'mid': mid,
-                'target': target,
-                'status': f'Comparing {arr[mid]} with target {target}',
-                'found': False
-            })
-            
-            if arr[mid] == target:
-                # Record found state
-                self.states.append({
-                    'array': arr.copy(),
-                    'left': left,
-                    'right': right,
-                    'mid': mid,
-                    'target': target,
-                    'status': f'Found target {target} at index {mid}!',
-                    'found': True
-                })
-                return mid
-            
-            elif arr[mid] < target:
-                left = mid + 1
-                status = f'{arr[mid]} < {target}, searching right half'
-            else:
-                right = mid - 1
-                status = f'{arr[mid]} > {target}, searching left half'
-            
-            # Record state after updating search space
-            self.states.append({
-                'array': arr.copy(),
-                'left': left,
-                'right': right,
-                'mid': mid,
-                'target': target,
-                'status': status,
-                'found': False
-            })
-        
-        # Record not found state
-        self.states.append({
-            'array': arr.copy(),
-            'left': None,
-            'right': None,
-            'mid': None,
-            'target': target,
-            'status': f'Target {target} not found in array',
-            'found': False
-        })
-        return -1
+        return self.search_with_states(arr, target, 'binary')
+
+    def search_with_states(self, arr, target, engine='binary'):
+        """Run one of search_engines.ENGINES on arr and record its states; returns the index found or -1.
+
+        Every state refers to the one shared array, which may be an np.memmap,
+        and keeps only its status and the left/right/mid indices, so recording
+        a search costs O(log n) memory however large the array is.
+        """
+        self.array = arr = np.asarray(arr)
+        self.target = target
+        self.engine = engine
+        self.states = list(SEARCH_STEPS[engine](arr, target))
+        status, _, _, mid = self.states[-1]
+        return mid if status == 'found' else -1
+
+    def status_text(self, state):
+        """Describe a recorded state, reading the probed value from the shared array."""
+        status, _, _, mid = state
+        target = self.target
+        value = self.array[mid].item() if mid >= 0 else None
+        if status == 'start':
+            return 'Initial array'
+        if status == 'compare':
+            return f'Comparing {value} with target {target}'
+        if status == 'found':
+            return f'Found target {target} at index {mid}!'
+        if status == 'go_right':
+            return f'{value} < {target}, searching right half'
+        if status == 'go_left':
+            return f"{value} {'>' if value > target else '='} {target}, searching left half"
+        return f'Target {target} not found in array'
 
     def animate(self, interval=1000):
-        """Create animation of the binary search process."""
+        """Create animation of the recorded search."""
+        import matplotlib.pyplot as plt
+        import matplotlib.animation as animation
+
+        from search_render import SearchRenderer
+
+        self.fig, self.ax = plt.subplots(figsize=(12, 6))
+        self.ax.set_title(f'{self.engine.capitalize()} Search Visualization (n={len(self.array)})')
+        self.ax.set_xlabel('Index')
+        self.ax.set_ylabel('Value')
+        renderer = SearchRenderer(self.ax, self.array)
+
         def update(frame):
-            self.ax.clear()
             state = self.states[frame]
-            arr = state['array']
-            n = len(arr)
-            
-            # Create bar colors (default to light blue)
-            colors = ['lightblue'] * n
-            
-            # Color the current search space in light gray
-            if state['left'] is not None and state['right'] is not None:
-                for i in range(state['left'], state['right'] + 1):
-                    colors[i] = 'lightgray'
-            
-            # Color the middle element in red
-            if state['mid'] is not None:
-                colors[state['mid']] = 'red'
-            
-            # If target is found, color it green
-            if state['found'] and state['mid'] is not None:
-                colors[state['mid']] = 'lightgreen'
-            
-            # Create bars
-            bars = self.ax.bar(range(n), arr, color=colors)
-            
-            # Add value labels on top of each bar
-            for i, v in enumerate(arr):
-                self.ax.text(i, v, str(v), ha='center', va='bottom')
-            
-            # Customize the plot
-            self.ax.set_title(f'Binary Search Visualization\nStep {frame + 1}/{len(self.states)}\n{state["status"]}')
-            self.ax.set_xlabel('Index')
-            self.ax.set_ylabel('Value')
-            
-            # Add a legend
-            from matplotlib.patches import Patch
-            legend_elements = [
-                Patch(facecolor='lightblue', label='Unexamined'),
-                Patch(facecolor='lightgray', label='Current Search Space'),
-                Patch(facecolor='red', label='Middle Element'),
-                Patch(facecolor='lightgreen', label='Target Found')
-            ]
-            self.ax.legend(handles=legend_elements, loc='upper right')
-            
-            # Ensure the y-axis starts from 0
-            self.ax.set_ylim(0, max(arr) * 1.2)
-
-        anim = animation.FuncAnimation(self.fig, update, frames=len(self.states),
-                                     interval=interval, repeat=False)
+            text = f'Step {frame + 1}/{len(self.states)}\n{self.status_text(state)}'
+            return renderer.update(*state, text)
+
+        self.anim = animation.FuncAnimation(self.fig, update, frames=len(self.states), init_func=renderer.init,
+                                            interval=interval, repeat=False, blit=True)
         plt.show()
 
-def generate_sorted_array(n=20, min_val=1, max_val=100):
-    """Generate a sorted array of n unique random numbers."""
-    arr = np.random.choice(range(min_val, max_val + 1), size=n, replace=False)
-    return np.sort(arr)
+def generate_sorted_array(n=20, min_val=1, max_val=100, distribution='uniform', seed=None):
+    """Generate a sorted array of n unique random numbers in O(n), however wide the range."""
+    return sorted_unique_numbers(n, min_val, max_val, distribution, seed)
 
-def get_user_input():
-    print("\nBinary Search Visualizer")
-    print("=======================")
+def get_array_input():
+    # A sorted .npy or raw .bin file is memory-mapped, not loaded
+    path = input("\nSorted array file (.npy, .bin or text; blank to generate one): ").strip()
+    arr = None
+    if path:
+        try:
+            arr = read_numbers(path)
+            if is_sorted_unique(arr):
+                print(f"\nLoaded {len(arr)} sorted numbers from {path}:", arr)
+            else:
+                print(f"{path} is not sorted in increasing order without duplicates; generate an array instead.")
+                arr = None
+        except (OSError, ValueError) as e:
+            print(f"Error reading file: {e}")
     
     # Get array size
-    while True:
+    while arr is None or len(arr) == 0:
         try:
             n = int(input("\nEnter array size (default 20): ") or "20")
             min_val = int(input("Enter minimum value (default 1): ") or "1")
             max_val = int(input("Enter maximum value (default 100): ") or "100")
-            if n > 0 and min_val < max_val:
-                break
-            print("Invalid values! Array size must be positive and min_val must be less than max_val.")
+            distribution = (input(f"Key distribution [{'/'.join(SORTED_DISTRIBUTIONS)}] [uniform]: ")
+                            or "uniform").strip().lower()
+            seed = input("Random seed (blank for none): ").strip()
+            seed = int(seed) if seed else None
+            if n <= 0 or min_val >= max_val or n > max_val - min_val + 1:
+                print("Invalid values! Array size must be positive, min_val must be less than max_val "
+                      "and the range must hold n distinct values.")
+            elif distribution not in SORTED_DISTRIBUTIONS:
+                print(f"Invalid distribution! Choose one of {', '.join(SORTED_DISTRIBUTIONS)}.")
+            else:
+                save = input("Save to file (.npy, .bin or text; blank to keep in memory): ").strip()
+                if save:
+                    # Streamed in chunks, then memory-mapped back, so n can exceed memory
+                    write_sorted_unique(save, n, min_val, max_val, distribution, seed)
+                    arr = read_numbers(save)
+                    print(f"\nWrote {n} sorted numbers to {save}:", arr)
+                else:
+                    # Generate sorted array
+                    arr = generate_sorted_array(n, min_val, max_val, distribution, seed)
+                    print("\nGenerated sorted array:", arr)
         except ValueError:
             print("Please enter valid numbers!")
+    return arr
+
+def get_batch_input(arr):
+    path = input("\nTargets file (.npy, .bin or text; blank to generate them): ").strip()
+    if path:
+        try:
+            targets = read_numbers(path)
+            print(f"Read {len(targets)} targets from {path}")
+            return targets
+        except (OSError, ValueError) as e:
+            print(f"Error reading file: {e}")
+    while True:
+        try:
+            count = int(input(f"\nNumber of queries (default {DEFAULT_QUERIES}): ") or str(DEFAULT_QUERIES))
+            hit_fraction = float(input(f"Fraction taken from the array (default {DEFAULT_HIT_FRACTION}): ")
+                                 or str(DEFAULT_HIT_FRACTION))
+            seed = input("Random seed (blank for none): ").strip()
+            if count > 0 and 0 <= hit_fraction <= 1:
+                return generate_targets(arr, count, hit_fraction, int(seed) if seed else None)
+            print("Invalid values! Queries must be positive and the fraction between 0 and 1.")
+        except ValueError:
+            print("Please enter valid numbers!")
+
+def get_benchmark_input():
+    while True:
+        try:
+            sizes = [int(v) for v in (input("\nArray sizes (default 100000 1000000 10000000): ")
+                                      or "100000 1000000 10000000").split()]
+            queries = int(input("Queries per array (default 100000): ") or "100000")
+            if sizes and min(sizes) > 0 and queries > 0:
+                return sizes, queries
+            print("Invalid values! Sizes and queries must be positive.")
+        except ValueError:
+            print("Please enter valid numbers!")
+
+def get_engine_input():
+    engine = (input(f"\nSearch engine [{'/'.join(ENGINES)}] [binary]: ") or "binary").strip().lower()
+    while engine not in ENGINES:
+        engine = (input(f"Please choose one of {', '.join(ENGINES)}: ") or "binary").strip().lower()
+    return engine
+
+def get_user_input():
+    print("\nBinary Search Visualizer")
+    print("=======================")
     
-    # Generate sorted array
-    arr = generate_sorted_array(n, min_val, max_val)
-    print("\nGenerated sorted array:", arr)
+    mode = (input("\nMode [S=single animated search, B=batch of queries, E=engine benchmark] [S]: ")
+            or "S").strip().lower()
+    if mode.startswith('e'):
+        sizes, queries = get_benchmark_input()
+        return {'mode': 'benchmark', 'sizes': sizes, 'queries': queries}
+    arr = get_array_input()
+    if mode.startswith('b'):
+        targets = get_batch_input(arr)
+        plot = (input("\nPlot probe counts per engine? [y/N]: ") or "n").strip().lower().startswith('y')
+        return {'mode': 'batch', 'arr': arr, 'targets': targets, 'plot': plot}
+    engine = get_engine_input()
     
     # Get target value
     while True:
@@ -177,24 +193,37 @@ def get_user_input():
         except ValueError:
             print("Please enter a valid number!")
     
-    return arr, target, interval
+    return {'mode': 'single', 'arr': arr, 'engine': engine, 'target': target, 'interval': interval}
 
 def main():
     # Get user input
-    arr, target, interval = get_user_input()
+    params = get_user_input()
+    if params['mode'] == 'benchmark':
+        run_search_benchmark(params['sizes'], queries=params['queries'])
+        return
+    arr = params['arr']
+    if params['mode'] == 'batch':
+        print_batch_report(run_batch(arr, params['targets']))
+        results = run_engines(arr, params['targets'])
+        print("\n" + engine_table_header())
+        print(format_engine_table(results))
+        if params['plot']:
+            plot_probe_counts(results)
+        return
+    target, engine = params['target'], params['engine']
     
-    # Create visualizer and run binary search
+    # Create visualizer and run the search
     visualizer = BinarySearchVisualizer()
-    result = visualizer.binary_search_with_states(arr, target)
+    result = visualizer.search_with_states(arr, target, engine)
     
     # Display the animation
-    print(f"\nStarting binary search for {target}...")
+    print(f"\nStarting {engine} search for {target}...")
     if result != -1:
         print(f"Target {target} found at index {result}")
     else:
         print(f"Target {target} not found in array")
     
-    visualizer.animate(interval)
+    visualizer.animate(params['interval'])
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,6 +1,4 @@
 import networkx as nx
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import random
 import numpy as np
 from queue import PriorityQueue
@@ -10,7 +8,7 @@ class DijkstraVisualizer:
     def __init__(self):
         self.G = nx.Graph()
         self.pos = None
-        self.fig, self.ax = plt.subplots(figsize=(12, 8))
+        self.fig = self.ax = None  # created by animate()
         self.states = []
         
     def generate_weighted_graph(self, n_nodes=8, n_edges=12, min_weight=1, max_weight=10):
@@ -140,6 +138,11 @@ class DijkstraVisualizer:
 
     def animate(self, interval=1000):
         """Create animation of Dijkstra's algorithm."""
+        import matplotlib.pyplot as plt
+        import matplotlib.animation as animation
+
+        self.fig, self.ax = plt.subplots(figsize=(12, 8))
+
         def update(frame):
             self.ax.clear()
             state = self.states[frame]
@@ -1,13 +1,6 @@
 import networkx as nx
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import random
 from queue import PriorityQueue
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import tkinter as tk
-from tkinter import ttk
-import matplotlib
-matplotlib.use('TkAgg')
 
 class DijkstraVisualizer:
     def __init__(self):
@@ -24,6 +17,13 @@ class DijkstraVisualizer:
 
     def initialize_gui(self):
         """Initialize the GUI components after getting user input."""
+        import tkinter as tk
+        from tkinter import ttk
+        import matplotlib
+        matplotlib.use('TkAgg')
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         # Create the main window
         self.root = tk.Tk()
         self.root.title("Dijkstra's Algorithm Visualization")
@@ -200,6 +200,8 @@ class DijkstraVisualizer:
 
     def update_text(self, state):
         """Update the text widget with current state information."""
+        import tkinter as tk
+
         self.text_widget.delete(1.0, tk.END)
         
         # Add algorithm status
@@ -274,6 +276,8 @@ class DijkstraVisualizer:
 
     def animate(self, interval=1000):
         """Create animation of Dijkstra's algorithm."""
+        import matplotlib.animation as animation
+
         # Initialize GUI if not already initialized
         if self.root is None:
             self.initialize_gui()
@@ -1,13 +1,10 @@
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from matplotlib.patches import Rectangle
 import numpy as np
 import random
 
 
 class FloydWarshallVisualizer:
     def __init__(self):
-        self.fig, self.ax = plt.subplots(figsize=(10, 8))
+        self.fig = self.ax = None  # created by animate()
         self.states = []
         self.n = 0
 
@@ -46,6 +43,12 @@ class FloydWarshallVisualizer:
         return D
 
     def animate(self, interval=500):
+        import matplotlib.pyplot as plt
+        import matplotlib.animation as animation
+        from matplotlib.patches import Rectangle
+
+        self.fig, self.ax = plt.subplots(figsize=(10, 8))
+
         def update(frame):
             self.fig.clear()
             state = self.states[frame]
@@ -1,6 +1,4 @@
 import networkx as nx
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import random
 import time
 from collections import deque
@@ -9,7 +7,7 @@ class GraphVisualizer:
     def __init__(self):
         self.G = nx.Graph()
         self.pos = None
-        self.fig, self.ax = plt.subplots(figsize=(12, 8))
+        self.fig = self.ax = None  # created by animate()
         self.states = []
         
     def generate_random_graph(self, n_nodes=10, n_edges=15):
@@ -127,6 +125,11 @@ class GraphVisualizer:
 
     def animate(self, algorithm='bfs', start_node=0, interval=1000):
         """Create animation of the graph traversal."""
+        import matplotlib.pyplot as plt
+        import matplotlib.animation as animation
+
+        self.fig, self.ax = plt.subplots(figsize=(12, 8))
+
         if algorithm.lower() == 'bfs':
             states = self.bfs_with_states(start_node)
             title = 'Breadth-First Search Visualization'
@@ -1,20 +1,23 @@
 import networkx as nx
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import random
 from collections import deque
-import tkinter as tk
-from tkinter import ttk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib
-matplotlib.use('TkAgg')
 
 class GraphTraversalVisualizer:
     def __init__(self):
         self.G = nx.Graph()
         self.pos = None
         self.states = []
-        
+        self.root = None
+
+    def initialize_gui(self):
+        """Initialize the GUI components when the animation starts."""
+        import tkinter as tk
+        from tkinter import ttk
+        import matplotlib
+        matplotlib.use('TkAgg')
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         # Create main window
         self.root = tk.Tk()
         self.root.title("Graph Traversal Visualization")
@@ -311,6 +314,10 @@ class GraphTraversalVisualizer:
 
     def animate(self, algorithm='bfs', start_node=0, interval=1000):
         """Create animation of the graph traversal."""
+        import tkinter as tk
+        import matplotlib.pyplot as plt
+        import matplotlib.animation as animation
+
         if algorithm.lower() == 'bfs':
             states = self.bfs_with_states(start_node)
             title = 'Breadth-First Search (BFS)'
@@ -320,6 +327,10 @@ class GraphTraversalVisualizer:
             title = 'Depth-First Search (DFS)'
             data_structure = 'Stack'
             
+        # Initialize GUI if not already initialized
+        if self.root is None:
+            self.initialize_gui()
+
         # Set window title
         self.root.title(f"Graph Traversal Visualization - {title}")
         
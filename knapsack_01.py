@@ -1,13 +1,10 @@
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from matplotlib.patches import Rectangle
 import random
 import numpy as np
 
 
 class KnapsackVisualizer:
     def __init__(self):
-        self.fig, self.ax = plt.subplots(figsize=(12, 8))
+        self.fig = self.ax = None  # created by animate()
         self.states = []
         self.items = []
         self.capacity = 0
@@ -46,6 +43,12 @@ class KnapsackVisualizer:
         return dp, sel
 
     def animate(self, interval=200):
+        import matplotlib.pyplot as plt
+        import matplotlib.animation as animation
+        from matplotlib.patches import Rectangle
+
+        self.fig, self.ax = plt.subplots(figsize=(12, 8))
+
         def update(frame):
             self.fig.clear()
             state = self.states[frame]
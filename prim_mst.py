@@ -1,6 +1,4 @@
 import networkx as nx
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import random
 from queue import PriorityQueue
 
@@ -9,7 +7,7 @@ class PrimVisualizer:
     def __init__(self):
         self.G = nx.Graph()
         self.pos = None
-        self.fig, self.ax = plt.subplots(figsize=(12, 8))
+        self.fig = self.ax = None  # created by animate()
         self.states = []
 
     def generate_weighted_graph(self, n_nodes=8, n_edges=12, min_weight=1, max_weight=10):
@@ -68,6 +66,11 @@ class PrimVisualizer:
         return mst
 
     def animate(self, interval=800):
+        import matplotlib.pyplot as plt
+        import matplotlib.animation as animation
+
+        self.fig, self.ax = plt.subplots(figsize=(12, 8))
+
         def update(frame):
             self.fig.clear()
             state = self.states[frame]
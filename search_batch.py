@@ -0,0 +1,175 @@
+import time
+import numpy as np
+from sort_io import NumberWriter
+
+DEFAULT_QUERIES = 100000
+DEFAULT_HIT_FRACTION = 0.5
+HISTOGRAM_WIDTH = 40
+SORTED_DISTRIBUTIONS = ['uniform', 'exponential', 'power']
+SKEW = 8.0  # how strongly the skewed distributions crowd keys towards the low end
+GENERATE_CHUNK = 1 << 20
+
+
+def _skew(distribution, u):
+    # Quantile function mapping uniform [0, 1) onto [0, 1) monotonically, so order is kept.
+    if distribution == 'uniform':
+        return u
+    if distribution == 'exponential':
+        return -np.log1p(u * np.expm1(-SKEW)) / SKEW
+    if distribution == 'power':
+        return u ** (SKEW / 2)
+    raise ValueError(f"unknown key distribution {distribution!r}")
+
+
+def sorted_unique_chunks(n, min_val, max_val, distribution='uniform', seed=None, chunk=GENERATE_CHUNK):
+    """Yield n sorted, distinct integers from [min_val, max_val] in consecutive arrays of about `chunk`.
+
+    Runs in O(n) time and O(chunk) memory however wide the range is. Key i
+    is min_val + p[i] + i for a non-decreasing p in [0, slack], where slack
+    is the number of values left out, so keys are distinct by construction.
+    p is made of sorted uniform draws: n is split over cells with one
+    multinomial draw, and each cell's draws come out sorted from cumulative
+    exponential gaps. The distribution's quantile function then bends them
+    to crowd keys towards min_val.
+    """
+    size = max_val - min_val + 1
+    if n > size:
+        raise ValueError(f"cannot draw {n} distinct values from a range of {max(size, 0)}")
+    _skew(distribution, 0.0)
+    rng = np.random.default_rng(seed)
+    slack = size - n
+    cells = max(1, -(-n // chunk))
+    done = 0
+    for cell, count in enumerate(rng.multinomial(n, [1 / cells] * cells).tolist()):
+        gaps = rng.exponential(size=count + 1)
+        u = (cell + np.cumsum(gaps[:-1]) / gaps.sum()) / cells
+        p = np.floor(_skew(distribution, u) * (slack + 1)).astype(np.int64)
+        yield min_val + p + np.arange(done, done + count, dtype=np.int64)
+        done += count
+
+
+def sorted_unique_numbers(n, min_val, max_val, distribution='uniform', seed=None):
+    """n sorted, distinct integers from [min_val, max_val] in one array; see sorted_unique_chunks."""
+    return np.concatenate([np.zeros(0, dtype=np.int64),
+                           *sorted_unique_chunks(n, min_val, max_val, distribution, seed)])
+
+
+def write_sorted_unique(path, n, min_val, max_val, distribution='uniform', seed=None, chunk=GENERATE_CHUNK):
+    """Stream sorted_unique_chunks to a .npy, raw or text file, holding only one chunk in memory."""
+    with NumberWriter(path, np.int64, n) as writer:
+        for values in sorted_unique_chunks(n, min_val, max_val, distribution, seed, chunk):
+            writer.write(values)
+
+
+def is_sorted_unique(arr, chunk=GENERATE_CHUNK):
+    """Whether arr is strictly increasing, checked `chunk` elements at a time so a memmap is never loaded whole."""
+    for lo in range(0, max(len(arr) - 1, 0), chunk):
+        block = np.asarray(arr[lo:lo + chunk + 1])
+        if not np.all(block[1:] > block[:-1]):
+            return False
+    return True
+
+
+def generate_targets(arr, count=DEFAULT_QUERIES, hit_fraction=DEFAULT_HIT_FRACTION, seed=None):
+    """Query targets for a sorted array: about hit_fraction of them copied from arr, the rest uniform over its range."""
+    rng = np.random.default_rng(seed)
+    arr = np.asarray(arr)
+    hits = rng.random(count) < hit_fraction
+    targets = rng.integers(arr[0], arr[-1], size=count, endpoint=True)
+    targets[hits] = arr[rng.integers(0, len(arr), size=int(hits.sum()))]
+    return targets
+
+
+def batch_search(arr, targets):
+    """Index of each target in sorted arr, or -1 when absent, answered with one np.searchsorted call.
+
+    The targets are sorted first: searchsorted then walks arr roughly in
+    order instead of jumping around it, which is several times faster on
+    arrays larger than the cache.
+    """
+    arr, targets = np.asarray(arr), np.asarray(targets)
+    order = np.argsort(targets, kind='stable')
+    ordered = targets[order]
+    index = np.searchsorted(arr, ordered)
+    found = index < len(arr)
+    found[found] = arr[index[found]] == ordered[found]
+    result = np.empty(len(targets), dtype=np.int64)
+    result[order] = np.where(found, index, -1)
+    return result
+
+
+def traced_batch_search(arr, targets, left=None, right=None):
+    """Reference engine: the probes of BinarySearchVisualizer run for every target in lockstep.
+
+    Each round probes the middle of every query's remaining window with one
+    fancy-index read, exactly as the visualizer does for a single target, so
+    a query that needs k probes is active for k rounds. The windows default
+    to the whole array; `left` and `right` give each query its own. Returns
+    the index found for each target (-1 when absent) and the number of
+    probes it took.
+    """
+    arr, targets = np.asarray(arr), np.asarray(targets)
+    count = len(targets)
+    left = np.zeros(count, dtype=np.int64) if left is None else np.array(left, dtype=np.int64)
+    right = np.full(count, len(arr) - 1, dtype=np.int64) if right is None else np.array(right, dtype=np.int64)
+    result = np.full(count, -1, dtype=np.int64)
+    probes = np.zeros(count, dtype=np.int64)
+    active = np.flatnonzero(left <= right)
+    while len(active):
+        lo, hi = left[active], right[active]
+        mid = (lo + hi) // 2
+        values, wanted = arr[mid], targets[active]
+        probes[active] += 1
+        hit = values == wanted
+        result[active[hit]] = mid[hit]
+        below = values < wanted
+        left[active[below]] = mid[below] + 1
+        above = values > wanted
+        right[active[above]] = mid[above] - 1
+        keep = ~hit & (left[active] <= right[active])
+        active = active[keep]
+    return result, probes
+
+
+def run_batch(arr, targets):
+    """Answer every target with both engines and return the results, probe counts and timings."""
+    start = time.perf_counter()
+    index = batch_search(arr, targets)
+    vectorized = time.perf_counter() - start
+    start = time.perf_counter()
+    traced, probes = traced_batch_search(arr, targets)
+    reference = time.perf_counter() - start
+    if not np.array_equal(index >= 0, traced >= 0):
+        raise AssertionError("np.searchsorted and the traced engine disagree on which targets are present")
+    return {
+        'queries': len(targets),
+        'found': int((index >= 0).sum()),
+        'index': index,
+        'probes': probes,
+        'vectorized_seconds': vectorized,
+        'traced_seconds': reference,
+    }
+
+
+def format_probe_histogram(probes):
+    """Text histogram of how many queries took each number of probes."""
+    counts = np.bincount(probes)
+    peak = max(int(counts.max()), 1) if len(counts) else 1
+    lines = [f"{'probes':>6}  {'queries':>10}"]
+    for k, count in enumerate(counts.tolist()):
+        if count:
+            lines.append(f"{k:>6}  {count:>10}  {'#' * max(1, count * HISTOGRAM_WIDTH // peak)}")
+    return '\n'.join(lines)
+
+
+def print_batch_report(result):
+    """Print queries/sec for both engines, probe statistics and the probe-count histogram."""
+    queries, probes = result['queries'], result['probes']
+    print(f"\n{queries} queries, {result['found']} found ({result['found'] / max(queries, 1):.1%})")
+    for label, key in (('np.searchsorted', 'vectorized_seconds'), ('traced engine', 'traced_seconds')):
+        seconds = result[key]
+        rate = queries / seconds if seconds > 0 else float('inf')
+        print(f"{label:<16} {seconds * 1000:10.2f} ms  {rate:14,.0f} queries/sec")
+    if queries:
+        print(f"Probes per query: mean {probes.mean():.2f}, median {np.median(probes):.0f}, max {probes.max()}")
+        print(format_probe_histogram(probes))
@@ -0,0 +1,348 @@
+import time
+import numpy as np
+from search_batch import (DEFAULT_HIT_FRACTION, SORTED_DISTRIBUTIONS, batch_search, generate_targets,
+                          sorted_unique_numbers, traced_batch_search)
+
+# Search states are (status, left, right, mid) tuples, with -1 for an index that is not set. The
+# status is one of 'start', 'compare', 'go_right', 'go_left', 'found' or 'not_found'; left..right
+# is the window of the sorted array that can still hold the target and mid the index just probed.
+ENGINES = ['binary', 'interpolation', 'exponential', 'eytzinger']
+KEY_DISTRIBUTIONS = SORTED_DISTRIBUTIONS
+BENCHMARK_SIZES = [10 ** 5, 10 ** 6, 10 ** 7]
+BENCHMARK_QUERIES = 100000
+
+
+def _bisect_steps(arr, target, left, right):
+    while left <= right:
+        mid = (left + right) // 2
+        yield 'compare', left, right, mid
+        value = arr[mid]
+        if value == target:
+            yield 'found', left, right, mid
+            return
+        elif value < target:
+            left = mid + 1
+            yield 'go_right', left, right, mid
+        else:
+            right = mid - 1
+            yield 'go_left', left, right, mid
+    yield 'not_found', -1, -1, -1
+
+
+def binary_search_steps(arr, target):
+    """Binary search, probing the middle of the window."""
+    yield 'start', 0, len(arr) - 1, -1
+    yield from _bisect_steps(arr, target, 0, len(arr) - 1)
+
+
+def interpolation_search_steps(arr, target):
+    """Interpolation search: probe where the target would sit if the keys were evenly spread.
+
+    About log log n probes on uniform keys, but up to n on skewed ones.
+    """
+    left, right = 0, len(arr) - 1
+    yield 'start', left, right, -1
+    while left <= right and arr[left] <= target <= arr[right]:
+        low, high = float(arr[left]), float(arr[right])
+        mid = left if high == low else left + int((float(target) - low) / (high - low) * (right - left))
+        yield 'compare', left, right, mid
+        value = arr[mid]
+        if value == target:
+            yield 'found', left, right, mid
+            return
+        elif value < target:
+            left = mid + 1
+            yield 'go_right', left, right, mid
+        else:
+            right = mid - 1
+            yield 'go_left', left, right, mid
+    yield 'not_found', -1, -1, -1
+
+
+def exponential_search_steps(arr, target):
+    """Exponential (galloping) search: probe indices 0, 1, 3, 7, ... until one passes the target, then bisect.
+
+    Takes about 2 log k probes for a target at index k, so it suits lookups
+    near the front of the array or in arrays of unknown length.
+    """
+    n = len(arr)
+    left, right, probe = 0, n - 1, 0
+    yield 'start', left, right, -1
+    while probe < n:
+        yield 'compare', left, right, probe
+        value = arr[probe]
+        if value == target:
+            yield 'found', left, right, probe
+            return
+        elif value < target:
+            left = probe + 1
+            yield 'go_right', left, right, probe
+            probe = 2 * probe + 1
+        else:
+            right = probe - 1
+            yield 'go_left', left, right, probe
+            break
+    yield from _bisect_steps(arr, target, left, right)
+
+
+def eytzinger_order(n):
+    """Sorted index of each node of the Eytzinger (BFS-order) layout of n keys, for nodes 1..n.
+
+    Node k has children 2k and 2k + 1. In the complete tree of h levels a
+    node's in-order position follows from its depth and offset; the last
+    level is only partly filled, so positions after its missing nodes close
+    up by one for each missing node passed.
+    """
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    node = np.arange(1, n + 1, dtype=np.int64)
+    levels = n.bit_length()
+    depth = np.zeros(n, dtype=np.int64)
+    for d in range(1, levels):
+        depth[(1 << d) - 1:] += 1
+    position = (2 * (node - (1 << depth)) + 1) * (1 << (levels - 1 - depth)) - 1
+    present = n - (1 << (levels - 1)) + 1  # nodes on the last level
+    return position - np.maximum(0, (position + 1) // 2 - present)
+
+
+def eytzinger_index(node, n):
+    """Sorted index of Eytzinger node `node` (1..n) of n keys; eytzinger_order for a single node."""
+    levels = n.bit_length()
+    depth = node.bit_length() - 1
+    position = (2 * (node - (1 << depth)) + 1) * (1 << (levels - 1 - depth)) - 1
+    present = n - (1 << (levels - 1)) + 1
+    return position - max(0, (position + 1) // 2 - present)
+
+
+def eytzinger_layout(arr):
+    """The keys of sorted arr in Eytzinger order, and the sorted index of each of them."""
+    order = eytzinger_order(len(arr))
+    return np.asarray(arr)[order], order
+
+
+def _leaf_to_match(node):
+    # Undo the final run of right turns, plus the left turn before it: the node left is the lower bound.
+    return node >> ((node + 1) & ~node).bit_length()
+
+
+def eytzinger_search_steps(arr, target, layout=None):
+    """Branchless search of the Eytzinger layout, shown on the sorted array.
+
+    Every probe descends to child 2k or 2k + 1 of node k depending only on
+    the comparison, without stopping on a match, so each query takes the same
+    floor(log2 n) + 1 or so probes; the first levels of the tree share cache
+    lines, which makes those probes cheap. The lower bound is recovered from
+    the final node at the end. Pass `layout` from eytzinger_layout to probe
+    it; without one, each node's sorted index is computed as it is visited
+    and arr is read in place, so a memory-mapped array is never copied.
+    """
+    n = len(arr)
+    if layout is None:
+        def sorted_index(node):
+            return eytzinger_index(node, n)
+
+        def key(node):
+            return arr[eytzinger_index(node, n)]
+    else:
+        layout, order = layout
+
+        def sorted_index(node):
+            return int(order[node - 1])
+
+        def key(node):
+            return layout[node - 1]
+    left, right, node = 0, n - 1, 1
+    yield 'start', left, right, -1
+    while node <= n:
+        mid = sorted_index(node)
+        yield 'compare', left, right, mid
+        if key(node) < target:
+            left = mid + 1
+            node = 2 * node + 1
+            yield 'go_right', left, right, mid
+        else:
+            right = mid - 1
+            node = 2 * node
+            yield 'go_left', left, right, mid
+    node = _leaf_to_match(node)
+    if node and key(node) == target:
+        yield 'found', left, right, sorted_index(node)
+    else:
+        yield 'not_found', -1, -1, -1
+
+
+SEARCH_STEPS = {
+    'binary': binary_search_steps,
+    'interpolation': interpolation_search_steps,
+    'exponential': exponential_search_steps,
+    'eytzinger': eytzinger_search_steps,
+}
+
+
+def interpolation_batch(arr, targets):
+    """interpolation_search_steps for every target in lockstep; returns (index or -1, probes) per target."""
+    arr, targets = np.asarray(arr), np.asarray(targets)
+    count = len(targets)
+    left = np.zeros(count, dtype=np.int64)
+    right = np.full(count, len(arr) - 1, dtype=np.int64)
+    result = np.full(count, -1, dtype=np.int64)
+    probes = np.zeros(count, dtype=np.int64)
+    active = np.flatnonzero(left <= right)
+    while len(active):
+        lo, hi, wanted = left[active], right[active], targets[active]
+        low, high = arr[lo], arr[hi]
+        inside = (low <= wanted) & (wanted <= high)
+        active, lo, hi, wanted, low, high = (a[inside] for a in (active, lo, hi, wanted, low, high))
+        span = high.astype(np.float64) - low
+        fraction = (wanted.astype(np.float64) - low) / np.where(span > 0, span, 1)
+        mid = np.minimum(lo + (fraction * (hi - lo)).astype(np.int64), hi)
+        values = arr[mid]
+        probes[active] += 1
+        hit = values == wanted
+        result[active[hit]] = mid[hit]
+        below = values < wanted
+        left[active[below]] = mid[below] + 1
+        above = values > wanted
+        right[active[above]] = mid[above] - 1
+        active = active[~hit & (left[active] <= right[active])]
+    return result, probes
+
+
+def exponential_batch(arr, targets):
+    """exponential_search_steps for every target in lockstep; returns (index or -1, probes) per target."""
+    arr, targets = np.asarray(arr), np.asarray(targets)
+    n, count = len(arr), len(targets)
+    left = np.zeros(count, dtype=np.int64)
+    right = np.full(count, n - 1, dtype=np.int64)
+    probe = np.zeros(count, dtype=np.int64)
+    result = np.full(count, -1, dtype=np.int64)
+    probes = np.zeros(count, dtype=np.int64)
+    active = np.arange(count) if n else np.zeros(0, dtype=np.int64)
+    while len(active):
+        at, wanted = probe[active], targets[active]
+        values = arr[at]
+        probes[active] += 1
+        hit = values == wanted
+        result[active[hit]] = at[hit]
+        below = values < wanted
+        left[active[below]] = at[below] + 1
+        probe[active[below]] = 2 * at[below] + 1
+        above = values > wanted
+        right[active[above]] = at[above] - 1
+        active = active[below & (probe[active] < n)]
+    rest = np.flatnonzero(result < 0)
+    found, extra = traced_batch_search(arr, targets[rest], left[rest], right[rest])
+    result[rest] = found
+    probes[rest] += extra
+    return result, probes
+
+
+def eytzinger_batch(layout, order, targets):
+    """eytzinger_search_steps for every target in lockstep over a prebuilt layout; returns (index or -1, probes)."""
+    targets = np.asarray(targets)
+    n, count = len(layout), len(targets)
+    node = np.ones(count, dtype=np.int64)
+    probes = np.zeros(count, dtype=np.int64)
+    # No early exit: every query descends until it falls off the tree, one or two rounds apart.
+    for _ in range(n.bit_length()):
+        inside = node <= n
+        probes += inside
+        below = layout[np.minimum(node, n) - 1] < targets
+        node = np.where(inside, 2 * node + below, node)
+    node = node >> np.log2((node + 1) & ~node).astype(np.int64) + 1
+    found = node > 0
+    found[found] = layout[node[found] - 1] == targets[found]
+    result = np.where(found, order[np.maximum(node, 1) - 1], -1)
+    return result, probes
+
+
+def search_keys(n, distribution='uniform', seed=None):
+    """n sorted unique integer keys drawn from [0, 10n); the skewed distributions crowd them towards 0."""
+    return sorted_unique_numbers(n, 0, 10 * n - 1, distribution, seed)
+
+
+def run_engines(arr, targets):
+    """Answer targets with np.searchsorted and every engine; returns one result dict per engine.
+
+    The Eytzinger layout is built before its timer starts, as a lookup table
+    would be built once and queried many times.
+    """
+    arr = np.asarray(arr)
+    start = time.perf_counter()
+    expected = batch_search(arr, targets) >= 0
+    results = [{'engine': 'searchsorted', 'seconds': time.perf_counter() - start, 'probes': None}]
+    layout, order = eytzinger_layout(arr)
+    engines = {
+        'binary': lambda: traced_batch_search(arr, targets),
+        'interpolation': lambda: interpolation_batch(arr, targets),
+        'exponential': lambda: exponential_batch(arr, targets),
+        'eytzinger': lambda: eytzinger_batch(layout, order, targets),
+    }
+    for engine, search in engines.items():
+        start = time.perf_counter()
+        index, probes = search()
+        seconds = time.perf_counter() - start
+        if not np.array_equal(index >= 0, expected):
+            raise AssertionError(f"{engine} search disagrees with np.searchsorted on which targets are present")
+        results.append({'engine': engine, 'seconds': seconds, 'probes': probes})
+    for result in results:
+        result['queries'] = len(targets)
+    return results
+
+
+def format_engine_table(results, label=''):
+    """One line per engine: mean and max probes and queries/sec."""
+    lines = []
+    for r in results:
+        probes = r['probes']
+        mean = f"{probes.mean():8.2f}" if probes is not None and len(probes) else f"{'-':>8}"
+        peak = f"{probes.max():6d}" if probes is not None and len(probes) else f"{'-':>6}"
+        rate = r['queries'] / r['seconds'] if r['seconds'] > 0 else float('inf')
+        lines.append(f"{label}{r['engine']:<14} {mean} {peak} {r['seconds'] * 1000:10.2f} {rate:14,.0f}")
+    return '\n'.join(lines)
+
+
+def engine_table_header(label=''):
+    return f"{label}{'engine':<14} {'probes':>8} {'max':>6} {'ms':>10} {'queries/sec':>14}"
+
+
+def run_search_benchmark(sizes=BENCHMARK_SIZES, distributions=KEY_DISTRIBUTIONS, queries=BENCHMARK_QUERIES,
+                         hit_fraction=DEFAULT_HIT_FRACTION, seed=0):
+    """Time every engine on `queries` targets over sorted keys of each size and distribution, printing as it goes."""
+    results = []
+    print(engine_table_header(f"{'keys':<11} {'n':>10}  "))
+    for distribution in distributions:
+        for n in sizes:
+            arr = search_keys(n, distribution, seed)
+            targets = generate_targets(arr, queries, hit_fraction, seed)
+            rows = run_engines(arr, targets)
+            print(format_engine_table(rows, f"{distribution:<11} {n:>10}  "))
+            for row in rows:
+                row.update(distribution=distribution, n=n)
+            results.extend(rows)
+    return results
+
+
+def plot_probe_counts(results, path=None, title='Probes per query'):
+    """Bar chart of how many queries each engine answered in k probes; saved to path, or shown if path is None."""
+    import matplotlib
+    if path:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    traced = [r for r in results if r['probes'] is not None and len(r['probes'])]
+    fig, ax = plt.subplots(figsize=(12, 6))
+    width = 0.8 / max(len(traced), 1)
+    for k, r in enumerate(traced):
+        counts = np.bincount(r['probes'])
+        ax.bar(np.arange(len(counts)) + (k - (len(traced) - 1) / 2) * width, counts, width,
+               label=f"{r['engine']} (mean {r['probes'].mean():.1f})")
+    ax.set_xlabel('probes')
+    ax.set_ylabel('queries')
+    ax.set_title(title)
+    ax.legend()
+    if path:
+        fig.savefig(path, dpi=100)
+        plt.close(fig)
+    else:
+        plt.show()
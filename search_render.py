@@ -0,0 +1,125 @@
+import numpy as np
+from matplotlib.colors import to_rgba
+from matplotlib.patches import Patch, PathPatch
+from matplotlib.path import Path
+from sort_render import BAR_WIDTH, RASTER_COLUMNS, RASTER_ROWS, VECTOR_LIMIT
+
+BASE_COLOR = 'lightblue'
+WINDOW_COLOR = 'lightgray'
+PROBE_COLOR = 'red'
+FOUND_COLOR = 'lightgreen'
+LABEL_LIMIT = 64  # value labels are only drawn on arrays up to this size
+
+LEGEND = [
+    (BASE_COLOR, 'Unexamined'),
+    (WINDOW_COLOR, 'Current Search Space'),
+    (PROBE_COLOR, 'Middle Element'),
+    (FOUND_COLOR, 'Target Found'),
+]
+
+
+class SearchRenderer:
+    """Bars for search animations that are built once and only recolored per frame.
+
+    A frame only moves the search window and the probed bar, so the bars,
+    value labels and legend are created up front and update() returns just
+    the artists that changed, for FuncAnimation with blit=True.
+
+    Small arrays are drawn as one compound path, with the window and the
+    probe as overlays whose paths are views of slices of its vertices, so a
+    frame costs the same whatever the window's width. Larger arrays are drawn
+    as an image of at most RASTER_COLUMNS columns. As the array is sorted,
+    each column's height is the last value of its bucket, so only
+    RASTER_COLUMNS elements are ever read, even from a memory-mapped array
+    of 10^8 elements.
+    """
+
+    def __init__(self, ax, arr):
+        self.ax = ax
+        self.arr = arr
+        self.n = len(arr)
+        low, high = min(arr[0].item(), 0), max(arr[-1].item(), 1)
+        self.ylim = (low * 1.2, high * 1.2)
+        ax.set_xlim(-0.5, self.n - 0.5)
+        ax.set_ylim(*self.ylim)
+        self.vector = self.n <= VECTOR_LIMIT
+        if self.vector:
+            self._init_vector()
+        else:
+            self._init_raster()
+        ax.legend(handles=[Patch(facecolor=color, label=label) for color, label in LEGEND], loc='upper right')
+        self.status = ax.text(0.01, 0.98, '', transform=ax.transAxes, va='top', family='monospace')
+        self._artists.append(self.status)
+
+    def _init_vector(self):
+        values = np.asarray(self.arr, dtype=float)
+        x = np.arange(self.n, dtype=float)
+        verts = np.zeros((self.n, 5, 2))
+        verts[:, [0, 1, 4], 0] = (x - BAR_WIDTH / 2)[:, None]
+        verts[:, [2, 3], 0] = (x + BAR_WIDTH / 2)[:, None]
+        verts[:, [1, 2], 1] = values[:, None]
+        self.codes = np.tile([Path.MOVETO, Path.LINETO, Path.LINETO, Path.LINETO, Path.CLOSEPOLY],
+                             self.n).astype(Path.code_type)
+        path = Path(verts.reshape(-1, 2), self.codes)
+        # Bar k occupies rows 5k..5k+4 of the path's vertices.
+        self.bar_verts = path.vertices.reshape(self.n, 5, 2)
+        self.ax.add_patch(PathPatch(path, facecolor=BASE_COLOR, edgecolor='none'))
+        self.window = PathPatch(Path(np.zeros((0, 2))), facecolor=WINDOW_COLOR, edgecolor='none')
+        self.probe = PathPatch(Path(np.zeros((0, 2))), facecolor=PROBE_COLOR, edgecolor='none')
+        self.ax.add_patch(self.window)
+        self.ax.add_patch(self.probe)
+        if self.n <= LABEL_LIMIT:
+            for i, v in enumerate(self.arr.tolist()):
+                self.ax.text(i, v, str(v), ha='center', va='bottom')
+        self._artists = [self.window, self.probe]
+
+    def _init_raster(self):
+        self.bucket = -(-self.n // RASTER_COLUMNS)
+        columns = -(-self.n // self.bucket)
+        ends = np.minimum((np.arange(columns) + 1) * self.bucket, self.n) - 1
+        heights = np.asarray(self.arr[ends], dtype=float)
+        low, high = self.ylim
+        rows = (np.arange(RASTER_ROWS) + 0.5) / RASTER_ROWS * (high - low) + low
+        # Pixel (r, c) is filled when row r lies between zero and the height of column c.
+        self.filled = ((rows[:, None] <= heights) & (rows[:, None] >= 0)) | ((rows[:, None] >= heights) & (rows[:, None] < 0))
+        self.palette = np.array([to_rgba(c) for c in (BASE_COLOR, WINDOW_COLOR, PROBE_COLOR, FOUND_COLOR)]) * 255
+        self.palette = self.palette.astype(np.uint8)
+        self.color = np.zeros(columns, dtype=np.intp)
+        self.pixels = np.zeros((RASTER_ROWS, columns, 4), dtype=np.uint8)
+        self.image = self.ax.imshow(self.pixels, origin='lower', aspect='auto', interpolation='nearest',
+                                    extent=(-0.5, columns * self.bucket - 0.5, low, high))
+        self._paint()
+        self._artists = [self.image]
+
+    def _paint(self):
+        self.pixels[:] = self.palette[self.color][None, :, :] * self.filled[:, :, None]
+        self.image.set_data(self.pixels)
+
+    def init(self):
+        """FuncAnimation init_func: mark the changing artists for blitting."""
+        return self._artists
+
+    def update(self, status, left, right, mid, text=''):
+        """Show one (status, left, right, mid) search state with `text` as its caption."""
+        window = left >= 0 and right >= left
+        probe_color = FOUND_COLOR if status == 'found' else PROBE_COLOR
+        if self.vector:
+            if window:
+                self.window.set_path(Path(self.bar_verts[left:right + 1].reshape(-1, 2),
+                                          self.codes[:5 * (right - left + 1)]))
+            else:
+                self.window.set_path(Path(np.zeros((0, 2))))
+            if mid >= 0:
+                self.probe.set_path(Path(self.bar_verts[mid], self.codes[:5]))
+                self.probe.set_facecolor(probe_color)
+            else:
+                self.probe.set_path(Path(np.zeros((0, 2))))
+        else:
+            self.color[:] = 0
+            if window:
+                self.color[left // self.bucket:right // self.bucket + 1] = 1
+            if mid >= 0:
+                self.color[mid // self.bucket] = 3 if status == 'found' else 2
+            self._paint()
+        self.status.set_text(text)
+        return self._artists
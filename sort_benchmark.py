@@ -0,0 +1,380 @@
+import csv
+import json
+import math
+import random
+import statistics
+import time
+import numpy as np
+from sort_radix import DEFAULT_RADIX, radix_sort_passes
+from sort_intro import intro_sort_range
+from sort_tim import tim_sort
+from sort_bottomup import initial_run_width, merge_into
+from sort_heap import DEFAULT_ARITY
+from sort_parallel import DEFAULT_WORKERS, parallel_sample_sort
+from sort_network import network_stages, compare_exchange
+from sort_counting import counting_sort_values, bucket_sort_values
+
+# Untraced sort engines. Each sorts arr in place and returns (comparisons, swaps);
+# for the merge, Timsort, radix, d-ary heap, counting and bucket sorts "swaps" counts element moves.
+
+def bubble_sort(arr):
+    """Bubble sort without visualization states."""
+    comparisons = swaps = 0
+    n = len(arr)
+    for i in range(n - 1):
+        for j in range(n - i - 1):
+            comparisons += 1
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                swaps += 1
+    return comparisons, swaps
+
+def quick_sort(arr):
+    """Recursive Lomuto quicksort (last-element pivot) without visualization states."""
+    counts = [0, 0]
+
+    def _partition(low, high):
+        pivot = arr[high]
+        i = low - 1
+        for j in range(low, high):
+            counts[0] += 1
+            if arr[j] <= pivot:
+                i += 1
+                if i != j:
+                    arr[i], arr[j] = arr[j], arr[i]
+                    counts[1] += 1
+        if i + 1 != high:
+            arr[i + 1], arr[high] = arr[high], arr[i + 1]
+            counts[1] += 1
+        return i + 1
+
+    def _quick_sort(low, high):
+        if low < high:
+            pi = _partition(low, high)
+            _quick_sort(low, pi - 1)
+            _quick_sort(pi + 1, high)
+
+    _quick_sort(0, len(arr) - 1)
+    return counts[0], counts[1]
+
+def merge_sort(arr):
+    """Top-down merge sort with a shared temp buffer, without visualization states."""
+    counts = [0, 0]
+    temp = [0] * len(arr)
+
+    def _merge(left, mid, right):
+        i, j, k = left, mid + 1, left
+        while i <= mid and j <= right:
+            counts[0] += 1
+            if arr[i] <= arr[j]:
+                temp[k] = arr[i]
+                i += 1
+            else:
+                temp[k] = arr[j]
+                j += 1
+            k += 1
+        while i <= mid:
+            temp[k] = arr[i]
+            i += 1
+            k += 1
+        while j <= right:
+            temp[k] = arr[j]
+            j += 1
+            k += 1
+        arr[left:right + 1] = temp[left:right + 1]
+        counts[1] += 2 * (right - left + 1)
+
+    def _merge_sort(left, right):
+        if left < right:
+            mid = (left + right) // 2
+            _merge_sort(left, mid)
+            _merge_sort(mid + 1, right)
+            _merge(left, mid, right)
+
+    _merge_sort(0, len(arr) - 1)
+    return counts[0], counts[1]
+
+def radix_sort(arr, radix=DEFAULT_RADIX):
+    """Vectorized LSD radix sort without visualization states."""
+    values, passes = None, 0
+    for values in radix_sort_passes(arr, radix):
+        passes += 1
+    if values is not None:
+        arr[:] = values.tolist()
+    return 0, passes * len(arr)
+
+def bottom_up_merge_sort(arr):
+    """Bottom-up merge sort with ping-pong buffers, without visualization states."""
+    n = len(arr)
+    comparisons = moves = 0
+    width = initial_run_width(n)
+    for lo in range(0, n, width):
+        for i in range(lo + 1, min(lo + width, n)):
+            j = i
+            while j > lo:
+                comparisons += 1
+                if arr[j - 1] <= arr[j]:
+                    break
+                arr[j - 1], arr[j] = arr[j], arr[j - 1]
+                moves += 1
+                j -= 1
+    src, dst = arr, [0] * n
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            comparisons += merge_into(src, dst, lo, min(lo + width, n), min(lo + 2 * width, n))
+        moves += n
+        src, dst = dst, src
+        width *= 2
+    return comparisons, moves
+
+def heap_sort(arr):
+    """Recursive binary heapsort, as in the interactive front-end, without visualization states."""
+    counts = [0, 0]
+
+    def _heapify(n, i):
+        largest = i
+        for child in (2 * i + 1, 2 * i + 2):
+            if child < n:
+                counts[0] += 1
+                if arr[child] > arr[largest]:
+                    largest = child
+        if largest != i:
+            arr[i], arr[largest] = arr[largest], arr[i]
+            counts[1] += 1
+            _heapify(n, largest)
+
+    n = len(arr)
+    for i in range(n // 2 - 1, -1, -1):
+        _heapify(n, i)
+    for i in range(n - 1, 0, -1):
+        arr[0], arr[i] = arr[i], arr[0]
+        counts[1] += 1
+        _heapify(i, 0)
+    return counts[0], counts[1]
+
+def dary_heap_sort(arr, arity=DEFAULT_ARITY):
+    """Iterative d-ary heapsort with Floyd's sift-down, without visualization states."""
+    comparisons = moves = 0
+
+    def _sift_down(root, size, value):
+        nonlocal comparisons, moves
+        path = [root]
+        node = root
+        while arity * node + 1 < size:
+            first = arity * node + 1
+            best = first
+            for child in range(first + 1, min(first + arity, size)):
+                comparisons += 1
+                if arr[child] > arr[best]:
+                    best = child
+            path.append(best)
+            node = best
+        t = len(path) - 1
+        while t > 0:
+            comparisons += 1
+            if arr[path[t]] > value:
+                break
+            t -= 1
+        for level in range(1, t + 1):
+            arr[path[level - 1]] = arr[path[level]]
+        if t > 0 or arr[root] != value:
+            arr[path[t]] = value
+            moves += t + 1
+
+    n = len(arr)
+    for i in range((n - 2) // arity, -1, -1):
+        _sift_down(i, n, arr[i])
+    for end in range(n - 1, 0, -1):
+        value = arr[end]
+        arr[end] = arr[0]
+        moves += 1
+        _sift_down(0, end, value)
+    return comparisons, moves
+
+def network_sort(arr):
+    """Batcher merge-exchange network, one vectorized stage at a time, without visualization states."""
+    values = np.asarray(arr)
+    comparisons = 0
+    for p, r, d in network_stages(len(arr)):
+        comparisons += compare_exchange(values, p, r, d)
+    arr[:] = values.tolist()
+    return comparisons, 2 * comparisons
+
+def counting_sort(arr):
+    """Vectorized counting sort without visualization states."""
+    arr[:] = counting_sort_values(arr).tolist()
+    return 0, len(arr)
+
+def bucket_sort(arr):
+    """Bucket sort without visualization states; each element moves into its bucket, then within it."""
+    values, comparisons = bucket_sort_values(arr)
+    arr[:] = values.tolist()
+    return comparisons, 2 * len(arr)
+
+def intro_sort(arr):
+    """Introsort without visualization states."""
+    return intro_sort_range(arr)
+
+# Map algorithm names to their untraced engines
+plain_functions = {
+    'bubble': bubble_sort,
+    'quick': quick_sort,
+    'merge': merge_sort,
+    'radix': radix_sort,
+    'intro': intro_sort,
+    'tim': tim_sort,
+    'bottomup': bottom_up_merge_sort,
+    'heap': heap_sort,
+    'dheap': dary_heap_sort,
+    'sample': parallel_sample_sort,
+    'network': network_sort,
+    'counting': counting_sort,
+    'bucket': bucket_sort,
+}
+
+# Algorithms whose running time grows quadratically, used to skip sizes that would blow the budget.
+QUADRATIC = {'bubble'}
+CALIBRATION_SIZE = 256  # elements a quadratic engine is timed on before its first real size
+
+DISTRIBUTIONS = ['random', 'sorted', 'reversed', 'nearly_sorted', 'few_unique']
+
+def generate_input(distribution, n, min_val, max_val, rng=random):
+    """Build one benchmark input of size n."""
+    if distribution == 'few_unique':
+        values = [rng.randint(0, 9) for _ in range(10)]
+        return [values[rng.randrange(10)] for _ in range(n)]
+    arr = [rng.randint(min_val, max_val) for _ in range(n)]
+    if distribution == 'sorted':
+        arr.sort()
+    elif distribution == 'reversed':
+        arr.sort(reverse=True)
+    elif distribution == 'nearly_sorted':
+        arr.sort()
+        for _ in range(max(1, n // 100)):
+            i, j = rng.randrange(n), rng.randrange(n)
+            arr[i], arr[j] = arr[j], arr[i]
+    elif distribution != 'random':
+        raise ValueError(f"Unknown distribution: {distribution}")
+    return arr
+
+def predict_seconds(algo, last_n, last_seconds, n):
+    """Extrapolate a run time from the previous size using the algorithm's growth class."""
+    ratio = n / last_n
+    if algo in QUADRATIC:
+        return last_seconds * ratio ** 2
+    return last_seconds * ratio * math.log2(max(n, 2)) / math.log2(max(last_n, 2))
+
+def calibrate(sort, distribution='random', seed=0):
+    """(CALIBRATION_SIZE, seconds) for sort on a small input, the best of three runs.
+
+    Seeds the budget check of a quadratic engine so that even its first
+    size is predicted, from n^2 times the cost per element pair measured here.
+    """
+    data = generate_input(distribution, CALIBRATION_SIZE, 0, CALIBRATION_SIZE, random.Random(seed))
+    times = []
+    for _ in range(3):
+        arr = list(data)
+        start = time.perf_counter()
+        sort(arr)
+        times.append(time.perf_counter() - start)
+    return CALIBRATION_SIZE, min(times)
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+def run_benchmark(algos, sizes, distributions, repeats=5, min_val=0, max_val=100, budget=10.0, seed=0,
+                  arity=DEFAULT_ARITY, radix=DEFAULT_RADIX, workers=DEFAULT_WORKERS):
+    """Time the untraced engines and return one result dict per (algorithm, distribution, size)."""
+    rng = random.Random(seed)
+    results = []
+    for distribution in distributions:
+        for algo in algos:
+            sort = plain_functions[algo]
+            if algo == 'dheap':
+                sort = lambda arr: dary_heap_sort(arr, arity)
+            elif algo == 'radix':
+                sort = lambda arr: radix_sort(arr, radix)
+            elif algo == 'sample':
+                sort = lambda arr: parallel_sample_sort(arr, workers)
+            last = calibrate(sort, distribution, seed) if algo in QUADRATIC else None
+            for n in sorted(sizes):
+                record = {'algorithm': algo, 'distribution': distribution, 'n': n, 'repeats': 0,
+                          'median_ms': None, 'p95_ms': None, 'comparisons': None, 'swaps': None, 'note': ''}
+                results.append(record)
+                if last is not None and predict_seconds(algo, last[0], last[1], n) > budget:
+                    record['note'] = f"skipped: predicted over {budget:g}s budget"
+                    continue
+                data = generate_input(distribution, n, min_val, max_val, rng)
+                times = []
+                try:
+                    for _ in range(repeats):
+                        arr = list(data)
+                        start = time.perf_counter()
+                        comparisons, swaps = sort(arr)
+                        times.append(time.perf_counter() - start)
+                except RecursionError:
+                    record['note'] = "failed: RecursionError"
+                    last = (n, budget)
+                    continue
+                except (TypeError, ValueError) as e:
+                    # The engine cannot sort this input, e.g. counting sort over too wide a key range.
+                    record['note'] = f"failed: {e}"
+                    continue
+                record.update(repeats=repeats, comparisons=comparisons, swaps=swaps,
+                              median_ms=statistics.median(times) * 1000,
+                              p95_ms=percentile(times, 0.95) * 1000)
+                last = (n, statistics.median(times))
+    return results
+
+def run_speedup(sizes, worker_counts, repeats=3, seed=0):
+    """Time sequential introsort and the parallel sample sort (which introsorts its buckets) per worker count."""
+    rng = random.Random(seed)
+    results = []
+    for n in sorted(sizes):
+        data = generate_input('random', n, 0, n, rng)
+        baseline = None
+        for workers in [1] + list(worker_counts):
+            times = []
+            for _ in range(repeats):
+                arr = list(data)
+                start = time.perf_counter()
+                if workers == 1:
+                    intro_sort(arr)
+                else:
+                    parallel_sample_sort(arr, workers)
+                times.append(time.perf_counter() - start)
+            seconds = statistics.median(times)
+            baseline = baseline or seconds
+            results.append({'algorithm': 'intro' if workers == 1 else 'sample', 'workers': workers, 'n': n,
+                            'median_ms': seconds * 1000, 'speedup': baseline / seconds})
+    return results
+
+def print_speedup(results):
+    """Print the speedup table from run_speedup."""
+    print(f"{'algorithm':<10} {'workers':>8} {'n':>10} {'median ms':>12} {'speedup':>8}")
+    for r in results:
+        print(f"{r['algorithm']:<10} {r['workers']:>8} {r['n']:>10} {r['median_ms']:>12.2f} {r['speedup']:>8.2f}")
+
+def write_results(results, path):
+    """Write benchmark results as CSV if path ends in .csv, otherwise as JSON."""
+    if path.endswith('.csv'):
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+            writer.writeheader()
+            writer.writerows(results)
+    else:
+        with open(path, 'w') as f:
+            json.dump(results, f, indent=2)
+
+def print_results(results):
+    """Print a compact results table to stdout."""
+    print(f"{'algorithm':<10} {'distribution':<14} {'n':>10} {'median ms':>12} {'p95 ms':>12} "
+          f"{'comparisons':>14} {'swaps':>14}")
+    for r in results:
+        if r['median_ms'] is None:
+            print(f"{r['algorithm']:<10} {r['distribution']:<14} {r['n']:>10} {r['note']}")
+            continue
+        print(f"{r['algorithm']:<10} {r['distribution']:<14} {r['n']:>10} {r['median_ms']:>12.2f} "
+              f"{r['p95_ms']:>12.2f} {r['comparisons']:>14} {r['swaps']:>14}")
@@ -0,0 +1,60 @@
+import math
+from sort_intro import insertion_sort_range_steps
+
+RUN_WIDTH = 32  # runs are insertion-sorted in place before merging starts
+
+
+def merge_into(src, dst, lo, mid, hi):
+    """Merge the sorted blocks src[lo:mid] and src[mid:hi] into dst[lo:hi]; returns the comparisons made."""
+    i, j = lo, mid
+    comparisons = 0
+    for k in range(lo, hi):
+        if j < hi and i < mid:
+            comparisons += 1
+            if src[j] < src[i]:
+                dst[k] = src[j]
+                j += 1
+            else:
+                dst[k] = src[i]
+                i += 1
+        elif i < mid:
+            dst[k] = src[i]
+            i += 1
+        else:
+            dst[k] = src[j]
+            j += 1
+    return comparisons
+
+
+def initial_run_width(n):
+    """RUN_WIDTH or half of it, whichever leaves an even number of merge passes so the result ends in arr."""
+    passes = max(0, math.ceil(math.log2(n / RUN_WIDTH))) if n > RUN_WIDTH else 0
+    return RUN_WIDTH if passes % 2 == 0 else RUN_WIDTH // 2
+
+
+def bottom_up_merge_sort_steps(arr):
+    """Iterative bottom-up merge sort with two ping-pong buffers, yielding visualization steps.
+
+    Runs of initial_run_width(n) are insertion-sorted in place, then each pass
+    merges blocks of doubling width from one buffer into the other, so no
+    merge allocates or copies data back. The run width is picked so the last
+    pass lands in arr. Blocks merged into arr yield one 'merge_block' step that
+    writes the whole range; blocks merged into the spare buffer are not
+    visible yet and yield a 'merged' highlight instead. Each merge is
+    preceded by a 'tally' step with its comparisons and spare-buffer writes.
+    """
+    n = len(arr)
+    if n < 2:
+        return
+    width = initial_run_width(n)
+    for lo in range(0, n, width):
+        yield from insertion_sort_range_steps(arr, lo, min(lo + width, n) - 1)
+    src, dst = arr, [0] * n
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid, hi = min(lo + width, n), min(lo + 2 * width, n)
+            comparisons = merge_into(src, dst, lo, mid, hi)
+            yield 'tally', 0 if dst is arr else hi - lo, comparisons
+            yield ('merge_block' if dst is arr else 'merged'), lo, hi - 1
+        src, dst = dst, src
+        width *= 2
@@ -0,0 +1,125 @@
+import sys
+from array import array
+import numpy as np
+from sort_trace import ACTION_WRITES, RANGE
+
+COUNTER_FIELDS = ('comparisons', 'swaps', 'writes', 'aux_bytes', 'max_depth')
+AUX_SAMPLE_INTERVAL = 64  # steps between scans of the engine's buffers
+
+
+def buffer_bytes(value):
+    """Bytes held by a list, array or ndarray; 0 for anything else."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (list, array, bytearray)):
+        return sys.getsizeof(value)
+    return 0
+
+
+class OperationCounter:
+    """Step sink that tallies the work a sort does instead of recording frames.
+
+    It accepts the same record()/extend() calls as SortTrace, so it can be
+    passed as `states` to any *_visual function. Element writes are derived
+    from ACTION_WRITES, with whole-array steps counting every element.
+    Engines that compare or write off screen report that work in 'stage'
+    and 'tally' steps, which carry the counts themselves.
+
+    extend() also follows the chain of nested step generators: its length is
+    the recursion depth of the recursive engines, and every
+    AUX_SAMPLE_INTERVAL steps the lists and arrays held by those generators,
+    other than the array being sorted, are summed into the auxiliary memory
+    high-water mark.
+    """
+
+    def __init__(self, arr):
+        self.arr = arr
+        self.steps = 0
+        self.comparisons = 0
+        self.swaps = 0
+        self.writes = 0
+        self.aux_bytes = 0
+        self.max_depth = 0
+
+    def __len__(self):
+        return self.steps
+
+    def record(self, action, idx1=-1, idx2=-1):
+        """Tally one step."""
+        if action == 'tally':
+            # Work the engine did without steps of its own: idx1 scratch writes, idx2 comparisons.
+            self.writes += idx1
+            self.comparisons += idx2
+            return
+        self.steps += 1
+        if action == 'compare':
+            self.comparisons += 1
+            return
+        if action == 'stage':
+            # A sorting network stage carries its comparator count in idx2.
+            self.comparisons += idx2
+        if action == 'swap':
+            self.swaps += 1
+        writes = ACTION_WRITES[action]
+        if writes is None:
+            self.writes += len(self.arr)
+        elif writes == RANGE:
+            self.writes += idx2 - idx1 + 1
+        elif writes:
+            indices = (idx1, idx2)
+            self.writes += sum(1 for slot in writes if indices[slot] >= 0)
+
+    def extend(self, steps):
+        """Tally every step produced by a step generator."""
+        record = self.record
+        max_depth = self.max_depth
+        for k, (action, idx1, idx2) in enumerate(steps):
+            record(action, idx1, idx2)
+            depth, gen = 0, steps
+            while gen is not None:
+                depth += 1
+                gen = getattr(gen, 'gi_yieldfrom', None)
+            if depth > max_depth:
+                max_depth = depth
+            if k % AUX_SAMPLE_INTERVAL == 0:
+                self._sample_buffers(steps)
+        self.max_depth = max_depth
+
+    def _sample_buffers(self, steps):
+        seen = {id(self.arr)}
+        total = 0
+        gen = steps
+        while gen is not None:
+            frame = getattr(gen, 'gi_frame', None)
+            if frame is not None:
+                for value in frame.f_locals.values():
+                    if id(value) not in seen:
+                        seen.add(id(value))
+                        total += buffer_bytes(value)
+            gen = getattr(gen, 'gi_yieldfrom', None)
+        self.aux_bytes = max(self.aux_bytes, total)
+
+    def as_dict(self):
+        """The counters as a plain dict keyed by COUNTER_FIELDS."""
+        return {field: getattr(self, field) for field in COUNTER_FIELDS}
+
+
+class TracingCounter(OperationCounter):
+    """OperationCounter that also records every step into a SortTrace, so one sort gives both."""
+
+    def __init__(self, trace):
+        super().__init__(trace.arr)
+        self.trace = trace
+
+    def record(self, action, idx1=-1, idx2=-1):
+        """Record one step into the trace and tally it."""
+        self.trace.record(action, idx1, idx2)
+        super().record(action, idx1, idx2)
+
+
+def format_counters(counters):
+    """One-line summary of an OperationCounter or its as_dict()."""
+    if isinstance(counters, OperationCounter):
+        counters = counters.as_dict()
+    return (f"{counters['comparisons']} comparisons, {counters['swaps']} swaps, {counters['writes']} writes, "
+            f"aux peak {counters['aux_bytes'] / 1024:.1f} KiB, depth {counters['max_depth']}")
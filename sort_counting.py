@@ -0,0 +1,152 @@
+import math
+import numpy as np
+from sort_radix import radix_keys
+
+HISTOGRAM_BLOCKS = 32  # steps the histogram build is shown in
+MAX_COUNTING_RANGE = 1 << 24  # counters a counting sort may allocate
+MAX_BUCKETS = 1 << 16  # keeps bucket ids 16-bit, so NumPy's stable sort on them is a radix sort
+
+
+def histogram_bounds(n):
+    """Start of each block of n elements the histogram is built from, followed by n."""
+    size = max(1, -(-n // HISTOGRAM_BLOCKS))
+    return list(range(0, n, size)) + [n]
+
+
+def counting_keys(values):
+    """Integer keys 0..k-1 with the same order as values, and k (max - min + 1).
+
+    Raises TypeError for non-integer values and ValueError when the key
+    range is too wide for one counter per key.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind not in 'iu':
+        raise TypeError("counting sort needs integer values; use bucket sort for floats")
+    keys = radix_keys(values)
+    k = int(keys.max()) + 1
+    if k > MAX_COUNTING_RANGE:
+        raise ValueError(f"key range {k} is too wide for counting sort; use bucket or radix sort")
+    return keys.astype(np.intp), k
+
+
+def counting_sort_values(values):
+    """Counting sort of an integer array in O(n + k); returns a new sorted array."""
+    values = np.asarray(values)
+    if len(values) < 2:
+        return values.copy()
+    keys, k = counting_keys(values)
+    sorted_keys = np.repeat(np.arange(k, dtype=np.int64), np.bincount(keys, minlength=k))
+    return (sorted_keys + values.min().item()).astype(values.dtype)
+
+
+def counting_sort_steps(arr):
+    """Counting sort of a list of integers in place, yielding its histogram and placement phases.
+
+    The histogram of keys is built in HISTOGRAM_BLOCKS 'count' steps, each
+    covering the block of elements just tallied. Prefix sums of the counts
+    then give where each key's run starts, and every distinct key is written
+    there as one 'place' step, so the sorted array fills in from the left.
+    """
+    values = np.asarray(arr)
+    n = len(values)
+    if n < 2:
+        return
+    keys, k = counting_keys(values)
+    counts = np.zeros(k, dtype=np.intp)
+    bounds = histogram_bounds(n)
+    for lo, hi in zip(bounds, bounds[1:]):
+        counts += np.bincount(keys[lo:hi], minlength=k)
+        yield 'count', lo, hi - 1
+    starts = np.cumsum(counts) - counts
+    minimum = values.min().item()
+    for key in np.flatnonzero(counts).tolist():
+        start, count = int(starts[key]), int(counts[key])
+        arr[start:start + count] = [minimum + key] * count
+        yield 'place', start, start + count - 1
+
+
+def bucket_ids(values, buckets=None):
+    """Bucket of each value, with min..max split evenly over `buckets` buckets, and the bucket count.
+
+    By default there is one bucket per element, but no more than there are
+    distinct integer keys or than MAX_BUCKETS. Works for floats as well as
+    integers; equal-width buckets keep the ids in the same order as values.
+    """
+    values = np.asarray(values)
+    n = len(values)
+    low, high = values.min().item(), values.max().item()
+    span = high - low + 1 if values.dtype.kind in 'iu' else high - low
+    if buckets is None:
+        buckets = max(1, min(n, MAX_BUCKETS, int(span) if values.dtype.kind in 'iu' else n))
+    if high == low:
+        return np.zeros(n, dtype=np.uint16), buckets
+    scaled = (values.astype(np.float64) - low) * (buckets / span)
+    ids = np.minimum(scaled.astype(np.int64), buckets - 1)
+    return ids.astype(np.uint16 if buckets <= MAX_BUCKETS else np.int64), buckets
+
+
+def scatter_buckets(values, ids, counts):
+    """Stable scatter of values into contiguous buckets of the given sizes.
+
+    Returns the scattered array and, from the prefix sums of counts, the
+    start of each bucket followed by n.
+    """
+    order = np.argsort(ids, kind='stable')
+    bounds = np.concatenate(([0], np.cumsum(counts)))
+    return values[order], bounds.tolist()
+
+
+def sort_comparisons(m):
+    """Comparisons charged for sorting m elements with NumPy: ceil(log2(m!)), the fewest any comparison sort needs."""
+    return math.ceil(math.lgamma(m + 1) / math.log(2)) if m > 1 else 0
+
+
+def bucket_sort_values(values):
+    """Bucket sort of a numeric array, O(n + k) for evenly spread keys.
+
+    Returns a new sorted array and the comparisons charged for sorting
+    inside the buckets (see sort_comparisons).
+    """
+    values = np.asarray(values)
+    if len(values) < 2:
+        return values.copy(), 0
+    ids, buckets = bucket_ids(values)
+    values, bounds = scatter_buckets(values, ids, np.bincount(ids, minlength=buckets))
+    comparisons = 0
+    for lo, hi in zip(bounds, bounds[1:]):
+        if hi - lo > 1:
+            values[lo:hi].sort()
+            comparisons += sort_comparisons(hi - lo)
+    return values, comparisons
+
+
+def bucket_sort_steps(arr):
+    """Bucket sort of a list of numbers in place, yielding its histogram, scatter and bucket phases.
+
+    Bucket sizes are counted in HISTOGRAM_BLOCKS 'count' steps, their prefix
+    sums place every element in its bucket in one 'scatter' step, and each
+    non-empty bucket is then sorted and shown as a 'place' step. NumPy sorts
+    the buckets without reporting its comparisons, so each bucket of two or
+    more elements is charged sort_comparisons of its size in a 'tally' step.
+    """
+    values = np.asarray(arr)
+    n = len(values)
+    if n < 2:
+        return
+    ids, buckets = bucket_ids(values)
+    counts = np.zeros(buckets, dtype=np.intp)
+    bounds = histogram_bounds(n)
+    for lo, hi in zip(bounds, bounds[1:]):
+        counts += np.bincount(ids[lo:hi], minlength=buckets)
+        yield 'count', lo, hi - 1
+    values, bounds = scatter_buckets(values, ids, counts)
+    arr[:] = values.tolist()
+    yield 'scatter', -1, -1
+    for lo, hi in zip(bounds, bounds[1:]):
+        if hi - lo > 1:
+            segment = values[lo:hi]
+            segment.sort()
+            arr[lo:hi] = segment.tolist()
+            yield 'tally', 0, sort_comparisons(hi - lo)
+        if hi > lo:
+            yield 'place', lo, hi - 1
@@ -0,0 +1,127 @@
+import heapq
+import os
+import tempfile
+import numpy as np
+from sort_io import NumberWriter, iter_numbers, write_numbers
+
+DEFAULT_CHUNK = 1 << 22  # numbers held in memory per sorted run (32 MiB of int64)
+DEFAULT_FAN_IN = 16  # runs merged together in one pass
+PROGRESS_WIDTH = 40
+
+
+def print_progress(label, fraction):
+    """Draw a one-line text progress bar, ending the line when fraction reaches 1."""
+    filled = int(fraction * PROGRESS_WIDTH)
+    print(f"\r{label:<14} [{'#' * filled}{'.' * (PROGRESS_WIDTH - filled)}] {int(fraction * 1000) / 10:5.1f}%",
+          end='\n' if fraction >= 1 else '', flush=True)
+
+
+def spill_runs(path, directory, chunk, dtype=None, progress=None):
+    """Sort the input `chunk` numbers at a time, writing each sorted run to a raw file in directory.
+
+    Returns a list of (run path, length) and the element type of the runs.
+    """
+    runs, run_dtype = [], np.dtype(np.int64)
+    for k, (values, fraction) in enumerate(iter_numbers(path, chunk, dtype)):
+        values.sort()
+        run_dtype = values.dtype
+        run = os.path.join(directory, f'run_{k:06d}.bin')
+        values.tofile(run)
+        runs.append((run, len(values)))
+        if progress:
+            progress(f"run {k + 1}", fraction)
+    return runs, run_dtype
+
+
+def merge_runs(runs, write, dtype, block, on_block=None):
+    """k-way merge of sorted raw run files, passing merged blocks to write() in order.
+
+    Each run is read `block` numbers at a time and a heap keeps the runs
+    ordered by the last value of their buffered block. Everything up to the
+    smallest of those values is final, so it is cut from every buffer,
+    merged with one NumPy sort and written, and the runs whose buffers
+    emptied are refilled. `on_block(count)` is called after each write.
+    """
+    files = [open(path, 'rb') for path, _ in runs]
+    try:
+        buffers = [np.fromfile(f, dtype=dtype, count=block) for f in files]
+        heap = [(buffer[-1], i) for i, buffer in enumerate(buffers) if len(buffer)]
+        heapq.heapify(heap)
+        while heap:
+            bound = heap[0][0]
+            parts = []
+            for i, buffer in enumerate(buffers):
+                cut = np.searchsorted(buffer, bound, side='right')
+                if cut:
+                    parts.append(buffer[:cut])
+                    buffers[i] = buffer[cut:]
+            merged = np.concatenate(parts)
+            merged.sort(kind='stable')
+            write(merged)
+            if on_block:
+                on_block(len(merged))
+            emptied = []
+            while heap and heap[0][0] <= bound:
+                emptied.append(heapq.heappop(heap)[1])
+            for i in emptied:
+                buffers[i] = np.fromfile(files[i], dtype=dtype, count=block)
+                if len(buffers[i]):
+                    heapq.heappush(heap, (buffers[i][-1], i))
+    finally:
+        for f in files:
+            f.close()
+
+
+def external_sort(input_path, output_path, chunk=DEFAULT_CHUNK, fan_in=DEFAULT_FAN_IN, dtype=None,
+                  temp_dir=None, progress=None):
+    """Sort a number file of any size into output_path while holding about `chunk` numbers in memory.
+
+    Sorted runs of `chunk` numbers are spilled to temporary files, then
+    merged `fan_in` at a time in as many passes as needed until the last
+    pass writes output_path in the format its extension implies.
+    `progress(label, fraction)` is called after every run and merged block.
+    Returns the number of values sorted.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        runs, run_dtype = spill_runs(input_path, directory, chunk, dtype, progress)
+        total = sum(length for _, length in runs)
+        if not runs:
+            write_numbers(output_path, np.array([], dtype=run_dtype))
+            return 0
+        block = max(1, chunk // (fan_in + 1))
+        passes, count = 1, len(runs)
+        while count > fan_in:
+            count = -(-count // fan_in)
+            passes += 1
+        for number in range(1, passes + 1):
+            on_block = _pass_progress(progress, f"merge {number}/{passes}", total)
+            if number == passes:
+                with NumberWriter(output_path, run_dtype, total) as writer:
+                    merge_runs(runs, writer.write, run_dtype, block, on_block)
+                break
+            merged = []
+            for k in range(0, len(runs), fan_in):
+                group = runs[k:k + fan_in]
+                path = os.path.join(directory, f'pass{number}_{k // fan_in:06d}.bin')
+                with open(path, 'wb') as f:
+                    merge_runs(group, lambda values: values.tofile(f), run_dtype, block, on_block)
+                for run, _ in group:
+                    os.remove(run)
+                merged.append((path, sum(length for _, length in group)))
+            runs = merged
+    return total
+
+
+def _pass_progress(progress, label, total):
+    # Turn per-block counts into the fraction of a merge pass done.
+    done = 0
+
+    def on_block(count):
+        nonlocal done
+        done += count
+        if progress:
+            progress(label, done / total)
+
+    return on_block
@@ -0,0 +1,66 @@
+ARITIES = (2, 4, 8)  # children per node; 4 and 8 keep a node's children in one or two cache lines
+DEFAULT_ARITY = 4
+
+
+def sift_down_steps(arr, root, size, value, arity):
+    """Floyd's bottom-up sift-down of value into the hole at arr[root] of the d-ary max-heap arr[:size].
+
+    The hole follows the largest child down to a leaf without comparing
+    against value, then value climbs back up to its place, which is usually
+    near the bottom. Yields one compare step per level, between the node and
+    the child the hole moves to, with a 'tally' step for the other d - 2
+    comparisons of the child scan; a lone child needs no comparison and gets
+    no compare step. Each move yields one copy.
+    """
+    path = [root]
+    node = root
+    while True:
+        first = arity * node + 1
+        if first >= size:
+            break
+        last = min(first + arity, size)
+        best = first
+        for child in range(first + 1, last):
+            if arr[child] > arr[best]:
+                best = child
+        if last - first > 1:
+            yield 'compare', node, best
+            if last - first > 2:
+                yield 'tally', 0, last - first - 2
+        path.append(best)
+        node = best
+
+    # Deepest node on the path that is still larger than value.
+    t = len(path) - 1
+    while t > 0:
+        yield 'compare', path[t], root
+        if arr[path[t]] > value:
+            break
+        t -= 1
+    for level in range(1, t + 1):
+        arr[path[level - 1]] = arr[path[level]]
+        yield 'copy', path[level - 1], path[level]
+    if t > 0 or arr[root] != value:
+        arr[path[t]] = value
+        yield 'copy', path[t], -1
+
+
+def dary_heap_sort_steps(arr, arity=DEFAULT_ARITY):
+    """Iterative heapsort on a d-ary max-heap, yielding visualization steps.
+
+    A wider heap is shallower, so a sift-down visits fewer levels and scans
+    adjacent children at each one; Floyd's sift-down saves the comparison
+    against the sifted value on the way down. Scanning d - 1 children per
+    level costs more comparisons than a binary heap from d = 4 up; what the
+    wider heap saves is levels and element moves.
+    """
+    if arity not in ARITIES:
+        raise ValueError(f"arity must be one of {ARITIES}")
+    n = len(arr)
+    for i in range((n - 2) // arity, -1, -1):
+        yield from sift_down_steps(arr, i, n, arr[i], arity)
+    for end in range(n - 1, 0, -1):
+        value = arr[end]
+        arr[end] = arr[0]
+        yield 'copy', end, 0
+        yield from sift_down_steps(arr, 0, end, value, arity)
@@ -0,0 +1,231 @@
+import math
+
+INSERTION_CUTOFF = 16  # ranges this small are finished with insertion sort
+NINTHER_THRESHOLD = 128  # ranges larger than this pick the pivot with Tukey's ninther
+
+
+def insertion_sort_range_steps(arr, low, high):
+    """Insertion sort of arr[low..high] by adjacent swaps, yielding compare and swap steps."""
+    for i in range(low + 1, high + 1):
+        j = i
+        while j > low:
+            yield 'compare', j - 1, j
+            if arr[j - 1] <= arr[j]:
+                break
+            arr[j - 1], arr[j] = arr[j], arr[j - 1]
+            yield 'swap', j - 1, j
+            j -= 1
+
+
+def heap_sort_range_steps(arr, low, high):
+    """Heapsort of arr[low..high], yielding compare and swap steps."""
+    size = high - low + 1
+
+    def sift_down(root, end):
+        while 2 * root + 1 < end:
+            child = 2 * root + 1
+            if child + 1 < end:
+                yield 'compare', low + child, low + child + 1
+                if arr[low + child] < arr[low + child + 1]:
+                    child += 1
+            yield 'compare', low + root, low + child
+            if arr[low + root] >= arr[low + child]:
+                return
+            arr[low + root], arr[low + child] = arr[low + child], arr[low + root]
+            yield 'swap', low + root, low + child
+            root = child
+
+    for root in range(size // 2 - 1, -1, -1):
+        yield from sift_down(root, size)
+    for end in range(size - 1, 0, -1):
+        arr[low], arr[low + end] = arr[low + end], arr[low]
+        yield 'swap', low, low + end
+        yield from sift_down(0, end)
+
+
+def median_of_three_steps(arr, a, b, c):
+    """Yield the comparisons needed to find the median of arr[a], arr[b], arr[c]; returns its index."""
+    yield 'compare', a, b
+    if arr[a] > arr[b]:
+        a, b = b, a
+    yield 'compare', b, c
+    if arr[b] <= arr[c]:
+        return b
+    yield 'compare', a, c
+    return c if arr[a] <= arr[c] else a
+
+
+def choose_pivot_steps(arr, low, high):
+    """Move a median-of-three (or ninther) pivot to arr[low], yielding its steps."""
+    mid = (low + high) // 2
+    if high - low + 1 > NINTHER_THRESHOLD:
+        step = (high - low + 1) // 8
+        first = yield from median_of_three_steps(arr, low, low + step, low + 2 * step)
+        second = yield from median_of_three_steps(arr, mid - step, mid, mid + step)
+        third = yield from median_of_three_steps(arr, high - 2 * step, high - step, high)
+        pivot = yield from median_of_three_steps(arr, first, second, third)
+    else:
+        pivot = yield from median_of_three_steps(arr, low, mid, high)
+    if pivot != low:
+        arr[low], arr[pivot] = arr[pivot], arr[low]
+        yield 'swap', low, pivot
+    yield 'pivot', low, -1
+
+
+def partition3_steps(arr, low, high):
+    """Three-way partition of arr[low..high] around the pivot at arr[low].
+
+    Returns (lt, gt) such that arr[low..lt-1] < pivot, arr[lt..gt] == pivot
+    and arr[gt+1..high] > pivot, so runs of duplicates are never revisited.
+    """
+    pivot = arr[low]
+    lt, i, gt = low, low + 1, high
+    while i <= gt:
+        yield 'compare', i, lt
+        if arr[i] < pivot:
+            arr[lt], arr[i] = arr[i], arr[lt]
+            yield 'swap', lt, i
+            lt += 1
+            i += 1
+        elif arr[i] > pivot:
+            arr[i], arr[gt] = arr[gt], arr[i]
+            yield 'swap', i, gt
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def intro_sort_steps(arr, low=0, high=None):
+    """Introsort yielding visualization steps while sorting arr[low..high] (default: all of arr) in place.
+
+    Quicksort with an explicit stack, a median-of-three (ninther for large
+    ranges) pivot and three-way partitioning. Ranges of INSERTION_CUTOFF or
+    fewer elements are finished with insertion sort, and a range that is
+    still unsorted after 2*log2(n) partitioning levels falls back to heapsort.
+    """
+    if high is None:
+        high = len(arr) - 1
+    n = high - low + 1
+    if n < 2:
+        return
+    stack = [(low, high, 2 * int(math.log2(n)))]
+    while stack:
+        low, high, depth = stack.pop()
+        while high - low + 1 > INSERTION_CUTOFF and depth > 0:
+            depth -= 1
+            yield from choose_pivot_steps(arr, low, high)
+            lt, gt = yield from partition3_steps(arr, low, high)
+            # Keep the smaller side in this loop so the stack stays O(log n) deep.
+            if lt - low < high - gt:
+                stack.append((gt + 1, high, depth))
+                high = lt - 1
+            else:
+                stack.append((low, lt - 1, depth))
+                low = gt + 1
+        if high - low + 1 > INSERTION_CUTOFF:
+            yield from heap_sort_range_steps(arr, low, high)
+        elif high > low:
+            yield from insertion_sort_range_steps(arr, low, high)
+
+
+def intro_sort_range(arr, low=0, high=None):
+    """Introsort of arr[low..high] without visualization steps; returns (comparisons, swaps).
+
+    Same algorithm as intro_sort_steps, comparison for comparison, written as
+    plain loops so benchmarks and workers do not pay for a yield per step.
+    """
+    if high is None:
+        high = len(arr) - 1
+    n = high - low + 1
+    if n < 2:
+        return 0, 0
+    comparisons = swaps = 0
+
+    def median_of_three(a, b, c):
+        nonlocal comparisons
+        comparisons += 1
+        if arr[a] > arr[b]:
+            a, b = b, a
+        comparisons += 1
+        if arr[b] <= arr[c]:
+            return b
+        comparisons += 1
+        return c if arr[a] <= arr[c] else a
+
+    def heap_sort_range(low, high):
+        nonlocal comparisons, swaps
+        size = high - low + 1
+
+        def sift_down(root, end):
+            nonlocal comparisons, swaps
+            while 2 * root + 1 < end:
+                child = 2 * root + 1
+                if child + 1 < end:
+                    comparisons += 1
+                    if arr[low + child] < arr[low + child + 1]:
+                        child += 1
+                comparisons += 1
+                if arr[low + root] >= arr[low + child]:
+                    return
+                arr[low + root], arr[low + child] = arr[low + child], arr[low + root]
+                swaps += 1
+                root = child
+
+        for root in range(size // 2 - 1, -1, -1):
+            sift_down(root, size)
+        for end in range(size - 1, 0, -1):
+            arr[low], arr[low + end] = arr[low + end], arr[low]
+            swaps += 1
+            sift_down(0, end)
+
+    stack = [(low, high, 2 * int(math.log2(n)))]
+    while stack:
+        low, high, depth = stack.pop()
+        while high - low + 1 > INSERTION_CUTOFF and depth > 0:
+            depth -= 1
+            mid = (low + high) // 2
+            if high - low + 1 > NINTHER_THRESHOLD:
+                step = (high - low + 1) // 8
+                pivot = median_of_three(median_of_three(low, low + step, low + 2 * step),
+                                        median_of_three(mid - step, mid, mid + step),
+                                        median_of_three(high - 2 * step, high - step, high))
+            else:
+                pivot = median_of_three(low, mid, high)
+            if pivot != low:
+                arr[low], arr[pivot] = arr[pivot], arr[low]
+                swaps += 1
+            value = arr[low]
+            lt, i, gt = low, low + 1, high
+            while i <= gt:
+                comparisons += 1
+                if arr[i] < value:
+                    arr[lt], arr[i] = arr[i], arr[lt]
+                    swaps += 1
+                    lt += 1
+                    i += 1
+                elif arr[i] > value:
+                    arr[i], arr[gt] = arr[gt], arr[i]
+                    swaps += 1
+                    gt -= 1
+                else:
+                    i += 1
+            if lt - low < high - gt:
+                stack.append((gt + 1, high, depth))
+                high = lt - 1
+            else:
+                stack.append((low, lt - 1, depth))
+                low = gt + 1
+        if high - low + 1 > INSERTION_CUTOFF:
+            heap_sort_range(low, high)
+        else:
+            for i in range(low + 1, high + 1):
+                j = i
+                while j > low:
+                    comparisons += 1
+                    if arr[j - 1] <= arr[j]:
+                        break
+                    arr[j - 1], arr[j] = arr[j], arr[j - 1]
+                    swaps += 1
+                    j -= 1
+    return comparisons, swaps
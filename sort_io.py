@@ -0,0 +1,153 @@
+import os
+import warnings
+import numpy as np
+
+# Raw binary files are headerless native-endian integers; the extension gives the width.
+RAW_DTYPES = {'.i32': np.int32, '.int32': np.int32, '.i64': np.int64, '.int64': np.int64, '.bin': np.int64}
+
+TEXT_CHUNK_BYTES = 1 << 24
+WRITE_CHUNK = 1 << 20
+ECHO_LIMIT = 50  # arrays longer than this are summarized instead of printed
+
+
+def read_numbers(path, dtype=None):
+    """Load integers from a .npy, raw int32/int64 or whitespace-separated text file.
+
+    Binary files are memory-mapped rather than read, so opening them is
+    O(1); `dtype` overrides the width of a raw file. Text files are parsed in
+    chunks of TEXT_CHUNK_BYTES with NumPy instead of line by line in Python.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.npy':
+        return np.load(path, mmap_mode='r')
+    if dtype is not None or ext in RAW_DTYPES:
+        return np.memmap(path, dtype=dtype or RAW_DTYPES[ext], mode='r')
+    return np.concatenate([values for values, _ in _text_blocks(path)])
+
+
+def iter_numbers(path, chunk, dtype=None):
+    """Yield the numbers of a file in arrays of `chunk` (the last may be shorter) without loading it whole.
+
+    Each array comes with the fraction of the file consumed so far. Binary
+    files are sliced from their memory map; text files are parsed block by
+    block as in read_numbers.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.npy' or dtype is not None or ext in RAW_DTYPES:
+        values = read_numbers(path, dtype)
+        for start in range(0, len(values), chunk):
+            stop = min(start + chunk, len(values))
+            yield np.array(values[start:stop]), stop / len(values)
+        return
+    size = max(os.path.getsize(path), 1)
+    pending, count = [], 0
+    for values, position in _text_blocks(path):
+        pending.append(values)
+        count += len(values)
+        if count < chunk:
+            continue
+        joined = np.concatenate(pending)
+        stop = count - count % chunk
+        for start in range(0, stop, chunk):
+            yield joined[start:start + chunk], position / size
+        pending, count = [joined[stop:]], count - stop
+    if count:
+        yield np.concatenate(pending), 1.0
+
+
+def _text_blocks(path):
+    # Parse TEXT_CHUNK_BYTES at a time, yielding (numbers, bytes read so far).
+    with open(path, 'rb') as f:
+        tail = b''
+        while True:
+            block = f.read(TEXT_CHUNK_BYTES)
+            if not block:
+                break
+            # Keep any partial number at the end of the block for the next one.
+            block = tail + block
+            cut = max(block.rfind(c) for c in (b'\n', b'\r', b' ', b'\t')) + 1
+            tail = block[cut:]
+            yield _parse_text(block[:cut]), f.tell()
+        yield _parse_text(tail), f.tell()
+
+
+def _parse_text(data):
+    # Older NumPy versions warn instead of raising on malformed text.
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            return np.fromstring(data.decode(), dtype=np.int64, sep=' ')
+        except DeprecationWarning as e:
+            raise ValueError(str(e)) from None
+
+
+def write_numbers(path, values):
+    """Write integers in the format implied by path: .npy, raw int32/int64, or one per line."""
+    values = np.asarray(values)
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.npy':
+        np.save(path, values)
+    elif ext in RAW_DTYPES:
+        values.astype(RAW_DTYPES[ext], copy=False).tofile(path)
+    else:
+        with open(path, 'w') as f:
+            for start in range(0, len(values), WRITE_CHUNK):
+                f.write('\n'.join(map(str, values[start:start + WRITE_CHUNK].tolist())))
+                f.write('\n')
+
+
+class NumberWriter:
+    """Write integers block by block in the format implied by path, as write_numbers lays them out.
+
+    .npy output needs the total count up front, since its header holds the
+    shape. Use as a context manager.
+    """
+
+    def __init__(self, path, dtype, total):
+        ext = os.path.splitext(path)[1].lower()
+        self.array = self.file = None
+        self.position = 0
+        if ext == '.npy':
+            self.array = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(total,))
+        elif ext in RAW_DTYPES:
+            self.dtype = RAW_DTYPES[ext]
+            self.file = open(path, 'wb')
+        else:
+            self.dtype = None
+            self.file = open(path, 'w')
+
+    def write(self, values):
+        """Append a block of values."""
+        if self.array is not None:
+            self.array[self.position:self.position + len(values)] = values
+            self.position += len(values)
+        elif self.dtype is not None:
+            values.astype(self.dtype, copy=False).tofile(self.file)
+        else:
+            for start in range(0, len(values), WRITE_CHUNK):
+                self.file.write('\n'.join(map(str, values[start:start + WRITE_CHUNK].tolist())))
+                self.file.write('\n')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self.array is not None:
+            self.array.flush()
+            self.array = None
+        if self.file is not None:
+            self.file.close()
+
+
+def random_numbers(n, min_val, max_val, seed=None):
+    """Draw n uniform integers from [min_val, max_val] in one vectorized call."""
+    return np.random.default_rng(seed).integers(min_val, max_val, size=n, endpoint=True, dtype=np.int64)
+
+
+def describe_numbers(label, values):
+    """Print small arrays in full and only a summary of large ones."""
+    if len(values) <= ECHO_LIMIT:
+        print(f"{label}:", np.asarray(values).tolist())
+    else:
+        print(f"{label}: {len(values)} numbers, min {values.min()}, max {values.max()}, "
+              f"first {np.asarray(values[:5]).tolist()}")
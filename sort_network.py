@@ -0,0 +1,51 @@
+import numpy as np
+
+
+def network_stages(n):
+    """(p, r, d) of each stage of Batcher's merge-exchange network for n elements, in order.
+
+    A stage compares arr[i] with arr[i + d] for every i < n - d with
+    i & p == r; those pairs are disjoint, so a stage can run all at once.
+    This is Batcher's odd-even merge network in Knuth's form, which works
+    for any n, not only powers of two, in t(t+1)/2 stages for t = ceil(log2 n).
+    """
+    if n < 2:
+        return
+    t = (n - 1).bit_length()
+    p = 1 << (t - 1)
+    while p > 0:
+        q, r, d = 1 << (t - 1), 0, p
+        while d > 0:
+            yield p, r, d
+            d, q, r = q - p, q >> 1, p
+        p >>= 1
+
+
+def network_stage_count(n):
+    """Number of stages network_stages(n) yields."""
+    t = (n - 1).bit_length() if n > 1 else 0
+    return t * (t + 1) // 2
+
+
+def compare_exchange(values, p, r, d):
+    """Run one network stage on a NumPy array in place; returns the number of comparators."""
+    i = np.arange(len(values) - d)
+    i = i[(i & p) == r]
+    low, high = values[i], values[i + d]
+    values[i] = np.minimum(low, high)
+    values[i + d] = np.maximum(low, high)
+    return len(i)
+
+
+def network_sort_steps(arr):
+    """Sort arr in place with Batcher's merge-exchange network, yielding one 'stage' step per stage.
+
+    Every stage is a single vectorized compare-exchange over the whole
+    array, so n elements take O(log^2 n) frames. A stage step carries the
+    comparator distance in idx1 and the number of comparators in idx2.
+    """
+    values = np.asarray(arr)
+    for p, r, d in network_stages(len(arr)):
+        comparators = compare_exchange(values, p, r, d)
+        arr[:] = values.tolist()
+        yield 'stage', d, comparators
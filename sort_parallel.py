@@ -0,0 +1,119 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from sort_intro import intro_sort_range, intro_sort_steps
+
+DEFAULT_WORKERS = 4
+MAX_WORKERS = 16  # workers the visualization has distinct colors for
+OVERSAMPLE = 16  # samples drawn from each worker's block to choose the splitters
+
+
+def block_bounds(n, workers):
+    """Start of each of `workers` near-equal blocks of n elements, followed by n."""
+    return [w * n // workers for w in range(workers + 1)]
+
+
+def choose_splitters(values, workers, seed=0):
+    """Pick workers - 1 splitters from OVERSAMPLE random samples per block.
+
+    Returns the splitter values and the indices they were sampled from.
+    """
+    rng = np.random.default_rng(seed)
+    bounds = block_bounds(len(values), workers)
+    sample = np.concatenate([rng.integers(lo, hi, size=min(OVERSAMPLE, hi - lo))
+                             for lo, hi in zip(bounds, bounds[1:]) if hi > lo])
+    sample = sample[np.argsort(values[sample], kind='stable')]
+    picks = sample[np.arange(1, workers) * len(sample) // workers]
+    return values[picks], picks
+
+
+def bucket_bounds(values, splitters, workers):
+    """Stable order that groups values by bucket, and the start of each bucket followed by n."""
+    bucket = np.searchsorted(splitters, values, side='right')
+    order = np.argsort(bucket, kind='stable')
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(bucket, minlength=workers))))
+    return order, bounds.tolist()
+
+
+def sample_sort_steps(arr, workers=DEFAULT_WORKERS, seed=0):
+    """Sample sort across `workers` simulated workers, yielding visualization steps.
+
+    'owner' steps assign bars to workers: first equal blocks, then after the
+    splitters (shown as 'pivot' steps) scatter the array into buckets, one
+    bucket per worker. The buckets are then introsorted with the workers'
+    steps interleaved round-robin, as they would run side by side, and each
+    finished bucket is shown with a 'merged' step.
+    """
+    if not 1 <= workers <= MAX_WORKERS:
+        raise ValueError(f"workers must be between 1 and {MAX_WORKERS}")
+    n = len(arr)
+    if n < 2:
+        return
+    bounds = block_bounds(n, workers)
+    for w in range(workers):
+        if bounds[w] < bounds[w + 1]:
+            yield 'owner', bounds[w], w
+    values = np.asarray(arr)
+    splitters, picks = choose_splitters(values, workers, seed)
+    for k in picks.tolist():
+        yield 'pivot', k, -1
+    order, bounds = bucket_bounds(values, splitters, workers)
+    arr[:] = values[order].tolist()
+    yield 'scatter', -1, -1
+    for w in range(workers):
+        if bounds[w] < bounds[w + 1]:
+            yield 'owner', bounds[w], w
+
+    running = [(intro_sort_steps(arr, lo, hi - 1), lo, hi) for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+    while running:
+        for task in list(running):
+            step = next(task[0], None)
+            if step is None:
+                running.remove(task)
+                yield 'merged', task[1], task[2] - 1
+            else:
+                yield step
+
+
+def sort_bucket(name, dtype, n, lo, hi):
+    """Worker: introsort shared[lo:hi] of the shared-memory array `name`; returns (comparisons, moves)."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        shared = np.ndarray((n,), dtype=dtype, buffer=shm.buf)
+        bucket = shared[lo:hi].tolist()
+        comparisons, moves = intro_sort_range(bucket)
+        shared[lo:hi] = bucket
+        del shared
+    finally:
+        shm.close()
+    return comparisons, moves
+
+
+def parallel_sample_sort(arr, workers=DEFAULT_WORKERS, seed=0):
+    """Sample sort with the buckets introsorted in `workers` processes over shared memory.
+
+    Splitters and the scatter into buckets are vectorized in this process;
+    the array then lives in one multiprocessing.shared_memory block that each
+    worker sorts its own slice of in place, so no element is pickled. Returns
+    (comparisons, moves) like the other untraced engines.
+    """
+    n = len(arr)
+    if n < 2:
+        return 0, 0
+    values = np.asarray(arr)
+    splitters, _ = choose_splitters(values, workers, seed)
+    order, bounds = bucket_bounds(values, splitters, workers)
+    shm = shared_memory.SharedMemory(create=True, size=values.nbytes)
+    try:
+        shared = np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)
+        shared[:] = values[order]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(sort_bucket, shm.name, values.dtype.str, n, lo, hi)
+                       for lo, hi in zip(bounds, bounds[1:]) if hi - lo > 1]
+            counts = [future.result() for future in futures]
+        arr[:] = shared.tolist()
+        del shared
+    finally:
+        shm.close()
+        shm.unlink()
+    return sum(c for c, _ in counts), n + sum(m for _, m in counts)
@@ -0,0 +1,78 @@
+import numpy as np
+
+DEFAULT_RADIX = 256
+
+
+def radix_keys(values):
+    """Map an integer array to unsigned keys with the same order, starting at 0.
+
+    Subtracting the minimum (modulo 2**64) shifts negative numbers into the
+    unsigned range and keeps the keys as small as the data allows, so fewer
+    digit passes are needed.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind not in 'iu':
+        raise TypeError("radix sort needs integer values")
+    if values.dtype.kind == 'i':
+        values = values.astype(np.int64, copy=False)
+        return values.view(np.uint64) - np.uint64(int(values.min()) % 2 ** 64)
+    values = values.astype(np.uint64, copy=False)
+    return values - values.min()
+
+
+def _digit_dtype(radix):
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if radix - 1 <= np.iinfo(dtype).max:
+            return dtype
+    return np.uint64
+
+
+def radix_sort_passes(values, radix=DEFAULT_RADIX):
+    """Stable LSD radix sort of an integer array, yielding the reordered array after each digit pass.
+
+    At least one pass is made, even when every key is equal.
+    """
+    if radix < 2:
+        raise ValueError("radix must be at least 2")
+    values = np.asarray(values)
+    if len(values) < 2:
+        return
+    keys = radix_keys(values)
+    max_key = int(keys.max())
+    digit_dtype = _digit_dtype(radix)
+    # Power-of-two radixes extract digits with a shift and mask instead of a division.
+    shift = radix.bit_length() - 1 if radix & (radix - 1) == 0 else None
+    divisor, bits = 1, 0
+    while True:
+        if shift is None:
+            digits = keys // np.uint64(divisor) % np.uint64(radix)
+        else:
+            digits = (keys >> np.uint64(bits)) & np.uint64(radix - 1)
+        # NumPy's stable sort is a counting/radix sort for 8- and 16-bit digits.
+        order = np.argsort(digits.astype(digit_dtype), kind='stable')
+        keys = keys[order]
+        values = values[order]
+        yield values
+        divisor *= radix
+        bits += shift or 0
+        if divisor > max_key:
+            break
+
+
+def radix_pass_count(values, radix=DEFAULT_RADIX):
+    """Number of digit passes radix_sort_passes makes over values."""
+    if len(values) < 2:
+        return 0
+    span = max(values) - min(values)
+    passes = 1
+    while span >= radix:
+        span //= radix
+        passes += 1
+    return passes
+
+
+def radix_sort_steps(arr, radix=DEFAULT_RADIX):
+    """LSD radix sort of a list of integers in place, yielding one 'pass_complete' step per digit pass."""
+    for values in radix_sort_passes(arr, radix):
+        arr[:] = values.tolist()
+        yield 'pass_complete', -1, -1
@@ -0,0 +1,239 @@
+import numpy as np
+from matplotlib import colormaps
+from matplotlib.colors import to_rgba
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
+from sort_trace import ACTION_WRITES, RANGE
+from sort_parallel import MAX_WORKERS
+
+BASE_COLOR = 'lightblue'
+DONE_COLOR = 'lightgreen'
+RUN_COLOR = 'plum'
+BAR_WIDTH = 0.8
+
+# Body colors of bars owned by workers 0, 1, ... ('owner' steps): five hues, then lighter shades of them.
+OWNER_COLORS = [colormaps['tab20b'](4 * (w % 5) + w // 5) for w in range(MAX_WORKERS)]
+
+# Colors used for (idx1, idx2) by each highlighting action.
+HIGHLIGHTS = {
+    'compare': ('yellow', 'orange'),
+    'digit': ('yellow', 'orange'),
+    'swap': ('red', 'pink'),
+    'copy': ('red', 'pink'),
+    'copy_back': ('red', 'pink'),
+    'pivot': ('green', None),
+}
+
+# Actions that highlight the whole range idx1..idx2 in one color.
+RANGE_HIGHLIGHTS = {
+    'merged': DONE_COLOR,
+    'run': RUN_COLOR,
+    'merge_block': DONE_COLOR,
+    'count': 'gold',
+    'place': DONE_COLOR,
+}
+
+# Up to this many bars are drawn as vector paths; larger arrays use a raster.
+VECTOR_LIMIT = 512
+RASTER_COLUMNS = 1024
+RASTER_ROWS = 256
+
+
+class BarRenderer:
+    """Bar chart for sorting animations that only touches bars that changed.
+
+    Each frame updates the heights written by the current step and the colors
+    of the bars highlighted by the current and previous steps, then returns a
+    handful of artists so FuncAnimation (with blit=True) redraws them over the
+    cached axes background instead of redrawing the whole figure.
+
+    Small arrays are drawn as one compound path in the body color plus one
+    overlay path per highlight color. Larger arrays are drawn as a single
+    image with at most RASTER_COLUMNS columns, each filled from the zero line
+    to the tallest and the most negative bar of its bucket, so the cost of a
+    frame does not grow with n. Bars assigned to
+    a worker by 'owner' steps take that worker's color from OWNER_COLORS.
+    """
+
+    def __init__(self, ax, values):
+        self.ax = ax
+        self.n = len(values)
+        self.values = np.asarray(values, dtype=float)
+        self.highlighted = {}
+        self.done = False
+        self.owner = np.full(self.n, -1)
+        self.owners_changed = False
+        self.vector = self.n <= VECTOR_LIMIT
+        if self.vector:
+            self._init_vector()
+        else:
+            self._init_raster()
+
+    def _init_vector(self):
+        x = np.arange(self.n, dtype=float)
+        verts = np.zeros((self.n, 5, 2))
+        verts[:, [0, 1, 4], 0] = (x - BAR_WIDTH / 2)[:, None]
+        verts[:, [2, 3], 0] = (x + BAR_WIDTH / 2)[:, None]
+        verts[:, [1, 2], 1] = self.values[:, None]
+        path = Path(verts.reshape(-1, 2), self._codes(self.n))
+        # Bar k occupies rows 5k..5k+4 of the path's vertices.
+        self.bar_verts = path.vertices.reshape(self.n, 5, 2)
+        self.body = PathPatch(path, facecolor=BASE_COLOR, edgecolor='none')
+        self.body.sticky_edges.y.append(0)
+        self.ax.add_patch(self.body)
+        # One patch per worker, pointing at its contiguous slice of the body's vertices.
+        self.owner_patches = []
+        for color in OWNER_COLORS:
+            patch = PathPatch(Path(np.zeros((0, 2))), facecolor=color, edgecolor='none')
+            self.ax.add_patch(patch)
+            self.owner_patches.append(patch)
+        self.overlays = {}
+        for color in sorted({c for pair in HIGHLIGHTS.values() for c in pair if c} | set(RANGE_HIGHLIGHTS.values())):
+            overlay = PathPatch(Path(np.zeros((0, 2))), facecolor=color, edgecolor='none')
+            self.ax.add_patch(overlay)
+            self.overlays[color] = overlay
+        self.ax.autoscale_view()
+        self._artists = [self.body] + self.owner_patches + list(self.overlays.values())
+
+    def _init_raster(self):
+        self.bucket = -(-self.n // RASTER_COLUMNS)
+        columns = -(-self.n // self.bucket)
+        if self.ax.get_autoscaley_on():
+            self.ax.set_ylim(min(self.values.min(), 0) * 1.05, max(self.values.max(), 1) * 1.05)
+        if self.ax.get_autoscalex_on():
+            self.ax.set_xlim(-0.5, self.n - 0.5)
+        self.ymin, self.ymax = self.ax.get_ylim()
+        self.rgba = {}
+        self.pixels = np.zeros((RASTER_ROWS, columns, 4), dtype=np.uint8)
+        self.image = self.ax.imshow(self.pixels, origin='lower', aspect='auto', interpolation='nearest',
+                                    extent=(-0.5, columns * self.bucket - 0.5, self.ymin, self.ymax))
+        self._paint_columns(range(columns))
+        self._artists = [self.image]
+
+    @staticmethod
+    def _codes(count):
+        return np.tile([Path.MOVETO, Path.LINETO, Path.LINETO, Path.LINETO, Path.CLOSEPOLY],
+                       count).astype(Path.code_type)
+
+    def _color_bytes(self, color):
+        if color not in self.rgba:
+            self.rgba[color] = np.array(to_rgba(color)) * 255
+        return self.rgba[color]
+
+    def _row(self, value):
+        """Raster row boundary at height value, clamped to the image."""
+        row = int((value - self.ymin) / (self.ymax - self.ymin) * RASTER_ROWS)
+        return min(max(row, 0), RASTER_ROWS)
+
+    def _paint_columns(self, columns):
+        """Redraw the given raster columns from the bar values and highlights."""
+        body = DONE_COLOR if self.done else BASE_COLOR
+        pixels, bucket, values = self.pixels, self.bucket, self.values
+        for c in columns:
+            start = c * bucket
+            column = values[start:start + bucket]
+            # Filled from the zero line up to the tallest bar and down to the most negative one.
+            low, high = self._row(min(column.min(), 0)), self._row(max(column.max(), 0))
+            color = body
+            if not self.done and self.owner[start] >= 0:
+                color = OWNER_COLORS[self.owner[start] % len(OWNER_COLORS)]
+            for k in range(start, min(start + bucket, self.n)):
+                if k in self.highlighted:
+                    color = self.highlighted[k]
+                    break
+            pixels[:low, c] = 0
+            pixels[low:high, c] = self._color_bytes(color)
+            pixels[high:, c] = 0
+
+    def heights(self):
+        """Return the bar heights currently shown."""
+        return self.values.tolist()
+
+    def set_owners(self, owner_steps):
+        """Rebuild bar ownership from the (idx1, idx2) of every 'owner' step so far, e.g. after a seek."""
+        self.owner[:] = -1
+        for start, worker in owner_steps:
+            self.owner[start:] = worker
+        self.owners_changed = True
+
+    def init(self):
+        """FuncAnimation init_func: keep the bars as they are and mark them for blitting."""
+        return self._artists
+
+    def update(self, state, action, idx1, idx2, resync=False):
+        """Apply one (state, action, idx1, idx2) frame and return the artists to redraw.
+
+        Pass resync=True when earlier frames were skipped, so every bar is
+        refreshed from state instead of only the ones this step wrote.
+        """
+        n = self.n
+        writes = ACTION_WRITES[action]
+        full = resync or writes is None
+        if full:
+            written = range(n)
+            self.values[:] = state
+        elif writes == RANGE:
+            written = range(max(0, idx1), min(n, idx2 + 1))
+            self.values[written.start:written.stop] = state[written.start:written.stop]
+        else:
+            indices = (idx1, idx2)
+            written = [indices[slot] for slot in writes if 0 <= indices[slot] < n]
+            for k in written:
+                self.values[k] = state[k]
+
+        if action == 'owner':
+            # Bars idx1 onwards now belong to worker idx2.
+            self.owner[idx1:] = idx2
+            self.owners_changed = True
+
+        previous, was_done = self.highlighted, self.done
+        highlighted = {}
+        if action in ('pass_complete', 'complete'):
+            self.done = True
+        else:
+            self.done = False
+            if action in HIGHLIGHTS:
+                for k, color in zip((idx1, idx2), HIGHLIGHTS[action]):
+                    if color is not None and 0 <= k < n:
+                        highlighted[k] = color
+            elif action in RANGE_HIGHLIGHTS and idx1 != -1 and idx2 != -1:
+                highlighted = dict.fromkeys(range(max(0, idx1), min(n, idx2 + 1)), RANGE_HIGHLIGHTS[action])
+        self.highlighted = highlighted
+
+        if self.vector:
+            self._update_vector(written)
+        elif self.done != was_done or full or self.owners_changed:
+            self.owners_changed = False
+            self._paint_columns(range(self.pixels.shape[1]))
+            self.image.set_data(self.pixels)
+        else:
+            changed = set(written) | set(previous) | set(highlighted)
+            self._paint_columns({k // self.bucket for k in changed})
+            self.image.set_data(self.pixels)
+        return self._artists
+
+    def _update_vector(self, written):
+        if len(written) == self.n:
+            self.bar_verts[:, 1:3, 1] = self.values[:, None]
+        else:
+            for k in written:
+                self.bar_verts[k, 1:3, 1] = self.values[k]
+        self.body.set_facecolor(DONE_COLOR if self.done else BASE_COLOR)
+        if self.owners_changed:
+            self.owners_changed = False
+            for worker, patch in enumerate(self.owner_patches):
+                owned = np.flatnonzero(self.owner == worker)
+                lo, hi = (owned[0], owned[-1] + 1) if len(owned) else (0, 0)
+                patch.set_path(Path(self.bar_verts[lo:hi].reshape(-1, 2), self._codes(hi - lo)))
+        for patch in self.owner_patches:
+            patch.set_visible(not self.done)
+        # Overlays hold copies of just the highlighted bars, grouped by color.
+        groups = {}
+        for k, color in self.highlighted.items():
+            groups.setdefault(color, []).append(k)
+        for color, overlay in self.overlays.items():
+            indices = groups.get(color, ())
+            if indices:
+                overlay.set_path(Path(self.bar_verts[indices].reshape(-1, 2), self._codes(len(indices))))
+            elif len(overlay.get_path().vertices):
+                overlay.set_path(Path(np.zeros((0, 2))))
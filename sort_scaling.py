@@ -0,0 +1,138 @@
+import csv
+import os
+import time
+import numpy as np
+from sort_benchmark import QUADRATIC, calibrate, predict_seconds
+from sort_io import random_numbers
+
+SCALING_SIZES = [2 ** k for k in range(8, 21)]
+
+
+class StepCounter:
+    """Step sink that only counts steps, so timed runs pay almost nothing for the step protocol."""
+
+    def __init__(self):
+        self.steps = 0
+
+    def __len__(self):
+        return self.steps
+
+    def record(self, action, idx1=-1, idx2=-1):
+        """Count one step."""
+        self.steps += 1
+
+    def extend(self, steps):
+        """Drain a step generator, counting its steps."""
+        self.steps += sum(1 for _ in steps)
+
+
+def run_scaling(sort_visual, algos, sizes=SCALING_SIZES, budget=10.0, seed=0):
+    """Time each algorithm on random inputs of every size, returning one result dict per (algorithm, size).
+
+    `sort_visual(algo, arr, states)` runs an algorithm's *_visual function.
+    Inputs are uniform integers in [0, n]. Once a size is predicted to take
+    longer than `budget` seconds, it and the larger sizes are skipped, which
+    retires the quadratic sorts early.
+    """
+    results = []
+    for algo in algos:
+        last = calibrate(lambda arr: sort_visual(algo, arr, StepCounter()), seed=seed) if algo in QUADRATIC else None
+        for n in sorted(sizes):
+            record = {'algorithm': algo, 'n': n, 'seconds': None, 'steps': None, 'note': ''}
+            results.append(record)
+            if last is not None and predict_seconds(algo, last[0], last[1], n) > budget:
+                record['note'] = f"skipped: predicted over {budget:g}s budget"
+                continue
+            arr = random_numbers(n, 0, n, seed).tolist()
+            sink = StepCounter()
+            start = time.perf_counter()
+            try:
+                sort_visual(algo, arr, sink)
+            except RecursionError:
+                record['note'] = "failed: RecursionError"
+                last = (n, budget)
+                continue
+            except (TypeError, ValueError) as e:
+                record['note'] = f"failed: {e}"
+                continue
+            elapsed = time.perf_counter() - start
+            record.update(seconds=elapsed, steps=sink.steps)
+            last = (n, elapsed)
+            print(f"{algo:<10} n={n:<8} {elapsed * 1000:10.2f} ms {sink.steps:>12} steps")
+    return results
+
+
+def fit_exponent(sizes, values):
+    """Slope of the least-squares line through (log n, log value), i.e. k in value ~ n^k."""
+    slope, _ = np.polyfit(np.log(sizes), np.log(values), 1)
+    return float(slope)
+
+
+def fit_exponents(results):
+    """Fit time and step growth exponents per algorithm; None where fewer than two sizes ran."""
+    fits = {}
+    for algo in dict.fromkeys(r['algorithm'] for r in results):
+        measured = [r for r in results if r['algorithm'] == algo and r['seconds'] is not None]
+        fit = {'time_exponent': None, 'step_exponent': None}
+        if len(measured) >= 2:
+            sizes = [r['n'] for r in measured]
+            fit['time_exponent'] = fit_exponent(sizes, [r['seconds'] for r in measured])
+            fit['step_exponent'] = fit_exponent(sizes, [max(r['steps'], 1) for r in measured])
+        fits[algo] = fit
+    return fits
+
+
+def format_scaling_table(results, fits):
+    """Milliseconds per algorithm and size with the fitted exponents, plus the fastest algorithm at each size."""
+    sizes = sorted(dict.fromkeys(r['n'] for r in results))
+    times = {(r['algorithm'], r['n']): r['seconds'] for r in results}
+
+    def exponent(value):
+        return f"{value:>8.2f}" if value is not None else f"{'-':>8}"
+
+    lines = [f"{'algorithm':<10} {'time k':>8} {'steps k':>8} " + ' '.join(f"{n:>9}" for n in sizes)]
+    for algo, fit in fits.items():
+        cells = []
+        for n in sizes:
+            seconds = times.get((algo, n))
+            cells.append(f"{seconds * 1000:>9.2f}" if seconds is not None else f"{'-':>9}")
+        lines.append(f"{algo:<10} {exponent(fit['time_exponent'])} {exponent(fit['step_exponent'])} " + ' '.join(cells))
+    fastest = []
+    for n in sizes:
+        timed = [(times[(algo, n)], algo) for algo in fits if times.get((algo, n)) is not None]
+        fastest.append(f"{min(timed)[1] if timed else '-':>9}")
+    lines.append(f"{'fastest':<10} {'':>8} {'':>8} " + ' '.join(fastest))
+    return '\n'.join(lines)
+
+
+def write_scaling_report(results, fits, directory):
+    """Write scaling.csv (raw measurements), scaling.txt (the table) and scaling.png (a log-log plot)."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, 'scaling.csv'), 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+        writer.writeheader()
+        writer.writerows(results)
+    with open(os.path.join(directory, 'scaling.txt'), 'w') as f:
+        f.write("Time per sort in ms; k is the fitted exponent in time ~ n^k\n\n")
+        f.write(format_scaling_table(results, fits) + '\n')
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    for algo, fit in fits.items():
+        measured = [r for r in results if r['algorithm'] == algo and r['seconds'] is not None]
+        if not measured:
+            continue
+        label = algo if fit['time_exponent'] is None else f"{algo} (n^{fit['time_exponent']:.2f})"
+        ax.plot([r['n'] for r in measured], [r['seconds'] for r in measured], marker='o', label=label)
+    ax.set_xscale('log', base=2)
+    ax.set_yscale('log')
+    ax.set_xlabel('n')
+    ax.set_ylabel('seconds')
+    ax.set_title('Sort time vs. input size')
+    ax.grid(True, which='both', alpha=0.3)
+    ax.legend()
+    fig.savefig(os.path.join(directory, 'scaling.png'), dpi=100)
+    plt.close(fig)
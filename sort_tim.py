@@ -0,0 +1,378 @@
+MIN_MERGE = 64  # arrays shorter than this become a single binary-insertion-sorted run
+MIN_GALLOP = 7  # consecutive wins by one run before merging switches to galloping
+
+
+def min_run_length(n):
+    """Timsort's minrun: n itself below MIN_MERGE, else a value in [32, 64] that makes n / minrun close to a power of two."""
+    r = 0
+    while n >= MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def count_run_steps(arr, lo, n):
+    """Find the natural run starting at lo, reversing it if strictly descending; returns its length."""
+    if lo + 1 == n:
+        return 1
+    hi = lo + 1
+    yield 'compare', lo, hi
+    if arr[hi] < arr[lo]:
+        while hi + 1 < n:
+            yield 'compare', hi, hi + 1
+            if not arr[hi + 1] < arr[hi]:
+                break
+            hi += 1
+        i, j = lo, hi
+        while i < j:
+            arr[i], arr[j] = arr[j], arr[i]
+            yield 'swap', i, j
+            i += 1
+            j -= 1
+    else:
+        while hi + 1 < n:
+            yield 'compare', hi, hi + 1
+            if arr[hi + 1] < arr[hi]:
+                break
+            hi += 1
+    return hi - lo + 1
+
+
+def binary_insertion_steps(arr, lo, hi, start):
+    """Extend the sorted run arr[lo:start] to arr[lo:hi] with stable binary insertion."""
+    for i in range(start, hi):
+        pivot = arr[i]
+        left, right = lo, i
+        while left < right:
+            mid = (left + right) // 2
+            yield 'compare', i, mid
+            if pivot < arr[mid]:
+                right = mid
+            else:
+                left = mid + 1
+        for p in range(i, left, -1):
+            arr[p] = arr[p - 1]
+            yield 'copy', p, p - 1
+        if left != i:
+            arr[left] = pivot
+            yield 'copy', left, -1
+
+
+def gallop(seq, key, base, length, right, probes=None):
+    """Count the leading elements of seq[base:base+length] that are < key (<= key if right).
+
+    Probes 1, 3, 7, ... elements ahead and then binary-searches the last gap,
+    so a long block that belongs together is found in O(log k) comparisons.
+    Returns (count, comparisons), appending each probed position to `probes`
+    when a list is given.
+    """
+    def before(value):
+        return value <= key if right else value < key
+
+    comparisons = 0
+    last, ofs = 0, 1
+    while ofs <= length:
+        comparisons += 1
+        if probes is not None:
+            probes.append(base + ofs - 1)
+        if not before(seq[base + ofs - 1]):
+            break
+        last, ofs = ofs, ofs * 2 + 1
+    lo, hi = last, min(ofs - 1, length)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        comparisons += 1
+        if probes is not None:
+            probes.append(base + mid)
+        if before(seq[base + mid]):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo, comparisons
+
+
+def gallop_steps(seq, key, key_idx, base, length, right, probe_base=None):
+    """gallop, yielding a compare step per probe; returns the count.
+
+    `probe_base` maps probe positions to array indices for the compare steps
+    (None when seq is the temporary buffer).
+    """
+    probes = []
+    count, _ = gallop(seq, key, base, length, right, probes)
+    for position in probes:
+        yield 'compare', key_idx, -1 if probe_base is None else probe_base + position
+    return count
+
+
+def merge_runs_steps(arr, base1, len1, len2):
+    """Stable merge of the adjacent runs arr[base1:base1+len1] and the len2 elements after it."""
+    base2 = base1 + len1
+    end2 = base2 + len2
+    # Elements of run 1 no larger than run 2's head, and of run 2 no smaller
+    # than run 1's tail, are already in place.
+    skip = yield from gallop_steps(arr, arr[base2], base2, base1, len1, True, 0)
+    base1 += skip
+    len1 -= skip
+    if len1 == 0:
+        return
+    len2 = yield from gallop_steps(arr, arr[base2 - 1], base2 - 1, base2, len2, False, 0)
+    end2 = base2 + len2
+    if len2 == 0:
+        return
+
+    temp = arr[base1:base2]
+    i, j, k = 0, base2, base1
+    while i < len1 and j < end2:
+        # One element at a time until one run wins MIN_GALLOP times in a row.
+        wins1 = wins2 = 0
+        while i < len1 and j < end2 and wins1 < MIN_GALLOP and wins2 < MIN_GALLOP:
+            yield 'compare', k, j
+            if arr[j] < temp[i]:
+                arr[k] = arr[j]
+                yield 'copy', k, j
+                j += 1
+                wins1, wins2 = 0, wins2 + 1
+            else:
+                arr[k] = temp[i]
+                yield 'copy', k, -1
+                i += 1
+                wins1, wins2 = wins1 + 1, 0
+            k += 1
+        # Galloping: move whole blocks while they stay long.
+        while i < len1 and j < end2:
+            count1 = yield from gallop_steps(temp, arr[j], j, i, len1 - i, True)
+            for _ in range(count1):
+                arr[k] = temp[i]
+                yield 'copy', k, -1
+                i += 1
+                k += 1
+            if i == len1:
+                break
+            arr[k] = arr[j]
+            yield 'copy', k, j
+            j += 1
+            k += 1
+            if j == end2:
+                break
+            count2 = yield from gallop_steps(arr, temp[i], -1, j, end2 - j, False, 0)
+            for _ in range(count2):
+                arr[k] = arr[j]
+                yield 'copy', k, j
+                j += 1
+                k += 1
+            if j == end2:
+                break
+            arr[k] = temp[i]
+            yield 'copy', k, -1
+            i += 1
+            k += 1
+            if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                break
+    # Whatever is left of run 2 is already in place; run 1's leftovers go before it.
+    while i < len1:
+        arr[k] = temp[i]
+        yield 'copy', k, -1
+        i += 1
+        k += 1
+
+
+def merge_index(runs):
+    """Index k of the runs k, k + 1 that Timsort's stack invariants want merged next, or None if they hold.
+
+    The invariants keep run lengths decreasing fast enough that merges stay balanced.
+    """
+    k = len(runs) - 2
+    if k < 0:
+        return None
+    if (k > 0 and runs[k - 1][1] <= runs[k][1] + runs[k + 1][1]) or \
+            (k > 1 and runs[k - 2][1] <= runs[k - 1][1] + runs[k][1]):
+        if runs[k - 1][1] < runs[k + 1][1]:
+            k -= 1
+    elif runs[k][1] > runs[k + 1][1]:
+        return None
+    return k
+
+
+def final_merge_index(runs):
+    """Index k of the runs k, k + 1 to merge next once the input is exhausted."""
+    k = len(runs) - 2
+    if k > 0 and runs[k - 1][1] < runs[k + 1][1]:
+        k -= 1
+    return k
+
+
+def pop_merge(runs, k):
+    """Combine runs k and k + 1 on the stack; returns (base1, len1, len2) of the merge to perform."""
+    base1, len1 = runs[k]
+    len2 = runs[k + 1][1]
+    runs[k] = (base1, len1 + len2)
+    del runs[k + 1]
+    return base1, len1, len2
+
+
+def tim_sort_steps(arr):
+    """Natural merge sort in the style of Timsort, yielding visualization steps.
+
+    Existing ascending and strictly descending runs are detected (descending
+    ones are reversed), short runs are extended to minrun with binary
+    insertion and shown with a 'run' step, and runs are merged under Timsort's
+    stack invariants with galloping. Nearly sorted input needs close to O(n)
+    work.
+    """
+    n = len(arr)
+    if n < 2:
+        return
+    minrun = min_run_length(n)
+    runs = []
+
+    def merge_at(k):
+        base1, len1, len2 = pop_merge(runs, k)
+        yield from merge_runs_steps(arr, base1, len1, len2)
+        yield 'merged', base1, base1 + len1 + len2 - 1
+
+    lo = 0
+    while lo < n:
+        run_len = yield from count_run_steps(arr, lo, n)
+        if run_len < minrun:
+            forced = min(minrun, n - lo)
+            yield from binary_insertion_steps(arr, lo, lo + forced, lo + run_len)
+            run_len = forced
+        yield 'run', lo, lo + run_len - 1
+        runs.append((lo, run_len))
+        lo += run_len
+        k = merge_index(runs)
+        while k is not None:
+            yield from merge_at(k)
+            k = merge_index(runs)
+
+    while len(runs) > 1:
+        yield from merge_at(final_merge_index(runs))
+
+
+def tim_sort(arr):
+    """tim_sort_steps without visualization steps; returns (comparisons, moves).
+
+    Shares min_run_length, gallop and the run-stack policy with
+    tim_sort_steps and counts the comparisons and copies it would yield,
+    but moves elements with slice assignments instead of one step each.
+    """
+    n = len(arr)
+    if n < 2:
+        return 0, 0
+    comparisons = moves = 0
+
+    def merge_runs(base1, len1, len2):
+        nonlocal comparisons, moves
+        base2 = base1 + len1
+        skip, probes = gallop(arr, arr[base2], base1, len1, True)
+        comparisons += probes
+        base1 += skip
+        len1 -= skip
+        if len1 == 0:
+            return
+        len2, probes = gallop(arr, arr[base2 - 1], base2, len2, False)
+        comparisons += probes
+        end2 = base2 + len2
+        if len2 == 0:
+            return
+        temp = arr[base1:base2]
+        i, j, k = 0, base2, base1
+        while i < len1 and j < end2:
+            wins1 = wins2 = 0
+            while i < len1 and j < end2 and wins1 < MIN_GALLOP and wins2 < MIN_GALLOP:
+                comparisons += 1
+                moves += 1
+                if arr[j] < temp[i]:
+                    arr[k] = arr[j]
+                    j += 1
+                    wins1, wins2 = 0, wins2 + 1
+                else:
+                    arr[k] = temp[i]
+                    i += 1
+                    wins1, wins2 = wins1 + 1, 0
+                k += 1
+            while i < len1 and j < end2:
+                count1, probes = gallop(temp, arr[j], i, len1 - i, True)
+                comparisons += probes
+                arr[k:k + count1] = temp[i:i + count1]
+                moves += count1
+                i += count1
+                k += count1
+                if i == len1:
+                    break
+                arr[k] = arr[j]
+                moves += 1
+                j += 1
+                k += 1
+                if j == end2:
+                    break
+                count2, probes = gallop(arr, temp[i], j, end2 - j, False)
+                comparisons += probes
+                arr[k:k + count2] = arr[j:j + count2]
+                moves += count2
+                j += count2
+                k += count2
+                if j == end2:
+                    break
+                arr[k] = temp[i]
+                moves += 1
+                i += 1
+                k += 1
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+        arr[k:k + len1 - i] = temp[i:len1]
+        moves += len1 - i
+
+    minrun = min_run_length(n)
+    runs = []
+    lo = 0
+    while lo < n:
+        # Natural run starting at lo, reversed if strictly descending.
+        hi = lo + 1
+        if hi < n:
+            comparisons += 1
+            if arr[hi] < arr[lo]:
+                while hi + 1 < n:
+                    comparisons += 1
+                    if not arr[hi + 1] < arr[hi]:
+                        break
+                    hi += 1
+                moves += (hi - lo + 1) // 2
+                arr[lo:hi + 1] = arr[lo:hi + 1][::-1]
+            else:
+                while hi + 1 < n:
+                    comparisons += 1
+                    if arr[hi + 1] < arr[hi]:
+                        break
+                    hi += 1
+        else:
+            hi = lo
+        run_len = hi - lo + 1
+        if run_len < minrun:
+            # Extend to minrun with stable binary insertion.
+            forced = min(minrun, n - lo)
+            for i in range(lo + run_len, lo + forced):
+                pivot = arr[i]
+                left, right = lo, i
+                while left < right:
+                    mid = (left + right) // 2
+                    comparisons += 1
+                    if pivot < arr[mid]:
+                        right = mid
+                    else:
+                        left = mid + 1
+                if left != i:
+                    arr[left + 1:i + 1] = arr[left:i]
+                    arr[left] = pivot
+                    moves += i - left + 1
+            run_len = forced
+        runs.append((lo, run_len))
+        lo += run_len
+        k = merge_index(runs)
+        while k is not None:
+            merge_runs(*pop_merge(runs, k))
+            k = merge_index(runs)
+
+    while len(runs) > 1:
+        merge_runs(*pop_merge(runs, final_merge_index(runs)))
+    return comparisons, moves
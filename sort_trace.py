@@ -0,0 +1,233 @@
+import math
+from array import array
+import numpy as np
+from sort_radix import DEFAULT_RADIX, radix_pass_count
+from sort_heap import DEFAULT_ARITY
+from sort_network import network_stage_count
+from sort_counting import HISTOGRAM_BLOCKS, MAX_BUCKETS
+
+# Action names used by the sorting visualizers, stored as small integer codes. An 'owner'
+# step gives the bars from idx1 to the end to worker idx2, until a later 'owner' step. A
+# 'stage' step is one sorting network stage: comparator distance idx1, comparator count idx2.
+# A 'count' step tallies elements idx1..idx2 into a histogram; 'place' writes idx1..idx2. A
+# 'tally' step reports work done off screen: idx1 writes to a scratch buffer and idx2 comparisons.
+ACTIONS = ['compare', 'swap', 'copy', 'copy_back', 'pivot', 'merged',
+           'digit', 'pass_complete', 'complete', 'run', 'merge_block', 'owner', 'scatter', 'stage', 'count', 'place', 'tally']
+ACTION_CODES = {name: code for code, name in enumerate(ACTIONS)}
+
+# Marks actions that write every index from idx1 to idx2 inclusive.
+RANGE = 'range'
+
+# Which of (idx1, idx2) an action writes to; None means any element may have changed.
+ACTION_WRITES = {
+    'compare': (),
+    'swap': (0, 1),
+    'copy': (0,),
+    'copy_back': (0,),
+    'pivot': (),
+    'merged': (),
+    'digit': (),
+    'pass_complete': None,
+    'complete': (),
+    'run': (),
+    'merge_block': RANGE,
+    'owner': (),
+    'scatter': None,
+    'stage': None,
+    'count': (),
+    'place': RANGE,
+    'tally': (),
+}
+
+# Steps that are kept when a trace is sampled down to a frame budget.
+KEY_ACTIONS = ('pivot', 'merged', 'pass_complete', 'complete', 'run', 'merge_block', 'owner', 'scatter', 'stage', 'count', 'place')
+
+DEFAULT_CHECKPOINT_INTERVAL = 1024
+CHECKPOINT_SPACING = 4  # steps per array element between periodic checkpoints
+
+
+class SortTrace:
+    """Compact, delta-encoded log of sorting steps.
+
+    The trace is bound to the list being sorted. Each step stores only its
+    action code, indices and the values written to the array; a full copy of
+    the array is kept every `checkpoint_interval` steps so any frame can be
+    rebuilt by replaying a bounded number of writes.
+
+    Indexing a trace returns the same `(state, action, idx1, idx2)` tuples the
+    old list-of-copies format used. The returned state list is shared between
+    lookups, so copy it if it must outlive the next lookup.
+    """
+
+    def __init__(self, arr, checkpoint_interval=None):
+        self.arr = arr
+        self.typecode = 'q' if all(isinstance(v, int) for v in arr) else 'd'
+        self.checkpoint_interval = checkpoint_interval or max(DEFAULT_CHECKPOINT_INTERVAL, CHECKPOINT_SPACING * len(arr))
+        self.actions = array('b')
+        self.idx1 = array('i')
+        self.idx2 = array('i')
+        self.write_count = array('i')
+        self.write_idx = array('i')
+        self.write_val = array(self.typecode)
+        # Checkpoint k holds the array after the first checkpoint_steps[k] steps,
+        # which together wrote checkpoint_writes[k] entries of the write log.
+        self.checkpoint_steps = [0]
+        self.checkpoint_writes = [0]
+        self.checkpoints = [array(self.typecode, arr)]
+        self._cursor_step = -1
+        self._cursor_write = 0
+        self._cursor_state = None
+
+    def __len__(self):
+        return len(self.actions)
+
+    def record(self, action, idx1=-1, idx2=-1):
+        """Record one step, reading any written values from the live array; 'tally' steps are not frames."""
+        if action == 'tally':
+            return
+        step = len(self.actions)
+        writes = ACTION_WRITES[action]
+        self.actions.append(ACTION_CODES[action])
+        self.idx1.append(idx1)
+        self.idx2.append(idx2)
+        count = 0
+        if writes == RANGE:
+            self.write_idx.extend(range(idx1, idx2 + 1))
+            self.write_val.extend(self.arr[idx1:idx2 + 1])
+            count = idx2 - idx1 + 1
+        elif writes:
+            indices = (idx1, idx2)
+            for slot in writes:
+                k = indices[slot]
+                if k >= 0:
+                    self.write_idx.append(k)
+                    self.write_val.append(self.arr[k])
+                    count += 1
+        self.write_count.append(count)
+        # Whole-array steps are stored as checkpoints instead of writes.
+        if writes is None or step + 1 - self.checkpoint_steps[-1] >= self.checkpoint_interval:
+            self.checkpoint_steps.append(step + 1)
+            self.checkpoint_writes.append(len(self.write_idx))
+            self.checkpoints.append(array(self.typecode, self.arr))
+
+    def extend(self, steps):
+        """Record every (action, idx1, idx2) step produced by a step generator."""
+        record = self.record
+        for action, idx1, idx2 in steps:
+            record(action, idx1, idx2)
+
+    def __getitem__(self, frame):
+        n_steps = len(self.actions)
+        if frame < 0:
+            frame += n_steps
+        if not 0 <= frame < n_steps:
+            raise IndexError("trace frame out of range")
+
+        # Newest checkpoint that has at most frame + 1 steps applied.
+        lo, hi = 0, len(self.checkpoint_steps)
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if self.checkpoint_steps[mid] <= frame + 1:
+                lo = mid
+            else:
+                hi = mid
+        applied = self.checkpoint_steps[lo]
+
+        # Replay forward from the cursor when it is at least as recent as the checkpoint.
+        if self._cursor_state is not None and applied <= self._cursor_step + 1 <= frame + 1:
+            applied = self._cursor_step + 1
+            first_write = self._cursor_write
+        else:
+            self._cursor_state = list(self.checkpoints[lo])
+            first_write = self.checkpoint_writes[lo]
+        last_write = first_write + sum(self.write_count[applied:frame + 1])
+        state = self._cursor_state
+        write_idx, write_val = self.write_idx, self.write_val
+        for w in range(first_write, last_write):
+            state[write_idx[w]] = write_val[w]
+        self._cursor_step = frame
+        self._cursor_write = last_write
+        return state, ACTIONS[self.actions[frame]], self.idx1[frame], self.idx2[frame]
+
+    def nbytes(self):
+        """Approximate memory held by the trace buffers, in bytes."""
+        buffers = [self.actions, self.idx1, self.idx2, self.write_count, self.write_idx, self.write_val]
+        buffers.extend(self.checkpoints)
+        return sum(len(b) * b.itemsize for b in buffers)
+
+
+def owner_steps(trace, stop):
+    """(idx1, idx2) of every 'owner' step among the first `stop` steps of a trace."""
+    actions = np.frombuffer(trace.actions, dtype=np.int8)[:stop]
+    return [(trace.idx1[k], trace.idx2[k]) for k in np.flatnonzero(actions == ACTION_CODES['owner'])]
+
+
+def stream_frames(arr, steps, tail=0):
+    """Lazily yield (state, action, idx1, idx2) frames straight from a step generator.
+
+    `state` is the live array being sorted, so memory stays O(n) however long
+    the run is; the frame must be drawn before the next one is requested.
+    `tail` extra 'complete' frames are yielded once the sort finishes.
+    """
+    for action, idx1, idx2 in steps:
+        if action != 'tally':
+            yield arr, action, idx1, idx2
+    for _ in range(tail):
+        yield arr, 'complete', -1, -1
+
+
+def sample_frames(trace, budget):
+    """Pick at most about `budget` step indices of a trace to animate, in order.
+
+    Each run of consecutive comparisons is folded into its last comparison and
+    key events are kept in preference to other steps, which are spread evenly
+    over what is left of the budget. The final step is always included.
+    Skipped steps' writes are not replayed, so draw sampled frames in full.
+    """
+    n = len(trace)
+    if budget is None or n <= budget:
+        return range(n)
+    actions = np.frombuffer(trace.actions, dtype=np.int8)
+    compare = ACTION_CODES['compare']
+    folded = (actions == compare) & (np.append(actions[1:], -1) == compare)
+    candidates = np.flatnonzero(~folded)
+    if len(candidates) > budget:
+        is_key = np.isin(actions[candidates], [ACTION_CODES[a] for a in KEY_ACTIONS])
+        keys, others = candidates[is_key], candidates[~is_key]
+        if len(keys) >= budget:
+            candidates = keys[np.linspace(0, len(keys) - 1, max(budget, 1)).astype(int)]
+        else:
+            picked = others[np.linspace(0, len(others) - 1, budget - len(keys)).astype(int)]
+            candidates = np.union1d(keys, picked)
+    return np.union1d(candidates, [n - 1]).tolist()
+
+
+def sample_stream(frames, stride):
+    """Yield key events and every `stride`-th other frame from a frame stream."""
+    for k, frame in enumerate(frames):
+        if k % stride == 0 or frame[1] in KEY_ACTIONS:
+            yield frame
+
+
+def estimate_steps(algo, arr, radix=DEFAULT_RADIX, arity=DEFAULT_ARITY):
+    """Rough number of steps an algorithm yields on random input, for sizing streamed animations."""
+    n = len(arr)
+    if n < 2:
+        return 0
+    log_n = math.log2(n)
+    if algo == 'radix':
+        return radix_pass_count(arr, radix)
+    if algo == 'network':
+        return network_stage_count(n)
+    if algo in ('counting', 'bucket'):
+        # One step per histogram block, then one per distinct key or non-empty bucket.
+        keys = min(n, int(max(arr) - min(arr)) + 1)
+        return HISTOGRAM_BLOCKS + (keys if algo == 'counting' else min(keys, MAX_BUCKETS) + 1)
+    quadratic = {'bubble': 0.75, 'insertion': 0.5, 'selection': 0.5}
+    if algo in quadratic:
+        return int(quadratic[algo] * n * (n - 1)) + n
+    if algo == 'dheap':
+        # One compare per level of a log_d(n)-level sift-down, plus the climb back up and the copies.
+        return int((1.8 / math.log2(arity) + 0.25) * n * log_n)
+    loglinear = {'quick': 2, 'merge': 3, 'heap': 2.5, 'intro': 1.5, 'tim': 2.5, 'bottomup': 0.5, 'sample': 1.6}
+    return int(loglinear.get(algo, 3) * n * log_n)
@@ -1,61 +1,82 @@
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-import random
 import argparse
 import sys
 import time
 import math
+import os
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from sort_trace import SortTrace, owner_steps, stream_frames, estimate_steps, sample_frames, sample_stream
+from sort_radix import DEFAULT_RADIX, radix_sort_steps
+from sort_intro import intro_sort_steps
+from sort_tim import tim_sort_steps
+from sort_bottomup import bottom_up_merge_sort_steps
+from sort_heap import ARITIES, DEFAULT_ARITY, dary_heap_sort_steps
+from sort_parallel import DEFAULT_WORKERS, MAX_WORKERS, sample_sort_steps
+from sort_network import network_sort_steps
+from sort_counting import counting_sort_steps, bucket_sort_steps
+from sort_counters import TracingCounter, format_counters
+from sort_external import DEFAULT_CHUNK, DEFAULT_FAN_IN, external_sort, print_progress
+from sort_io import read_numbers, write_numbers, random_numbers, describe_numbers
+from sort_export import FRAME_PATTERN, OffscreenCanvas, export_frames
+from sort_benchmark import DISTRIBUTIONS, run_benchmark, run_speedup, write_results, print_results, print_speedup
+from sort_scaling import SCALING_SIZES, run_scaling, fit_exponents, format_scaling_table, write_scaling_report
 
 def generate_numbers(n, min_val, max_val, output_file):
-    """Generate n random integers and save to output_file (one per line)."""
-    numbers = [random.randint(min_val, max_val) for _ in range(n)]
-    with open(output_file, 'w') as f:
-        for num in numbers:
-            f.write(f"{num}\n")
+    """Generate n random integers and save to output_file (.npy, raw .i32/.i64, or one per line)."""
+    numbers = random_numbers(n, min_val, max_val)
+    write_numbers(output_file, numbers)
     print(f"Generated {n} numbers between {min_val} and {max_val}, saved to {output_file}")
-    print("Generated numbers:", numbers)
+    describe_numbers("Generated numbers", numbers)
     return numbers
 
-def bubble_sort_visual(arr, states):
-    """Bubble sort with states for visualization (comparisons and swaps)."""
+def bubble_sort_steps(arr):
+    """Bubble sort yielding (action, idx1, idx2) steps while sorting arr in place."""
     n = len(arr)
     for i in range(n - 1):
         for j in range(n - i - 1):
-            states.append((list(arr), 'compare', j, j + 1))
+            yield 'compare', j, j + 1
             if arr[j] > arr[j + 1]:
                 arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                states.append((list(arr), 'swap', j, j + 1))
+                yield 'swap', j, j + 1
+
+def bubble_sort_visual(arr, states):
+    """Bubble sort with states for visualization (comparisons and swaps)."""
+    states.extend(bubble_sort_steps(arr))
 
-def partition_visual(arr, low, high, states):
-    """Partition for quicksort, tracking pivot, comparisons, and swaps."""
+def partition_steps(arr, low, high):
+    """Partition for quicksort, yielding pivot, comparison and swap steps; returns the pivot index."""
     pivot = arr[high]
-    states.append((list(arr), 'pivot', high, -1))
+    yield 'pivot', high, -1
     i = low - 1
     for j in range(low, high):
-        states.append((list(arr), 'compare', j, high))
+        yield 'compare', j, high
         if arr[j] <= pivot:
             i += 1
             if i != j:
                 arr[i], arr[j] = arr[j], arr[i]
-                states.append((list(arr), 'swap', i, j))
+                yield 'swap', i, j
     if i + 1 != high:
         arr[i + 1], arr[high] = arr[high], arr[i + 1]
-        states.append((list(arr), 'swap', i + 1, high))
+        yield 'swap', i + 1, high
     return i + 1
 
+def quick_sort_steps(arr, low, high):
+    """Recursive quicksort yielding visualization steps."""
+    if low < high:
+        pi = yield from partition_steps(arr, low, high)
+        yield from quick_sort_steps(arr, low, pi - 1)
+        yield from quick_sort_steps(arr, pi + 1, high)
+
 def quick_sort_visual(arr, low, high, states):
     """Recursive quicksort with visualization states."""
-    if low < high:
-        pi = partition_visual(arr, low, high, states)
-        quick_sort_visual(arr, low, pi - 1, states)
-        quick_sort_visual(arr, pi + 1, high, states)
+    states.extend(quick_sort_steps(arr, low, high))
 
-def merge_sort_visual(arr, states):
-    """Merge sort with states for comparisons, copies, and merges."""
-    def _merge(arr, temp, left, mid, right, states):
+def merge_sort_steps(arr):
+    """Merge sort yielding steps for comparisons, copies, and merges."""
+    def _merge(arr, temp, left, mid, right):
         i, j, k = left, mid + 1, left
         while i <= mid and j <= right:
-            states.append((list(arr), 'compare', i, j))
+            yield 'compare', i, j
             if arr[i] <= arr[j]:
                 temp[k] = arr[i]
                 i += 1
@@ -65,46 +86,103 @@ def merge_sort_visual(arr, states):
             k += 1
         while i <= mid:
             temp[k] = arr[i]
-            states.append((list(arr), 'copy', k, i))
+            yield 'copy', k, i
             i += 1
             k += 1
         while j <= right:
             temp[k] = arr[j]
-            states.append((list(arr), 'copy', k, j))
+            yield 'copy', k, j
             j += 1
             k += 1
         for p in range(left, right + 1):
             arr[p] = temp[p]
-            states.append((list(arr), 'copy_back', p, -1))
-        states.append((list(arr), 'merged', left, right))
+            yield 'copy_back', p, -1
+        yield 'merged', left, right
 
-    def _merge_sort(arr, temp, left, right, states):
+    def _merge_sort(arr, temp, left, right):
         if left < right:
             mid = (left + right) // 2
-            _merge_sort(arr, temp, left, mid, states)
-            _merge_sort(arr, temp, mid + 1, right, states)
-            _merge(arr, temp, left, mid, right, states)
+            yield from _merge_sort(arr, temp, left, mid)
+            yield from _merge_sort(arr, temp, mid + 1, right)
+            yield from _merge(arr, temp, left, mid, right)
 
     temp = [0] * len(arr)
-    _merge_sort(arr, temp, 0, len(arr) - 1, states)
+    yield from _merge_sort(arr, temp, 0, len(arr) - 1)
 
-def radix_sort_visual(arr, states):
-    """LSD radix sort for non-negative integers with visualization states."""
-    if not arr:
-        return
-    max_val = max(arr)
-    exp = 1
-    while max_val // exp > 0:
-        buckets = [[] for _ in range(10)]
-        n = len(arr)
-        for k in range(n):
-            states.append((list(arr), 'digit', k, -1))
-        for val in arr:
-            index = (val // exp) % 10
-            buckets[index].append(val)
-        arr[:] = [val for buck in buckets for val in buck]
-        states.append((list(arr), 'pass_complete', -1, -1))
-        exp *= 10
+def merge_sort_visual(arr, states):
+    """Merge sort with states for comparisons, copies, and merges."""
+    states.extend(merge_sort_steps(arr))
+
+def radix_sort_visual(arr, states, radix=DEFAULT_RADIX):
+    """Vectorized LSD radix sort with one visualization state per digit pass."""
+    states.extend(radix_sort_steps(arr, radix))
+
+def intro_sort_visual(arr, states):
+    """Introsort (median-of-three pivots, three-way partitions, heapsort fallback) with visualization states."""
+    states.extend(intro_sort_steps(arr))
+
+def tim_sort_visual(arr, states):
+    """Timsort-style natural merge sort (run detection, minrun, galloping) with visualization states."""
+    states.extend(tim_sort_steps(arr))
+
+def bottom_up_merge_sort_visual(arr, states):
+    """Bottom-up ping-pong merge sort with one visualization state per merged block."""
+    states.extend(bottom_up_merge_sort_steps(arr))
+
+def heapify_steps(arr, n, i):
+    """Heapify function for heap sort yielding visualization steps."""
+    largest = i
+    left = 2 * i + 1
+    right = 2 * i + 2
+
+    if left < n:
+        yield 'compare', left, largest
+        if arr[left] > arr[largest]:
+            largest = left
+
+    if right < n:
+        yield 'compare', right, largest
+        if arr[right] > arr[largest]:
+            largest = right
+
+    if largest != i:
+        arr[i], arr[largest] = arr[largest], arr[i]
+        yield 'swap', i, largest
+        yield from heapify_steps(arr, n, largest)
+
+def heap_sort_steps(arr):
+    """Heap sort yielding visualization steps."""
+    n = len(arr)
+    for i in range(n // 2 - 1, -1, -1):
+        yield from heapify_steps(arr, n, i)
+    for i in range(n - 1, 0, -1):
+        arr[0], arr[i] = arr[i], arr[0]
+        yield 'swap', 0, i
+        yield from heapify_steps(arr, i, 0)
+
+def heap_sort_visual(arr, states):
+    """Recursive binary heap sort with states for visualization."""
+    states.extend(heap_sort_steps(arr))
+
+def dary_heap_sort_visual(arr, states, arity=DEFAULT_ARITY):
+    """Iterative d-ary heap sort (Floyd's sift-down) with one compare state per heap level."""
+    states.extend(dary_heap_sort_steps(arr, arity))
+
+def sample_sort_visual(arr, states, workers=DEFAULT_WORKERS):
+    """Sample sort with each bar colored by the worker that owns it and the buckets sorted side by side."""
+    states.extend(sample_sort_steps(arr, workers))
+
+def network_sort_visual(arr, states):
+    """Batcher sorting network with one visualization state per vectorized compare-exchange stage."""
+    states.extend(network_sort_steps(arr))
+
+def counting_sort_visual(arr, states):
+    """Counting sort with one visualization state per histogram block and per distinct key placed."""
+    states.extend(counting_sort_steps(arr))
+
+def bucket_sort_visual(arr, states):
+    """Bucket sort with one visualization state per histogram block, the scatter and each bucket sorted."""
+    states.extend(bucket_sort_steps(arr))
 
 # Map algorithm names to their functions
 algo_functions = {
@@ -112,148 +190,384 @@ algo_functions = {
     'quick': lambda arr, states: quick_sort_visual(arr, 0, len(arr) - 1, states),
     'merge': lambda arr, states: merge_sort_visual(arr, states),
     'radix': lambda arr, states: radix_sort_visual(arr, states),
+    'intro': lambda arr, states: intro_sort_visual(arr, states),
+    'tim': lambda arr, states: tim_sort_visual(arr, states),
+    'bottomup': lambda arr, states: bottom_up_merge_sort_visual(arr, states),
+    'heap': lambda arr, states: heap_sort_visual(arr, states),
+    'dheap': lambda arr, states: dary_heap_sort_visual(arr, states),
+    'sample': lambda arr, states: sample_sort_visual(arr, states),
+    'network': lambda arr, states: network_sort_visual(arr, states),
+    'counting': lambda arr, states: counting_sort_visual(arr, states),
+    'bucket': lambda arr, states: bucket_sort_visual(arr, states),
+}
+
+# Map algorithm names to their lazy step generators
+algo_steps = {
+    'bubble': bubble_sort_steps,
+    'quick': lambda arr: quick_sort_steps(arr, 0, len(arr) - 1),
+    'merge': merge_sort_steps,
+    'radix': radix_sort_steps,
+    'intro': intro_sort_steps,
+    'tim': tim_sort_steps,
+    'bottomup': bottom_up_merge_sort_steps,
+    'heap': heap_sort_steps,
+    'dheap': dary_heap_sort_steps,
+    'sample': sample_sort_steps,
+    'network': network_sort_steps,
+    'counting': counting_sort_steps,
+    'bucket': bucket_sort_steps,
 }
 
+def algorithm_steps(algo, arr, radix=DEFAULT_RADIX, arity=DEFAULT_ARITY, workers=DEFAULT_WORKERS):
+    """Step generator for algo, passing the radix, heap arity or worker count to the engines that take one."""
+    if algo == 'radix':
+        return radix_sort_steps(arr, radix)
+    if algo == 'dheap':
+        return dary_heap_sort_steps(arr, arity)
+    if algo == 'sample':
+        return sample_sort_steps(arr, workers)
+    return algo_steps[algo](arr)
+
+def sort_visual(algo, arr, states, radix=DEFAULT_RADIX, arity=DEFAULT_ARITY, workers=DEFAULT_WORKERS):
+    """Sort arr in place with algo, feeding its steps to states (a SortTrace or OperationCounter)."""
+    if algo == 'radix':
+        radix_sort_visual(arr, states, radix)
+    elif algo == 'dheap':
+        dary_heap_sort_visual(arr, states, arity)
+    elif algo == 'sample':
+        sample_sort_visual(arr, states, workers)
+    else:
+        algo_functions[algo](arr, states)
+
+def trace_algorithm(algo, arr, radix=DEFAULT_RADIX, arity=DEFAULT_ARITY, workers=DEFAULT_WORKERS):
+    """Sort a copy of arr with algo once, returning its trace, the time taken and its operation counts."""
+    arr_copy = list(arr)
+    states = SortTrace(arr_copy)
+    counter = TracingCounter(states)
+    start_time = time.time()
+    sort_visual(algo, arr_copy, counter, radix, arity, workers)
+    end_time = time.time()
+    return states, end_time - start_time, counter.as_dict()
+
+def _trace_or_error(algo, arr, radix, arity, workers):
+    try:
+        return trace_algorithm(algo, arr, radix, arity, workers)
+    except (TypeError, ValueError) as e:
+        return e
+
+def generate_traces(algos, arr, radix=DEFAULT_RADIX, arity=DEFAULT_ARITY, workers=DEFAULT_WORKERS):
+    """Trace each algorithm in its own worker process, returning results in the order given.
+
+    An algorithm that cannot sort arr (e.g. counting sort over too wide a key
+    range) gives the TypeError or ValueError it raised instead of a result.
+    """
+    if len(algos) < 2:
+        return [_trace_or_error(algo, arr, radix, arity, workers) for algo in algos]
+    with ProcessPoolExecutor(max_workers=min(len(algos), os.cpu_count() or 1)) as pool:
+        count = len(algos)
+        return list(pool.map(_trace_or_error, algos, [arr] * count, [radix] * count, [arity] * count, [workers] * count))
+
+def build_figure(arr, titles):
+    """Lay out one bar-chart subplot per title, returning the figure and a renderer for each."""
+    import matplotlib.pyplot as plt
+    from sort_render import BarRenderer
+
+    rows = math.ceil(math.sqrt(len(titles)))
+    cols = math.ceil(len(titles) / rows)
+    fig, axs = plt.subplots(rows, cols, figsize=(6 * cols, 5 * rows), squeeze=False)
+    axs = axs.flatten()
+    max_height = max(arr) * 1.1 if arr else 100
+    min_height = min(min(arr) * 1.1, 0) if arr else 0
+    renderers = []
+    for ax, title in zip(axs, titles):
+        ax.set_title(title)
+        ax.set_ylim(min_height, max_height)
+        ax.set_xlim(-0.5, len(arr) - 0.5)
+        renderers.append(BarRenderer(ax, arr))
+
+    # Hide unused subplots
+    for ax in axs[len(titles):]:
+        ax.axis('off')
+    fig.tight_layout()
+    return fig, renderers
+
+def draw_trace_frame(renderers, states_list, frame_lists, frame, resync=False):
+    """Show one animation frame of every trace, holding finished traces on their final state."""
+    artists = []
+    for renderer, states, frames in zip(renderers, states_list, frame_lists):
+        if frame < len(frames):
+            step = frames[frame]
+            previous = frames[frame - 1] if frame else -1
+            if resync:
+                # Ownership is set by earlier steps, which a chunk starting here has not drawn
+                renderer.set_owners(owner_steps(states, step))
+            artists.extend(renderer.update(*states[step], resync=resync or step != previous + 1))
+        elif frame == len(frames) or resync:
+            artists.extend(renderer.update(states[len(states) - 1][0], 'complete', -1, -1, resync=resync))
+        else:
+            artists.extend(renderer.init())
+    return artists
+
+def render_chunk(payload, start, stop, directory, palette=False):
+    """Draw frames start..stop-1 of a comparison offscreen with Agg and save them as PNGs."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    arr, titles, states_list, frame_lists = payload
+    fig, renderers = build_figure(arr, titles)
+    canvas = OffscreenCanvas(fig, [artist for renderer in renderers for artist in renderer.init()], palette)
+    for frame in range(start, stop):
+        draw_trace_frame(renderers, states_list, frame_lists, frame, resync=frame == start)
+        canvas.save(os.path.join(directory, FRAME_PATTERN.format(frame)))
+    plt.close(fig)
+
 def main():
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description="Generate random numbers and visualize sorting algorithms.")
-    parser.add_argument('--mode', choices=['random', 'file'], required=True, help="Input mode: 'random' or 'file'")
-    parser.add_argument('--algo', choices=['bubble', 'quick', 'merge', 'radix'], action='append', required=True, help="Sorting algorithm(s) to visualize (e.g., --algo bubble --algo quick)")
+    parser.add_argument('--mode', choices=['random', 'file'], help="Input mode: 'random' or 'file'")
+    parser.add_argument('--algo', choices=['bubble', 'quick', 'merge', 'radix', 'intro', 'tim', 'bottomup', 'heap', 'dheap', 'sample', 'network', 'counting', 'bucket'], action='append', help="Sorting algorithm(s) to visualize (e.g., --algo bubble --algo quick); --benchmark and --scaling default to all")
     parser.add_argument('--n', type=int, help="Number of elements for random mode")
     parser.add_argument('--min_val', type=int, default=0, help="Min value for random numbers (default: 0)")
     parser.add_argument('--max_val', type=int, default=100, help="Max value for random numbers (default: 100)")
-    parser.add_argument('--file', type=str, default="numbers.txt", help="File path for input/output (default: numbers.txt)")
+    parser.add_argument('--file', type=str, default="numbers.txt", help="File path for input/output: .npy, raw .i32/.i64, or text (default: numbers.txt)")
+    parser.add_argument('--dtype', choices=['int32', 'int64'], help="Element type of a raw binary --file with another extension")
     parser.add_argument('--interval', type=int, default=50, help="Animation frame interval in ms (default: 50)")
+    parser.add_argument('--stream', action='store_true', help="Generate frames lazily during the animation instead of precomputing traces")
+    parser.add_argument('--frames', type=int, help="Frame budget: sample long runs down to about this many frames, keeping key events")
+    parser.add_argument('--radix', type=int, default=DEFAULT_RADIX, help=f"Digit base for radix sort, e.g. 256 or 65536 (default: {DEFAULT_RADIX})")
+    parser.add_argument('--arity', type=int, choices=ARITIES, default=DEFAULT_ARITY, help=f"Children per node for the d-ary heap sort 'dheap' (default: {DEFAULT_ARITY})")
+    parser.add_argument('--sample_workers', type=int, choices=range(1, MAX_WORKERS + 1), default=DEFAULT_WORKERS, metavar='W', help=f"Workers for the parallel sample sort 'sample', 1-{MAX_WORKERS} (default: {DEFAULT_WORKERS})")
+    parser.add_argument('--export', type=str, help="Render offscreen instead of showing a window: a .gif file or a directory for numbered PNGs")
+    parser.add_argument('--workers', type=int, help="Worker processes for --export (default: one per CPU)")
+    parser.add_argument('--benchmark', action='store_true', help="Time untraced sorts headlessly and write results instead of animating")
+    parser.add_argument('--sizes', type=int, nargs='+', help="Input sizes for --benchmark (default: 100 1000 10000) --scaling (default: 2^8 to 2^20) or --speedup (default: 2^18)")
+    parser.add_argument('--distributions', choices=DISTRIBUTIONS, nargs='+', default=DISTRIBUTIONS, help="Input distributions for --benchmark (default: all)")
+    parser.add_argument('--repeats', type=int, default=5, help="Timed runs per size and distribution for --benchmark (default: 5)")
+    parser.add_argument('--budget', type=float, default=10.0, help="Skip sizes predicted to take longer than this many seconds per run (default: 10)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for --benchmark inputs (default: 0)")
+    parser.add_argument('--output', type=str, default="benchmark.json", help="Benchmark results file, .json or .csv (default: benchmark.json)")
+    parser.add_argument('--scaling', type=str, metavar='DIR', help="Time the traced engines over growing sizes, fit log-log growth exponents and write a table and plot to DIR")
+    parser.add_argument('--speedup', action='store_true', help="Time parallel sample sort against sequential introsort on --sizes for each of --worker_counts")
+    parser.add_argument('--worker_counts', type=int, nargs='+', default=[4, 8, 16], help="Worker counts for --speedup (default: 4 8 16)")
+    parser.add_argument('--external', type=str, metavar='OUTPUT', help="Sort --file out of core into OUTPUT (.npy, raw .i32/.i64, or text) with bounded memory instead of visualizing")
+    parser.add_argument('--chunk', type=int, default=DEFAULT_CHUNK, help=f"Numbers per sorted run held in memory for --external (default: {DEFAULT_CHUNK})")
+    parser.add_argument('--fan_in', type=int, default=DEFAULT_FAN_IN, help=f"Runs merged at once per --external merge pass (default: {DEFAULT_FAN_IN})")
     args = parser.parse_args()
 
+    if args.external:
+        if args.chunk < 1 or args.fan_in < 2:
+            print("Error: --chunk must be positive and --fan_in at least 2.")
+            sys.exit(1)
+        start_time = time.time()
+        try:
+            count = external_sort(args.file, args.external, args.chunk, args.fan_in, args.dtype, progress=print_progress)
+        except (OSError, ValueError) as e:
+            print(f"Error sorting file: {e}")
+            sys.exit(1)
+        print(f"Sorted {count} numbers from {args.file} into {args.external} in {time.time() - start_time:.1f}s")
+        return
+
+    if args.radix < 2:
+        print("Error: --radix must be at least 2.")
+        sys.exit(1)
+
+    if args.speedup:
+        results = run_speedup(args.sizes or [1 << 18], args.worker_counts, args.repeats, args.seed)
+        print_speedup(results)
+        write_results(results, args.output)
+        print(f"\nSpeedup results saved to {args.output}")
+        return
+
+    if args.scaling:
+        algos = args.algo or list(algo_functions)
+        results = run_scaling(lambda algo, arr, states: sort_visual(algo, arr, states, args.radix, args.arity, args.sample_workers),
+                              algos, args.sizes or SCALING_SIZES, args.budget, args.seed)
+        fits = fit_exponents(results)
+        print()
+        print(format_scaling_table(results, fits))
+        write_scaling_report(results, fits, args.scaling)
+        print(f"\nScaling report saved to {args.scaling}")
+        return
+
+    if args.benchmark:
+        algos = args.algo or list(algo_functions)
+        results = run_benchmark(algos, args.sizes or [100, 1000, 10000], args.distributions, args.repeats,
+                                args.min_val, args.max_val, args.budget, args.seed, args.arity, args.radix,
+                                args.sample_workers)
+        print_results(results)
+        write_results(results, args.output)
+        print(f"\nBenchmark results saved to {args.output}")
+        return
+
+    if args.mode is None or not args.algo:
+        print("Error: --mode and --algo are required unless --benchmark is given.")
+        sys.exit(1)
+    if args.export and args.stream:
+        print("Error: --export renders precomputed traces; drop --stream.")
+        sys.exit(1)
+
     # Load or generate the array
     if args.mode == 'random':
         if args.n is None:
             print("Error: --n is required for random mode.")
             sys.exit(1)
-        arr = generate_numbers(args.n, args.min_val, args.max_val, args.file)
+        numbers = generate_numbers(args.n, args.min_val, args.max_val, args.file)
     elif args.mode == 'file':
         if args.file is None:
             print("Error: --file is required for file mode.")
             sys.exit(1)
         try:
-            with open(args.file, 'r') as f:
-                arr = [int(line.strip()) for line in f if line.strip()]
-            print("Input array from file:", arr)
+            numbers = read_numbers(args.file, args.dtype)
+            describe_numbers("Input array from file", numbers)
         except Exception as e:
             print(f"Error reading file: {e}")
             sys.exit(1)
 
+    arr = numbers.tolist()
+
+    # Traces are independent, so generate them all in parallel up front
+    traces = None
+    if not args.stream:
+        traces = iter(generate_traces(args.algo, arr, args.radix, args.arity, args.sample_workers))
+
     # Set up for visualization
-    valid_algos, states_list, bars_list, times_list, algo_names = [], [], [], [], []
-    num_algos = len(args.algo)
-    rows = math.ceil(math.sqrt(num_algos))
-    cols = math.ceil(num_algos / rows)
-    fig, axs = plt.subplots(rows, cols, figsize=(6 * cols, 5 * rows), squeeze=False)
-    axs = axs.flatten()
-    max_height = max(arr) * 1.1 if arr else 100
+    valid_algos, states_list, arrays_list, times_list, counters_list, algo_names, titles = [], [], [], [], [], [], []
 
     # Process each algorithm
-    subplot_index = 0
+    max_frames = 0
     for algo in args.algo:
         arr_copy = list(arr)
-        states = []
-        start_time = time.time()
 
-        if algo == 'radix' and any(x < 0 for x in arr_copy):
-            print(f"Warning: Radix sort assumes non-negative integers. Skipping {algo}.")
-            continue
+        if args.stream:
+            if len(arr_copy) < 2:
+                print(f"No elements to sort for {algo}.")
+                continue
+            # Steps are pulled from the generator while the animation plays
+            steps = algorithm_steps(algo, arr_copy, args.radix, args.arity, args.sample_workers)
+            # Engines check their input before the first step, so pull it now to skip unsortable input
+            try:
+                first = next(steps, None)
+            except (TypeError, ValueError) as e:
+                print(f"Warning: {e}. Skipping {algo}.")
+                continue
+            states = stream_frames(arr_copy, itertools.chain([first] if first else [], steps))
+            estimated_steps = estimate_steps(algo, arr_copy, args.radix, args.arity)
+            valid_algos.append(algo)
+            states_list.append(states)
+            arrays_list.append(arr_copy)
+            algo_names.append(algo.capitalize())
+            print(f"{algo.capitalize()} steps: ~{estimated_steps} (streamed)")
+            titles.append(f"{algo.capitalize()} Sort\n(streamed)")
+        else:
+            result = next(traces)
+            if isinstance(result, Exception):
+                print(f"Warning: {result}. Skipping {algo}.")
+                continue
+            states, elapsed, counters = result
 
-        algo_functions[algo](arr_copy, states)
-        end_time = time.time()
+            if not states:
+                print(f"No elements to sort for {algo}.")
+                continue
 
-        if not states:
-            print(f"No elements to sort for {algo}.")
-            continue
+            estimated_steps = len(states)
+            valid_algos.append(algo)
+            states_list.append(states)
+            times_list.append(elapsed)
+            counters_list.append(counters)
+            algo_names.append(algo.capitalize())
 
-        valid_algos.append(algo)
-        states_list.append(states)
-        times_list.append(end_time - start_time)
-        algo_names.append(algo.capitalize())
-        
-        print(f"{algo.capitalize()} steps: {len(states)}, Time: {times_list[-1]*1000:.2f}ms")
+            print(f"{algo.capitalize()} steps: {len(states)}, Time: {times_list[-1]*1000:.2f}ms")
+            titles.append(f"{algo.capitalize()} Sort\nTime: {times_list[-1]*1000:.2f}ms")
 
-        ax = axs[subplot_index]
-        ax.set_title(f"{algo.capitalize()} Sort\nTime: {times_list[-1]*1000:.2f}ms")
-        ax.set_ylim(0, max_height)
-        ax.set_xlim(-0.5, len(arr) - 0.5)
-        bars = ax.bar(range(len(arr)), states[0][0], color='lightblue', edgecolor='black', linewidth=0.5)
-        bars_list.append(bars)
-        subplot_index += 1
-
-    # Hide unused subplots
-    for k in range(subplot_index, len(axs)):
-        axs[k].axis('off')
+        max_frames = max(max_frames, estimated_steps)
 
     if not states_list:
         print("No valid algorithms to visualize.")
         sys.exit(0)
 
-    # Normalize states to max frames
-    max_frames = max(len(states) for states in states_list)
-    for i, states in enumerate(states_list):
-        if len(states) < max_frames:
-            final_state = states[-1]
-            final_state_extended = (final_state[0], 'complete', -1, -1)
-            states_list[i].extend([final_state_extended] * (max_frames - len(states)))
+    stride = 1
+    if args.stream:
+        if args.frames and max_frames > args.frames:
+            # Sample every stream with the same stride so the algorithms stay in step
+            stride = math.ceil(max_frames / args.frames)
+            states_list = [sample_stream(states, stride) for states in states_list]
+            max_frames = math.ceil(max_frames / stride)
+
+        def frame_source():
+            """Advance every algorithm's stream together until all have finished."""
+            while True:
+                frame = [next(states, None) for states in states_list]
+                if all(state is None for state in frame):
+                    return
+                yield [state or (arrays_list[i], 'complete', -1, -1) for i, state in enumerate(frame)]
+    else:
+        # Sample every trace by the same factor so the algorithms stay in step; shorter
+        # traces are held on their final state in update() rather than padded
+        scale = min(1, args.frames / max_frames) if args.frames else 1
+        frame_lists = [sample_frames(states, math.ceil(len(states) * scale)) for states in states_list]
+        max_frames = max(len(frames) for frames in frame_lists)
 
-    print(f"Max frames: {max_frames}")
+    print(f"Max frames: {'~' if args.stream else ''}{max_frames}")
     animation_duration_ms = max_frames * args.interval
     print(f"Animation duration: ~{animation_duration_ms/1000:.1f}s ({animation_duration_ms:.0f}ms)" if animation_duration_ms >= 1000 else f"Animation duration: ~{animation_duration_ms:.0f}ms")
 
-    def update(frame):
-        """Update all subplots for each frame based on their states."""
-        for i in range(len(states_list)):
-            states = states_list[i]
-            bars = bars_list[i]
-            if frame < len(states):
-                state, action, idx1, idx2 = states[frame]
-                colors = ['lightblue'] * len(state)
-                if action in ['compare', 'digit']:
-                    if idx1 != -1:
-                        colors[idx1] = 'yellow'
-                    if idx2 != -1 and idx2 < len(colors):
-                        colors[idx2] = 'orange'
-                elif action in ['swap', 'copy', 'copy_back']:
-                    if idx1 != -1:
-                        colors[idx1] = 'red'
-                    if idx2 != -1 and idx2 < len(colors):
-                        colors[idx2] = 'pink'
-                elif action == 'pivot':
-                    if idx1 != -1:
-                        colors[idx1] = 'green'
-                elif action == 'merged':
-                    if idx1 != -1 and idx2 != -1:
-                        for k in range(max(0, idx1), min(len(colors), idx2 + 1)):
-                            colors[k] = 'lightgreen'
-                elif action in ['pass_complete', 'complete']:
-                    colors = ['lightgreen'] * len(state)
-                for k, bar in enumerate(bars):
-                    if k < len(state):
-                        bar.set_height(state[k])
-                        bar.set_color(colors[k])
-
-    # Create animation
-    ani = animation.FuncAnimation(fig, update, frames=max_frames, interval=args.interval, repeat=False, blit=False)
-    plt.tight_layout()
+    if args.export:
+        start_time = time.time()
+        export_frames(render_chunk, (arr, titles, states_list, frame_lists), max_frames, args.export,
+                      args.workers, args.interval)
+        print(f"Exported {max_frames} frames to {args.export} in {time.time() - start_time:.1f}s")
+    else:
+        # Imported here so --benchmark, --export and the worker processes never load a GUI backend
+        import matplotlib.pyplot as plt
+        import matplotlib.animation as animation
+
+        fig, renderers = build_figure(arr, titles)
+
+        def init():
+            """Mark every subplot's bars for blitting without changing them."""
+            return [artist for renderer in renderers for artist in renderer.init()]
+
+        def update(frame):
+            """Update all subplots for each frame based on their states."""
+            return draw_trace_frame(renderers, states_list, frame_lists, frame)
+
+        def update_streamed(frame):
+            """Update all subplots from one set of streamed frames."""
+            artists = []
+            for renderer, state in zip(renderers, frame):
+                artists.extend(renderer.update(*state, resync=stride > 1))
+            return artists
+
+        # Create animation
+        if args.stream:
+            ani = animation.FuncAnimation(fig, update_streamed, frames=frame_source, init_func=init, save_count=max_frames,
+                                          cache_frame_data=False, interval=args.interval, repeat=False, blit=True)
+        else:
+            ani = animation.FuncAnimation(fig, update, frames=max_frames, init_func=init, interval=args.interval,
+                                          repeat=False, blit=True)
+
+        if args.stream:
+            print("\nStreaming mode: sort times are not measured; run without --stream for the PERFORMANCE COMPARISON.")
+            plt.show()
+            return
 
     # Print performance comparison
     print("\n" + "="*50)
     print("PERFORMANCE COMPARISON:")
     print("="*50)
-    algo_time_pairs = sorted(zip(algo_names, times_list), key=lambda x: x[1])
-    for rank, (name, time_taken) in enumerate(algo_time_pairs, 1):
+    algo_time_pairs = sorted(zip(algo_names, times_list, counters_list), key=lambda x: x[1])
+    for rank, (name, time_taken, counters) in enumerate(algo_time_pairs, 1):
         print(f"{rank}. {name} Sort: {time_taken*1000:.2f} ms")
+        print(f"   {format_counters(counters)}")
     print(f"\nFastest: {algo_time_pairs[0][0]} Sort ({algo_time_pairs[0][1]*1000:.2f} ms)")
     print(f"Slowest: {algo_time_pairs[-1][0]} Sort ({algo_time_pairs[-1][1]*1000:.2f} ms)")
+    least_work = min(algo_time_pairs, key=lambda x: x[2]['comparisons'] + x[2]['writes'])
+    print(f"Least work: {least_work[0]} Sort ({least_work[2]['comparisons']} comparisons, {least_work[2]['writes']} writes)")
     print("="*50)
 
-    plt.show()
+    if not args.export:
+        plt.show()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,196 +1,278 @@
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-import random
 import time
 import math
+import itertools
+from sort_trace import SortTrace, stream_frames, estimate_steps, sample_frames, sample_stream
+from sort_radix import DEFAULT_RADIX, radix_sort_steps
+from sort_intro import intro_sort_steps
+from sort_tim import tim_sort_steps
+from sort_bottomup import bottom_up_merge_sort_steps
+from sort_heap import ARITIES, DEFAULT_ARITY, dary_heap_sort_steps
+from sort_parallel import DEFAULT_WORKERS, MAX_WORKERS, sample_sort_steps
+from sort_network import network_sort_steps
+from sort_counting import counting_sort_steps, bucket_sort_steps
+from sort_counters import TracingCounter, format_counters
+from sort_io import read_numbers, write_numbers, random_numbers, describe_numbers
 
 def generate_numbers(n, min_val, max_val, output_file):
-    """Generate n random integers and save to output_file (one per line)."""
-    numbers = [random.randint(min_val, max_val) for _ in range(n)]
-    with open(output_file, 'w') as f:
-        for num in numbers:
-            f.write(f"{num}\n")
+    """Generate n random integers and save to output_file (.npy, raw .i32/.i64, or one per line)."""
+    numbers = random_numbers(n, min_val, max_val)
+    write_numbers(output_file, numbers)
     print(f"Generated {n} numbers between {min_val} and {max_val}, saved to {output_file}")
-    print("Generated numbers:", numbers)
+    describe_numbers("Generated numbers", numbers)
     return numbers
 
-def bubble_sort_visual(arr, states):
-    """Bubble sort with states for visualization (comparisons and swaps)."""
+def bubble_sort_steps(arr):
+    """Bubble sort yielding visualization steps (comparisons and swaps)."""
     n = len(arr)
     for i in range(n - 1):
         for j in range(n - i - 1):
-            states.append((list(arr), 'compare', j, j + 1))
+            yield 'compare', j, j + 1
             if arr[j] > arr[j + 1]:
                 arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                states.append((list(arr), 'swap', j, j + 1))
+                yield 'swap', j, j + 1
 
-def insertion_sort_visual(arr, states):
-    """Insertion sort with states for visualization."""
+def bubble_sort_visual(arr, states):
+    """Bubble sort with states for visualization (comparisons and swaps)."""
+    states.extend(bubble_sort_steps(arr))
+
+def insertion_sort_steps(arr):
+    """Insertion sort yielding visualization steps."""
     n = len(arr)
     for i in range(1, n):
         key = arr[i]
         j = i - 1
-        states.append((list(arr), 'compare', i, j))
+        yield 'compare', i, j
         
         while j >= 0 and arr[j] > key:
-            states.append((list(arr), 'compare', j, j + 1))
+            yield 'compare', j, j + 1
             arr[j + 1] = arr[j]
-            states.append((list(arr), 'swap', j, j + 1))
+            yield 'swap', j, j + 1
             j -= 1
         
         arr[j + 1] = key
         if j + 1 != i:
-            states.append((list(arr), 'swap', j + 1, i))
+            yield 'swap', j + 1, i
 
-def selection_sort_visual(arr, states):
-    """Selection sort with states for visualization."""
+def insertion_sort_visual(arr, states):
+    """Insertion sort with states for visualization."""
+    states.extend(insertion_sort_steps(arr))
+
+def selection_sort_steps(arr):
+    """Selection sort yielding visualization steps."""
     n = len(arr)
     for i in range(n):
         min_idx = i
         for j in range(i + 1, n):
-            states.append((list(arr), 'compare', j, min_idx))
+            yield 'compare', j, min_idx
             if arr[j] < arr[min_idx]:
                 min_idx = j
         
         if min_idx != i:
             arr[i], arr[min_idx] = arr[min_idx], arr[i]
-            states.append((list(arr), 'swap', i, min_idx))
+            yield 'swap', i, min_idx
+
+def selection_sort_visual(arr, states):
+    """Selection sort with states for visualization."""
+    states.extend(selection_sort_steps(arr))
 
-def heapify_visual(arr, n, i, states):
-    """Heapify function for heap sort with visualization states."""
+def heapify_steps(arr, n, i):
+    """Heapify function for heap sort yielding visualization steps."""
     largest = i
     left = 2 * i + 1
     right = 2 * i + 2
 
     if left < n:
-        states.append((list(arr), 'compare', left, largest))
+        yield 'compare', left, largest
         if arr[left] > arr[largest]:
             largest = left
 
     if right < n:
-        states.append((list(arr), 'compare', right, largest))
+        yield 'compare', right, largest
         if arr[right] > arr[largest]:
             largest = right
 
     if largest != i:
         arr[i], arr[largest] = arr[largest], arr[i]
-        states.append((list(arr), 'swap', i, largest))
-        heapify_visual(arr, n, largest, states)
+        yield 'swap', i, largest
+        yield from heapify_steps(arr, n, largest)
 
-def heap_sort_visual(arr, states):
-    """Heap sort with states for visualization."""
+def heap_sort_steps(arr):
+    """Heap sort yielding visualization steps."""
     n = len(arr)
 
     # Build max heap
     for i in range(n // 2 - 1, -1, -1):
-        heapify_visual(arr, n, i, states)
+        yield from heapify_steps(arr, n, i)
 
     # Extract elements from heap one by one
     for i in range(n - 1, 0, -1):
         arr[0], arr[i] = arr[i], arr[0]
-        states.append((list(arr), 'swap', 0, i))
-        heapify_visual(arr, i, 0, states)
+        yield 'swap', 0, i
+        yield from heapify_steps(arr, i, 0)
 
-def partition_visual(arr, low, high, states):
-    """Partition for quicksort, tracking pivot, comparisons, and swaps."""
+def heap_sort_visual(arr, states):
+    """Heap sort with states for visualization."""
+    states.extend(heap_sort_steps(arr))
+
+def partition_steps(arr, low, high):
+    """Partition for quicksort, yielding pivot, comparison and swap steps; returns the pivot index."""
     pivot = arr[high]
-    states.append((list(arr), 'pivot', high, -1))
+    yield 'pivot', high, -1
     i = low - 1
     for j in range(low, high):
-        states.append((list(arr), 'compare', j, high))
+        yield 'compare', j, high
         if arr[j] <= pivot:
             i += 1
             if i != j:
                 arr[i], arr[j] = arr[j], arr[i]
-                states.append((list(arr), 'swap', i, j))
+                yield 'swap', i, j
     if i + 1 != high:
         arr[i + 1], arr[high] = arr[high], arr[i + 1]
-        states.append((list(arr), 'swap', i + 1, high))
+        yield 'swap', i + 1, high
     return i + 1
 
+def quick_sort_steps(arr, low, high):
+    """Recursive quicksort yielding visualization steps."""
+    if low < high:
+        pi = yield from partition_steps(arr, low, high)
+        yield from quick_sort_steps(arr, low, pi - 1)
+        yield from quick_sort_steps(arr, pi + 1, high)
+
 def quick_sort_visual(arr, low, high, states):
     """Recursive quicksort with visualization states."""
-    if low < high:
-        pi = partition_visual(arr, low, high, states)
-        quick_sort_visual(arr, low, pi - 1, states)
-        quick_sort_visual(arr, pi + 1, high, states)
+    states.extend(quick_sort_steps(arr, low, high))
 
-def merge_visual(arr, left, mid, right, states):
-    """Merge function for mergesort with visualization states."""
+def merge_steps(arr, left, mid, right):
+    """Merge function for mergesort yielding visualization steps."""
     left_half = arr[left:mid + 1]
     right_half = arr[mid + 1:right + 1]
     i = j = 0
     k = left
     while i < len(left_half) and j < len(right_half):
-        states.append((list(arr), 'compare', left + i, mid + 1 + j))
+        yield 'compare', left + i, mid + 1 + j
         if left_half[i] <= right_half[j]:
             arr[k] = left_half[i]
-            states.append((list(arr), 'copy', k, left + i))
+            yield 'copy', k, left + i
             i += 1
         else:
             arr[k] = right_half[j]
-            states.append((list(arr), 'copy', k, mid + 1 + j))
+            yield 'copy', k, mid + 1 + j
             j += 1
         k += 1
 
     while i < len(left_half):
         arr[k] = left_half[i]
-        states.append((list(arr), 'copy', k, left + i))
+        yield 'copy', k, left + i
         i += 1
         k += 1
 
     while j < len(right_half):
         arr[k] = right_half[j]
-        states.append((list(arr), 'copy', k, mid + 1 + j))
+        yield 'copy', k, mid + 1 + j
         j += 1
         k += 1
 
-    states.append((list(arr), 'merged', left, right))
+    yield 'merged', left, right
 
-def merge_sort_visual(arr, left, right, states):
-    """Recursive mergesort with visualization states."""
+def merge_sort_steps(arr, left, right):
+    """Recursive mergesort yielding visualization steps."""
     if left < right:
         mid = (left + right) // 2
-        merge_sort_visual(arr, left, mid, states)
-        merge_sort_visual(arr, mid + 1, right, states)
-        merge_visual(arr, left, mid, right, states)
+        yield from merge_sort_steps(arr, left, mid)
+        yield from merge_sort_steps(arr, mid + 1, right)
+        yield from merge_steps(arr, left, mid, right)
 
-def counting_sort_for_radix(arr, exp, states):
-    """Counting sort for a specific digit (used by radix sort)."""
-    n = len(arr)
-    output = [0] * n
-    count = [0] * 10
-
-    for i in range(n):
-        idx = arr[i] // exp
-        digit = idx % 10
-        count[digit] += 1
-        states.append((list(arr), 'digit', i, -1))
-
-    for i in range(1, 10):
-        count[i] += count[i - 1]
-
-    i = n - 1
-    while i >= 0:
-        idx = arr[i] // exp
-        digit = idx % 10
-        output[count[digit] - 1] = arr[i]
-        count[digit] -= 1
-        states.append((list(arr), 'copy', i, count[digit]))
-        i -= 1
-
-    for i in range(n):
-        arr[i] = output[i]
-        states.append((list(arr), 'copy_back', i, -1))
-
-def radix_sort_visual(arr, states):
-    """Radix sort with visualization states."""
-    max_val = max(arr)
-    exp = 1
-    while max_val // exp > 0:
-        counting_sort_for_radix(arr, exp, states)
-        states.append((list(arr), 'pass_complete', -1, -1))
-        exp *= 10
+def merge_sort_visual(arr, left, right, states):
+    """Recursive mergesort with visualization states."""
+    states.extend(merge_sort_steps(arr, left, right))
+
+def radix_sort_visual(arr, states, radix=DEFAULT_RADIX):
+    """Vectorized LSD radix sort with one visualization state per digit pass."""
+    states.extend(radix_sort_steps(arr, radix))
+
+def intro_sort_visual(arr, states):
+    """Introsort (median-of-three pivots, three-way partitions, heapsort fallback) with visualization states."""
+    states.extend(intro_sort_steps(arr))
+
+def tim_sort_visual(arr, states):
+    """Timsort-style natural merge sort (run detection, minrun, galloping) with visualization states."""
+    states.extend(tim_sort_steps(arr))
+
+def bottom_up_merge_sort_visual(arr, states):
+    """Bottom-up ping-pong merge sort with one visualization state per merged block."""
+    states.extend(bottom_up_merge_sort_steps(arr))
+
+def dary_heap_sort_visual(arr, states, arity=DEFAULT_ARITY):
+    """Iterative d-ary heap sort (Floyd's sift-down) with one compare state per heap level."""
+    states.extend(dary_heap_sort_steps(arr, arity))
+
+def sample_sort_visual(arr, states, workers=DEFAULT_WORKERS):
+    """Sample sort with each bar colored by the worker that owns it and the buckets sorted side by side."""
+    states.extend(sample_sort_steps(arr, workers))
+
+def network_sort_visual(arr, states):
+    """Batcher sorting network with one visualization state per vectorized compare-exchange stage."""
+    states.extend(network_sort_steps(arr))
+
+def counting_sort_visual(arr, states):
+    """Counting sort with one visualization state per histogram block and per distinct key placed."""
+    states.extend(counting_sort_steps(arr))
+
+def bucket_sort_visual(arr, states):
+    """Bucket sort with one visualization state per histogram block, the scatter and each bucket sorted."""
+    states.extend(bucket_sort_steps(arr))
+
+# Map algorithm names to their lazy step generators
+algo_steps = {
+    'bubble': bubble_sort_steps,
+    'quick': lambda arr: quick_sort_steps(arr, 0, len(arr) - 1),
+    'merge': lambda arr: merge_sort_steps(arr, 0, len(arr) - 1),
+    'radix': radix_sort_steps,
+    'insertion': insertion_sort_steps,
+    'selection': selection_sort_steps,
+    'heap': heap_sort_steps,
+    'intro': intro_sort_steps,
+    'tim': tim_sort_steps,
+    'bottomup': bottom_up_merge_sort_steps,
+    'dheap': dary_heap_sort_steps,
+    'sample': sample_sort_steps,
+    'network': network_sort_steps,
+    'counting': counting_sort_steps,
+    'bucket': bucket_sort_steps,
+}
+
+def sort_visual(args, arr, states):
+    """Sort arr in place with args.algo, feeding its steps to states (a SortTrace or OperationCounter)."""
+    if args.algo == 'bubble':
+        bubble_sort_visual(arr, states)
+    elif args.algo == 'quick':
+        quick_sort_visual(arr, 0, len(arr) - 1, states)
+    elif args.algo == 'merge':
+        merge_sort_visual(arr, 0, len(arr) - 1, states)
+    elif args.algo == 'radix':
+        radix_sort_visual(arr, states, args.radix)
+    elif args.algo == 'insertion':
+        insertion_sort_visual(arr, states)
+    elif args.algo == 'selection':
+        selection_sort_visual(arr, states)
+    elif args.algo == 'heap':
+        heap_sort_visual(arr, states)
+    elif args.algo == 'intro':
+        intro_sort_visual(arr, states)
+    elif args.algo == 'tim':
+        tim_sort_visual(arr, states)
+    elif args.algo == 'bottomup':
+        bottom_up_merge_sort_visual(arr, states)
+    elif args.algo == 'dheap':
+        dary_heap_sort_visual(arr, states, args.arity)
+    elif args.algo == 'sample':
+        sample_sort_visual(arr, states, args.workers)
+    elif args.algo == 'network':
+        network_sort_visual(arr, states)
+    elif args.algo == 'counting':
+        counting_sort_visual(arr, states)
+    elif args.algo == 'bucket':
+        bucket_sort_visual(arr, states)
 
 def get_user_input():
     print("\nSorting Algorithm Visualizer")
@@ -213,9 +295,17 @@ def get_user_input():
     print("5. Insertion Sort")
     print("6. Selection Sort")
     print("7. Heap Sort")
+    print("8. Intro Sort")
+    print("9. Tim Sort")
+    print("10. Bottom-up Merge Sort")
+    print("11. D-ary Heap Sort")
+    print("12. Parallel Sample Sort")
+    print("13. Sorting Network (Batcher)")
+    print("14. Counting Sort")
+    print("15. Bucket Sort")
     while True:
-        algo_choice = input("Enter (1-7): ").strip()
-        if algo_choice in ['1', '2', '3', '4', '5', '6', '7']:
+        algo_choice = input("Enter (1-15): ").strip()
+        if algo_choice in ['1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12', '13', '14', '15']:
             algo_map = {
                 '1': 'bubble',
                 '2': 'quick',
@@ -223,13 +313,55 @@ def get_user_input():
                 '4': 'radix',
                 '5': 'insertion',
                 '6': 'selection',
-                '7': 'heap'
+                '7': 'heap',
+                '8': 'intro',
+                '9': 'tim',
+                '10': 'bottomup',
+                '11': 'dheap',
+                '12': 'sample',
+                '13': 'network',
+                '14': 'counting',
+                '15': 'bucket'
             }
             algo = algo_map[algo_choice]
             break
-        print("Invalid choice! Please enter a number between 1 and 7.")
+        print("Invalid choice! Please enter a number between 1 and 15.")
+
+    radix = DEFAULT_RADIX
+    if algo == 'radix':
+        while True:
+            try:
+                radix = int(input(f"\nEnter radix, e.g. 256 or 65536 (default {DEFAULT_RADIX}): ") or str(DEFAULT_RADIX))
+                if radix >= 2:
+                    break
+                print("Invalid radix! It must be at least 2.")
+            except ValueError:
+                print("Please enter a valid number!")
+
+    arity = DEFAULT_ARITY
+    if algo == 'dheap':
+        while True:
+            try:
+                arity = int(input(f"\nEnter heap arity, 2, 4 or 8 (default {DEFAULT_ARITY}): ") or str(DEFAULT_ARITY))
+                if arity in ARITIES:
+                    break
+                print("Invalid arity! It must be 2, 4 or 8.")
+            except ValueError:
+                print("Please enter a valid number!")
+
+    workers = DEFAULT_WORKERS
+    if algo == 'sample':
+        while True:
+            try:
+                workers = int(input(f"\nEnter number of workers, 1-{MAX_WORKERS} (default {DEFAULT_WORKERS}): ") or str(DEFAULT_WORKERS))
+                if 1 <= workers <= MAX_WORKERS:
+                    break
+                print(f"Invalid number of workers! It must be between 1 and {MAX_WORKERS}.")
+            except ValueError:
+                print("Please enter a valid number!")
 
     # Get other parameters based on mode
+    file = 'numbers.txt'
     if mode == 'random':
         while True:
             try:
@@ -242,7 +374,7 @@ def get_user_input():
             except ValueError:
                 print("Please enter valid numbers!")
     else:
-        file = input("\nEnter input file name (default 'numbers.txt'): ") or "numbers.txt"
+        file = input("\nEnter input file name (.npy, raw .i32/.i64, or text; default 'numbers.txt'): ") or "numbers.txt"
         n = 10  # default value for file mode
         min_val = 0  # default value for file mode
         max_val = 100  # default value for file mode
@@ -254,6 +386,15 @@ def get_user_input():
         print("Invalid interval! Using default value of 50ms.")
         interval = 50
 
+    stream = input("Stream frames lazily instead of precomputing them? (y/N): ").strip().lower() == 'y'
+
+    frames = input("Maximum number of animation frames (default: all): ").strip()
+    try:
+        frames = int(frames) if frames else None
+    except ValueError:
+        print("Invalid frame budget! Animating every step.")
+        frames = None
+
     # Create a namespace object to store arguments
     class Args:
         pass
@@ -261,11 +402,16 @@ def get_user_input():
     args = Args()
     args.mode = mode
     args.algo = algo
+    args.radix = radix
+    args.arity = arity
+    args.workers = workers
     args.n = n
     args.min_val = min_val
     args.max_val = max_val
-    args.file = 'numbers.txt'
+    args.file = file
     args.interval = interval
+    args.stream = stream
+    args.frames = frames
     
     return args
 
@@ -275,85 +421,93 @@ def main():
 
     # Get numbers based on mode
     if args.mode == 'random':
-        numbers = generate_numbers(args.n, args.min_val, args.max_val, args.file)
+        numbers = generate_numbers(args.n, args.min_val, args.max_val, args.file).tolist()
     else:
         try:
-            with open(args.file, 'r') as f:
-                numbers = [int(line.strip()) for line in f]
+            numbers = read_numbers(args.file)
             print(f"Read {len(numbers)} numbers from {args.file}")
+            numbers = numbers.tolist()
         except (FileNotFoundError, ValueError) as e:
             print(f"Error reading file: {e}")
             return
 
-    # Prepare for visualization
+    # Prepare for visualization; the GUI backend is only loaded once there is something to show
+    import matplotlib.pyplot as plt
+    import matplotlib.animation as animation
+    from sort_render import BarRenderer
+
     fig, ax = plt.subplots(figsize=(12, 6))
-    bars = ax.bar(range(len(numbers)), numbers, color='lightblue')
+    renderer = BarRenderer(ax, numbers)
     ax.set_title(f'{args.algo.capitalize()} Sort Visualization')
     ax.set_xlabel('Index')
     ax.set_ylabel('Value')
 
     # Create a copy of numbers for sorting
     arr = numbers.copy()
-    states = []
+
+    if args.stream:
+        # Pull frames from the step generator only as the animation needs them
+        frame_count = estimate_steps(args.algo, arr, args.radix, args.arity) + 10
+        if args.algo == 'radix':
+            steps = radix_sort_steps(arr, args.radix)
+        elif args.algo == 'dheap':
+            steps = dary_heap_sort_steps(arr, args.arity)
+        elif args.algo == 'sample':
+            steps = sample_sort_steps(arr, args.workers)
+        else:
+            steps = algo_steps[args.algo](arr)
+        # Engines check their input before the first step, so an unsortable input fails here
+        try:
+            first = next(steps, None)
+        except (TypeError, ValueError) as e:
+            print(f"Error: {e}")
+            return
+        frames = stream_frames(arr, itertools.chain([first] if first else [], steps), tail=10)
+        print(f"{args.algo.capitalize()} steps: ~{frame_count} (streamed)")
+        stride = 1
+        if args.frames and frame_count > args.frames:
+            stride = math.ceil(frame_count / args.frames)
+            frames = sample_stream(frames, stride)
+            frame_count = math.ceil(frame_count / stride)
+        ani = animation.FuncAnimation(fig, lambda frame: renderer.update(*frame, resync=stride > 1), frames=frames,
+                                    init_func=renderer.init, save_count=frame_count, cache_frame_data=False,
+                                    interval=args.interval, repeat=False, blit=True)
+        print(f"\nAnimation duration: ~{frame_count * args.interval/1000:.1f}s")
+        plt.show()
+        return
+
+    states = SortTrace(arr)
+    counter = TracingCounter(states)
 
     # Sort and time the algorithm
     start_time = time.time()
-    if args.algo == 'bubble':
-        bubble_sort_visual(arr, states)
-    elif args.algo == 'quick':
-        quick_sort_visual(arr, 0, len(arr) - 1, states)
-    elif args.algo == 'merge':
-        merge_sort_visual(arr, 0, len(arr) - 1, states)
-    elif args.algo == 'radix':
-        radix_sort_visual(arr, states)
-    elif args.algo == 'insertion':
-        insertion_sort_visual(arr, states)
-    elif args.algo == 'selection':
-        selection_sort_visual(arr, states)
-    elif args.algo == 'heap':
-        heap_sort_visual(arr, states)
-
+    try:
+        sort_visual(args, arr, counter)
+    except (TypeError, ValueError) as e:
+        print(f"Error: {e}")
+        return
     time_taken = time.time() - start_time
     print(f"{args.algo.capitalize()} steps: {len(states)}, Time: {time_taken*1000:.2f}ms")
+    print(f"Operations: {format_counters(counter)}")
 
     if len(states) > 0:
-        final_state = states[-1]
-        final_state_extended = (final_state[0], 'complete', -1, -1)
-        states.extend([final_state_extended] * (10))  # Add some frames with the completed state
+        for _ in range(10):  # Add some frames with the completed state
+            states.record('complete')
+
+    steps = sample_frames(states, args.frames)
 
     def update(frame):
-        if frame < len(states):
-            state, action, idx1, idx2 = states[frame]
-            colors = ['lightblue'] * len(state)
-            if action in ['compare', 'digit']:
-                if idx1 != -1:
-                    colors[idx1] = 'yellow'
-                if idx2 != -1 and idx2 < len(colors):
-                    colors[idx2] = 'orange'
-            elif action in ['swap', 'copy', 'copy_back']:
-                if idx1 != -1:
-                    colors[idx1] = 'red'
-                if idx2 != -1 and idx2 < len(colors):
-                    colors[idx2] = 'pink'
-            elif action == 'pivot':
-                if idx1 != -1:
-                    colors[idx1] = 'green'
-            elif action == 'merged':
-                if idx1 != -1 and idx2 != -1:
-                    for k in range(max(0, idx1), min(len(colors), idx2 + 1)):
-                        colors[k] = 'lightgreen'
-            elif action in ['pass_complete', 'complete']:
-                colors = ['lightgreen'] * len(state)
-            
-            for rect, val, color in zip(bars, state, colors):
-                rect.set_height(val)
-                rect.set_color(color)
+        if frame < len(steps):
+            step = steps[frame]
+            previous = steps[frame - 1] if frame else -1
+            return renderer.update(*states[step], resync=step != previous + 1)
+        return []
 
     # Create animation
-    ani = animation.FuncAnimation(fig, update, frames=len(states),
-                                interval=args.interval, repeat=False, blit=False)
+    ani = animation.FuncAnimation(fig, update, frames=len(steps), init_func=renderer.init,
+                                interval=args.interval, repeat=False, blit=True)
     
-    print(f"\nAnimation duration: ~{len(states) * args.interval/1000:.1f}s")
+    print(f"\nAnimation duration: ~{len(steps) * args.interval/1000:.1f}s")
     plt.show()
 
 if __name__ == "__main__":
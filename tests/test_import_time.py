@@ -0,0 +1,66 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parent.parent
+IMPORT_BUDGET = 0.75  # seconds; networkx and numpy take most of it, matplotlib alone would take more
+
+FRONT_ENDS = [
+    'main',
+    'bellman_ford',
+    'binary_search',
+    'dijkstra',
+    'dijkstra_enhanced',
+    'floyd_warshall',
+    'graph_traversal',
+    'graph_traversal_enhanced',
+    'knapsack_01',
+    'kruskal_mst',
+    'prim_mst',
+    'sorting',
+    'sorting_interactive',
+]
+
+TK_FRONT_ENDS = ['dijkstra_enhanced', 'graph_traversal_enhanced']
+
+NO_TK_PROBE = """
+import sys
+sys.modules['tkinter'] = None
+sys.modules['_tkinter'] = None
+import {module}
+"""
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds, 'loaded': [m for m in ('matplotlib', 'matplotlib.pyplot') if m in sys.modules]}}))
+"""
+
+
+def import_in_subprocess(module):
+    """Import module in a fresh headless interpreter; returns the seconds taken and the matplotlib modules loaded."""
+    env = {k: v for k, v in os.environ.items() if k not in ('DISPLAY', 'MPLBACKEND')}
+    result = subprocess.run([sys.executable, '-c', PROBE.format(module=module)], cwd=REPO, env=env,
+                            capture_output=True, text=True, check=True)
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    return report['seconds'], report['loaded']
+
+
+@pytest.mark.parametrize('module', FRONT_ENDS)
+def test_front_end_imports_without_matplotlib(module):
+    seconds, loaded = import_in_subprocess(module)
+    assert loaded == [], f"importing {module} loaded {', '.join(loaded)}"
+    assert seconds < IMPORT_BUDGET, f"importing {module} took {seconds:.2f}s, budget {IMPORT_BUDGET}s"
+
+
+@pytest.mark.parametrize('module', TK_FRONT_ENDS)
+def test_front_end_imports_without_tkinter(module):
+    result = subprocess.run([sys.executable, '-c', NO_TK_PROBE.format(module=module)], cwd=REPO,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, f"importing {module} needs tkinter:\n{result.stderr}"